@@ -1,10 +1,20 @@
+import json
+import math
 import os
 import time
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, Response, render_template, request, jsonify, abort, stream_with_context
 from flask_cors import CORS
-from socialgolfer import find_max_weeks, set_stop_flag, get_progress
+from socialgolfer import find_max_weeks, get_progress_and_stats, get_search_stats, DEFAULT_MEMO_BUDGET_MB, LOCAL_SEARCH
 from latin_square import latin_square_solver
-from sudoku import SudokuGenerator, SudokuSolver
+from sudoku import SudokuGenerator, SudokuSolver, canonical_form, apply_transform, invert_transform, grid_from_line, grid_to_line
+from sudoku import BFS_DEGRADE_MODES, BFS_FRONTIER_BUDGET_MB
+from sudoku_batch import solve_batch, validate_batch, HAVE_NUMPY
+from puzzle_pool import PuzzlePool
+from seed_bank import SeedBank, DEFAULT_BANK_PATH
+from executor import SolverExecutor, JobCancelled, JobFailed, JobTimeout
+from jobs import JobRegistry, RUNNING, DONE, STOPPED, TIMED_OUT, FAILED
+from result_cache import ResultCache, MISS
+from instrument import Metrics, SearchStats, profiled
 
 # ----------------------------------------------------------------------
 # Flask Configuration
@@ -19,8 +29,157 @@ app = Flask(
 )
 CORS(app)
 
-stop_flag = False
-current_progress = []
+# Solver calls run in worker processes; a timeout kills the process.
+SOLVER_TIMEOUT_SEC = float(os.environ.get("SOLVER_TIMEOUT_SEC", 600))
+executor = SolverExecutor(max_workers=int(os.environ.get("SOLVER_WORKERS", 0)) or None)
+golfer_jobs = JobRegistry()
+SSE_KEEPALIVE_SEC = 15.0
+GOLFER_MEMO_MB = float(os.environ.get("GOLFER_MEMO_MB", DEFAULT_MEMO_BUDGET_MB))
+# Requests may lower the transposition-table budget but never raise it past this.
+GOLFER_MEMO_MB_MAX = float(os.environ.get("GOLFER_MEMO_MB_MAX", 256))
+
+# Finished results keyed by their inputs; RESULT_CACHE_PATH adds a SQLite copy.
+result_cache = ResultCache(
+    max_entries=int(os.environ.get("RESULT_CACHE_SIZE", 1024)),
+    ttl_sec=float(os.environ.get("RESULT_CACHE_TTL_SEC", 24 * 3600)) or None,
+    path=os.environ.get("RESULT_CACHE_PATH") or None,
+)
+
+# Latency and node counters for /metrics; SOLVER_PROFILE=1 profiles every solve.
+metrics = Metrics()
+PROFILE_DEFAULT = os.environ.get("SOLVER_PROFILE", "0") in {"1", "true", "True"}
+
+
+def _timeout_from(data, default_sec):
+    timeout_ms = data.get("timeout_ms")
+    return (timeout_ms / 1000.0) if timeout_ms and timeout_ms > 0 else default_sec
+
+
+def _number(data, key, cast, default=None, required=False):
+    """data[key] converted by `cast` (int or float), or `default` when absent.
+
+    Raises ValueError naming the field for anything that is not a finite number.
+    """
+    value = data.get(key)
+    if value is None or value == "":
+        if required:
+            raise ValueError(f"Missing '{key}'")
+        return default
+    kind = "an integer" if cast is int else "a number"
+    if isinstance(value, bool):
+        raise ValueError(f"'{key}' must be {kind}")
+    try:
+        number = cast(value)
+    except (TypeError, ValueError, OverflowError):
+        raise ValueError(f"'{key}' must be {kind}") from None
+    if not math.isfinite(number):
+        raise ValueError(f"'{key}' must be {kind}")
+    return number
+
+
+@app.errorhandler(JobFailed)
+def solver_failed(e):
+    return jsonify({"success": False, "status": "error", "message": str(e)}), 500
+
+
+def _metric_label(algorithm, known):
+    """Client-supplied names become metric labels only if known, so /metrics stays bounded."""
+    return algorithm if algorithm in known else "other"
+
+
+def _profile_requested(data):
+    return bool(data.get("profile", PROFILE_DEFAULT))
+
+
+def _run_solver(fn, *args, profile=False, **kwargs):
+    """executor.run, optionally under the sampling profiler; returns (result, profile or None)."""
+    if profile:
+        return executor.run(profiled, fn, *args, **kwargs)
+    return executor.run(fn, *args, **kwargs), None
+
+
+@app.get("/cache")
+def cache_stats():
+    return jsonify(result_cache.stats())
+
+
+@app.get("/metrics")
+def metrics_endpoint():
+    """Prometheus text format: solver latency histograms, node counters, executor and cache gauges."""
+    cache = result_cache.stats()
+    extra = {
+        "solver_executor_workers": [({"state": k}, v) for k, v in executor.stats().items()],
+        "result_cache_entries": [({}, cache["entries"])],
+        "result_cache_events": [({"namespace": ns, "event": event}, count)
+                                for ns, counters in sorted(cache["namespaces"].items())
+                                for event, count in sorted(counters.items())],
+    }
+    return Response(metrics.render(extra), mimetype="text/plain; version=0.0.4")
+
+
+# ----------------------------------------------------------------------
+# Batch helpers (NDJSON in and out)
+# ----------------------------------------------------------------------
+NDJSON_TYPES = {"application/x-ndjson", "application/jsonlines", "application/x-jsonlines"}
+
+
+def _batch_request(list_key):
+    """(options, boards) for a batch request.
+
+    An NDJSON body is read line by line (options come from the query string);
+    a JSON body carries the boards under `list_key` next to the options.
+    Lines that are not valid JSON are passed on as-is and fail per item.
+    """
+    options = request.args.to_dict()
+    if request.mimetype in NDJSON_TYPES:
+        def boards():
+            for raw in request.stream:
+                line = raw.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    yield line.decode("utf-8", "replace")
+        return options, boards()
+    data = request.get_json(force=True) or {}
+    options.update({k: v for k, v in data.items() if k != list_key})
+    return options, iter(data.get(list_key) or [])
+
+
+def _stream_batch(fn, arg_tuples, timeout_sec, endpoint, algorithm):
+    """NDJSON response: one line per finished item, then a summary line."""
+    def lines():
+        start = time.perf_counter()
+        count = errors = 0
+        timed_out = False
+        try:
+            for index, status, value in executor.imap_unordered(fn, arg_tuples, timeout=timeout_sec):
+                count += 1
+                if status != "ok":
+                    value = {"status": "error", "message": value}
+                if value.get("status") != "ok":
+                    errors += 1
+                if "duration_ms" in value:
+                    metrics.observe(endpoint, algorithm, value["duration_ms"] / 1000.0, value.get("nodes"))
+                yield json.dumps({"index": index, **value}) + "\n"
+        except JobTimeout:
+            timed_out = True
+        yield json.dumps({
+            "done": True,
+            "count": count,
+            "errors": errors,
+            "timed_out": timed_out,
+            "elapsed_ms": round((time.perf_counter() - start) * 1000.0, 3),
+        }) + "\n"
+
+    return Response(stream_with_context(lines()), mimetype="application/x-ndjson",
+                    headers={"X-Accel-Buffering": "no"})
+
+
+def _batch_timeout(options):
+    timeout_ms = float(options.get("timeout_ms") or 0)
+    return timeout_ms / 1000.0 if timeout_ms > 0 else SOLVER_TIMEOUT_SEC
 
 # ----------------------------------------------------------------------
 # HOME PAGE
@@ -33,6 +192,9 @@ def home():
 # ----------------------------------------------------------------------
 # SOCIAL GOLFERS PROBLEM
 # ----------------------------------------------------------------------
+GOLFER_ALGORITHMS = ("Depth-First Search (DFS)", "Depth-Limited Search (DLS)", LOCAL_SEARCH)
+
+
 @app.route("/golfers")
 def golfers_page():
     return render_template("golfers.html")
@@ -40,41 +202,135 @@ def golfers_page():
 
 @app.route("/solve", methods=["POST"])
 def solve():
-    global stop_flag, current_progress
-    stop_flag = False
-    current_progress = []
-
-    data = request.get_json()
-    num_players = data.get("num_players")
-    group_size = data.get("group_size")
-    algorithm = data.get("algorithm")
-    depth_limit = data.get("depth_limit")
-
-    start_time = time.time()
-    schedule, weeks = find_max_weeks(num_players, group_size, algorithm, depth_limit)
-    elapsed = round(time.time() - start_time, 3)
-
+    data = request.get_json() or {}
+    algorithm = data.get("algorithm") or GOLFER_ALGORITHMS[0]
+    if algorithm not in GOLFER_ALGORITHMS:
+        return jsonify({"success": False, "message": f"Unsupported algorithm: choose one of {list(GOLFER_ALGORITHMS)}"}), 400
+    try:
+        params = {
+            "num_players": _number(data, "num_players", int, required=True),
+            "group_size": _number(data, "group_size", int, required=True),
+            "algorithm": algorithm,
+            "depth_limit": _number(data, "depth_limit", int),
+            "symmetry_breaking": bool(data.get("symmetry_breaking", False)),
+            "memo_budget_mb": max(0.0, min(_number(data, "memo_mb", float) or GOLFER_MEMO_MB, GOLFER_MEMO_MB_MAX)),
+            # An upper bound: the portfolio only gets as many processes as the executor has free slots.
+            "workers": max(1, min(_number(data, "workers", int) or 1, executor.max_workers)),
+            "seed": _number(data, "seed", int),
+            "time_limit": _number(data, "time_limit", float) or None,
+            "timeout": _timeout_from({"timeout_ms": _number(data, "timeout_ms", float)}, SOLVER_TIMEOUT_SEC),
+            "profile": _profile_requested(data),
+        }
+    except ValueError as e:
+        return jsonify({"success": False, "message": str(e)}), 400
+    job = golfer_jobs.submit(params, _run_golfer_job)
+    return jsonify({"success": True, "job_id": job.id}), 202
+
+
+def run_golfer_search(*args, **kwargs):
+    schedule, weeks = find_max_weeks(*args, **kwargs)
+    return schedule, weeks, get_search_stats()
+
+
+def _golfer_cache_key(p):
+    """None for runs that are not reproducible (local search without a seed)."""
+    if p["algorithm"] == LOCAL_SEARCH and p["seed"] is None:
+        return None
+    keys = ("num_players", "group_size", "algorithm", "depth_limit", "symmetry_breaking", "seed", "time_limit")
+    return json.dumps([p[k] for k in keys])
+
+
+def _run_golfer_job(job):
+    p = job.params
+    cache_key = _golfer_cache_key(p)
+    cached = result_cache.get("golfer", cache_key) if cache_key is not None else MISS
+    if cached is not MISS:
+        job.finish(DONE, cached["schedule"], stats={**cached["stats"], "cache": "hit"})
+        return
+    miss = {"cache": "miss"}
+    if job.stop_requested:
+        job.finish(STOPPED, stats=miss)
+        return
+    start = time.perf_counter()
+    try:
+        (schedule, _, stats), profile = _run_solver(
+            run_golfer_search, p["num_players"], p["group_size"], p["algorithm"], p["depth_limit"],
+            symmetry_breaking=p["symmetry_breaking"], memo_budget_mb=p["memo_budget_mb"],
+            slots=p["workers"], slots_arg="workers", seed=p["seed"], time_limit=p["time_limit"],
+            timeout=p["timeout"], tag=job.id, profile=p["profile"],
+            progress_fn=get_progress_and_stats, on_progress=lambda update: job.set_progress(*update),
+        )
+        metrics.observe("golfers", _metric_label(p["algorithm"], GOLFER_ALGORITHMS),
+                        time.perf_counter() - start, stats.get("nodes"))
+        if cache_key is not None:
+            result_cache.put("golfer", cache_key, {"schedule": schedule, "stats": stats})
+        if profile is not None:
+            stats = {**stats, "profile": profile}
+        job.finish(DONE, schedule, stats={**stats, **miss})
+    except JobTimeout:
+        job.finish(TIMED_OUT, stats=miss)
+    except JobCancelled:
+        job.finish(STOPPED, stats=miss)
+    except JobFailed as e:
+        job.finish(FAILED, error=str(e), stats=miss)
+
+
+def _golfer_job_or_404(job_id):
+    job = golfer_jobs.get(job_id)
+    if job is None:
+        abort(404, description=f"Unknown job '{job_id}'")
+    return job
+
+
+@app.route("/stop/<job_id>", methods=["POST"])
+def stop(job_id):
+    job = _golfer_job_or_404(job_id)
+    if job.status == RUNNING:
+        job.stop_requested = True
+        executor.cancel(job.id)
+    return jsonify({"job_id": job.id, "stopped": True})
+
+
+@app.route("/progress/<job_id>", methods=["GET"])
+def progress(job_id):
+    snap = _golfer_job_or_404(job_id).snapshot()
     return jsonify({
-        "success": True,
-        "elapsed_time": elapsed,
-        "weeks": weeks,
-        "schedule": schedule
+        "job_id": snap["job_id"],
+        "status": snap["status"],
+        "weeks": snap["weeks"],
+        "schedule": snap["schedule"]
     })
 
 
-@app.route("/stop", methods=["POST"])
-def stop():
-    set_stop_flag(True)
-    return jsonify({"stopped": True})
+@app.route("/progress/<job_id>/stream", methods=["GET"])
+def progress_stream(job_id):
+    """Server-Sent Events: a 'progress' event per change, then one 'done' event."""
+    job = _golfer_job_or_404(job_id)
 
+    def events():
+        version = -1
+        while True:
+            new_version = job.wait_for_update(version, timeout=SSE_KEEPALIVE_SEC)
+            if new_version == version:
+                yield ": keepalive\n\n"
+                continue
+            version = new_version
+            snap = job.snapshot()
+            event = "progress" if snap["status"] == RUNNING else "done"
+            yield f"event: {event}\ndata: {json.dumps(snap)}\n\n"
+            if event == "done":
+                return
+
+    return Response(events(), mimetype="text/event-stream",
+                    headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
 
-@app.route("/progress", methods=["GET"])
-def progress():
-    schedule = get_progress()
-    return jsonify({
-        "weeks": len(schedule),
-        "schedule": schedule
-    })
+
+@app.route("/result/<job_id>", methods=["GET"])
+def result(job_id):
+    snap = _golfer_job_or_404(job_id).snapshot()
+    snap["success"] = snap["status"] != FAILED
+    snap["finished"] = snap["status"] != RUNNING
+    return jsonify(snap)
 
 
 # ----------------------------------------------------------------------
@@ -85,6 +341,15 @@ def latin_square_page():
     return render_template("latin_square.html")
 
 
+LATIN_ALGORITHMS = ("Backtracking", "IDDFS", "DLX")
+
+
+def run_latin_solver(board, algorithm, depth_limit, max_time_sec=None):
+    stats = SearchStats()
+    solution = latin_square_solver(board, algorithm, depth_limit, stats, max_time_sec)
+    return solution, stats.as_dict()
+
+
 @app.route("/solve_latin", methods=["POST"])
 def solve_latin():
     data = request.get_json()
@@ -95,22 +360,121 @@ def solve_latin():
         depth_limit = int(depth_limit)
 
     start = time.time()
-    solution = latin_square_solver(board, algorithm, depth_limit)
+    cache_key = json.dumps([algorithm, depth_limit, board])
+    solution = result_cache.get("latin", cache_key)
+    cache = "hit" if solution is not MISS else "miss"
+    stats, profile = SearchStats().as_dict(), None
+    if solution is MISS:
+        try:
+            (solution, stats), profile = _run_solver(run_latin_solver, board, algorithm, depth_limit,
+                                                     timeout=_timeout_from(data, SOLVER_TIMEOUT_SEC),
+                                                     profile=_profile_requested(data))
+        except JobTimeout:
+            metrics.observe("solve_latin", _metric_label(algorithm, LATIN_ALGORITHMS), time.time() - start)
+            return jsonify({
+                "success": False,
+                "message": "Solver timed out. Try a smaller board or another algorithm",
+                "elapsed_time": round(time.time() - start, 4),
+                "cache": cache
+            })
+        result_cache.put("latin", cache_key, solution)
     elapsed = round(time.time() - start, 4)
+    metrics.observe("solve_latin", _metric_label(algorithm, LATIN_ALGORITHMS), elapsed, stats["nodes"])
 
+    payload = {"elapsed_time": elapsed, "cache": cache, "stats": stats}
+    if profile is not None:
+        payload["profile"] = profile
     if solution:
-        return jsonify({"success": True, "solution": solution, "elapsed_time": elapsed})
+        payload.update({"success": True, "solution": solution})
     else:
-        return jsonify({
+        payload.update({
             "success": False,
             "message": "No solution found within the current depth limit. Increase the limit and try again",
-            "elapsed_time": elapsed
         })
+    return jsonify(payload)
+
+
+def solve_latin_item(board, algorithm, depth_limit, max_time_sec=None):
+    start = time.perf_counter()
+    solution, stats = run_latin_solver(board, algorithm, depth_limit, max_time_sec)
+    item = {"status": "ok" if solution else "error", "solution": solution,
+            "duration_ms": round((time.perf_counter() - start) * 1000.0, 3), **stats}
+    if stats["prunes"].get("time_limit"):
+        item["message"] = "Timed out"
+    elif not solution:
+        item["message"] = "No solution found within the current depth limit"
+    return item
+
+
+@app.route("/solve_latin/batch", methods=["POST"])
+def solve_latin_batch():
+    """Solve many boards in parallel; streams NDJSON lines {index, status, solution, duration_ms, ...stats}.
+
+    item_timeout_ms limits each board; timeout_ms (default SOLVER_TIMEOUT_SEC) stops the whole batch.
+    """
+    options, boards = _batch_request("boards")
+    algorithm = options.get("algorithm", "Backtracking")
+    if algorithm not in LATIN_ALGORITHMS:
+        return jsonify({"success": False, "message": f"Unsupported algorithm: choose one of {list(LATIN_ALGORITHMS)}"}), 400
+    depth_limit = int(options["depth_limit"]) if options.get("depth_limit") else None
+    item_timeout_ms = float(options.get("item_timeout_ms") or 30000)
+    items = ((board, algorithm, depth_limit, item_timeout_ms / 1000.0) for board in boards)
+    return _stream_batch(solve_latin_item, items, _batch_timeout(options), "solve_latin/batch", algorithm)
 
 
 # ----------------------------------------------------------------------
 # SUDOKU
 # ----------------------------------------------------------------------
+puzzle_pool = PuzzlePool(
+    size=int(os.environ.get("SUDOKU_POOL_SIZE", 20)),
+    workers=int(os.environ.get("SUDOKU_POOL_WORKERS", 1)),
+)
+
+# Read on the first ?source=bank request, so startup does not touch the file.
+seed_bank = SeedBank(path=os.environ.get("SUDOKU_BANK_PATH") or DEFAULT_BANK_PATH)
+
+SUDOKU_ALGORITHMS = {
+    "bfs": "solve_bfs_backtracking",
+    "propagation": "solve_propagation",
+    "dlx": "solve_dlx",
+}
+SUDOKU_KILL_GRACE_SEC = 1.0
+SUDOKU_BFS_FRONTIER_MB = float(os.environ.get("SUDOKU_BFS_FRONTIER_MB", BFS_FRONTIER_BUDGET_MB))
+
+
+def _is_sudoku_grid(puzzle):
+    return (isinstance(puzzle, list) and len(puzzle) == 9
+            and all(isinstance(row, list) and len(row) == 9 for row in puzzle)
+            and all(isinstance(v, int) and 0 <= v <= 9 for row in puzzle for v in row))
+
+
+def run_sudoku_solver(puzzle, algorithm, max_time_sec=None, max_nodes=None, **options):
+    """`options` (frontier_budget_mb, degrade) only apply to BFS."""
+    solver = SudokuSolver(puzzle)
+    if algorithm != "bfs":
+        options = {}
+    return getattr(solver, SUDOKU_ALGORITHMS[algorithm])(max_time_sec=max_time_sec, max_nodes=max_nodes, **options)
+
+
+def _bfs_options(data):
+    degrade = data.get("degrade") or "best-first"
+    if degrade not in BFS_DEGRADE_MODES:
+        raise ValueError(f"'degrade' must be one of {list(BFS_DEGRADE_MODES)}")
+    return {"frontier_budget_mb": float(data.get("frontier_mb") or SUDOKU_BFS_FRONTIER_MB), "degrade": degrade}
+
+
+def solve_sudoku_item(puzzle, algorithm, max_time_sec, max_nodes, options):
+    if isinstance(puzzle, str):
+        puzzle = grid_from_line(puzzle)
+    if not _is_sudoku_grid(puzzle):
+        raise ValueError("'puzzle' must be a 9x9 grid of digits 0-9")
+    ok, solution, stats = run_sudoku_solver(puzzle, algorithm, max_time_sec, max_nodes, **options)
+    item = {"status": "ok" if ok and solution else "error", "solution": solution, **stats}
+    if item["status"] != "ok":
+        item["message"] = "Timeout or no solution found"
+    return item
+
+
 @app.route("/sudoku")
 def sudoku_page():
     return render_template("sudoku.html")
@@ -123,13 +487,34 @@ def sudoku_generate():
         level = "easy"
 
     ensure_unique = request.args.get("unique", "0") in {"1", "true", "True"}
+    incremental = request.args.get("incremental", "1") in {"1", "true", "True"}
     timeout_ms = request.args.get("timeout_ms", type=int, default=30000)
     timeout_sec = (timeout_ms / 1000.0) if timeout_ms and timeout_ms > 0 else None
+    source = request.args.get("source", "pool")
+
+    if source == "bank":
+        # Derived from a verified-unique bank entry, so always unique.
+        puzzle, from_pool, ensure_unique = seed_bank.derive(level), False, True
+    elif incremental:
+        puzzle, from_pool = puzzle_pool.get(level, ensure_unique, timeout_sec=timeout_sec)
+    else:
+        gen = SudokuGenerator()
+        puzzle = gen.generate_sudoku(level, ensure_unique=ensure_unique, timeout_sec=timeout_sec,
+                                     incremental=False)
+        from_pool = False
+
+    return jsonify({"status": "ok", "level": level, "unique": ensure_unique, "puzzle": puzzle,
+                    "from_pool": from_pool, "source": source if source == "bank" else "generator"})
 
-    gen = SudokuGenerator()
-    puzzle = gen.generate_sudoku(level, ensure_unique=ensure_unique, max_checks=50, timeout_sec=timeout_sec)
 
-    return jsonify({"status": "ok", "level": level, "unique": ensure_unique, "puzzle": puzzle})
+@app.get("/generate/pool")
+def sudoku_pool_stats():
+    return jsonify(puzzle_pool.stats())
+
+
+@app.get("/generate/bank")
+def sudoku_bank_stats():
+    return jsonify(seed_bank.stats())
 
 
 @app.post("/solve_sudoku")
@@ -138,18 +523,68 @@ def sudoku_solve():
     puzzle = data.get("puzzle")
     if not puzzle:
         return jsonify({"status": "error", "message": "Missing 'puzzle'."}), 400
+    if not _is_sudoku_grid(puzzle):
+        return jsonify({"status": "error", "message": "'puzzle' must be a 9x9 grid of digits 0-9."}), 400
 
+    algorithm = (data.get("algorithm") or "bfs").lower()
+    if algorithm not in SUDOKU_ALGORITHMS:
+        return jsonify({
+            "status": "error",
+            "message": f"Unsupported algorithm: choose one of {sorted(SUDOKU_ALGORITHMS)}."
+        }), 400
+
+    try:
+        options = _bfs_options(data)
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
     timeout_ms = data.get("timeout_ms", 30000)
     max_nodes = data.get("max_nodes", 2_000_000)
     timeout_sec = (timeout_ms / 1000.0) if timeout_ms and timeout_ms > 0 else None
 
-    solver = SudokuSolver(puzzle)
-    ok, solution, stats = solver.solve_bfs_backtracking(max_time_sec=timeout_sec, max_nodes=max_nodes)
+    # Equivalent puzzles (relabelled digits, permuted rows/columns/bands/stacks)
+    # share one entry per algorithm, stored in the canonical frame.
+    start = time.perf_counter()
+    canonical, transform = canonical_form(puzzle)
+    cache_key = json.dumps([algorithm, grid_to_line(canonical)])
+    cached = result_cache.get("sudoku", cache_key)
+    if cached is not MISS:
+        ok = cached["ok"]
+        solution = invert_transform(cached["solution"], transform) if ok else None
+        stats = {"duration_ms": round((time.perf_counter() - start) * 1000.0, 3), "node_count": 0,
+                 "timed_out": False, **SearchStats().as_dict()}
+        profile = None
+    else:
+        # The solver honours timeout_sec itself; the process is killed only if it overruns.
+        hard_timeout = (timeout_sec + SUDOKU_KILL_GRACE_SEC) if timeout_sec is not None else SOLVER_TIMEOUT_SEC
+        try:
+            (ok, solution, stats), profile = _run_solver(
+                run_sudoku_solver, puzzle, algorithm,
+                max_time_sec=timeout_sec, max_nodes=max_nodes, timeout=hard_timeout,
+                profile=_profile_requested(data), **options,
+            )
+        except JobTimeout:
+            ok, solution, stats = False, None, {"duration_ms": hard_timeout * 1000.0, "timed_out": True}
+            profile = None
+        # A BFS that dropped part of its frontier has not proved there is no solution.
+        incomplete = stats.get("timed_out") or stats.get("frontier_mode", "bfs") != "bfs"
+        if ok or not incomplete:
+            result_cache.put("sudoku", cache_key, {
+                "ok": bool(ok and solution),
+                "solution": apply_transform(solution, transform) if ok and solution else None,
+            })
+
+    metrics.observe("solve_sudoku", algorithm, time.perf_counter() - start, stats.get("nodes"))
 
     payload = {
+        "algorithm": algorithm,
         "duration_ms": stats.get("duration_ms"),
+        "node_count": stats.get("node_count"),
         "timed_out": stats.get("timed_out", False),
+        "cache": "hit" if cached is not MISS else "miss",
+        "stats": {k: v for k, v in stats.items() if k not in ("duration_ms", "node_count", "timed_out")},
     }
+    if profile is not None:
+        payload["profile"] = profile
 
     if ok and solution:
         payload.update({"status": "ok", "solution": solution})
@@ -159,6 +594,77 @@ def sudoku_solve():
         return jsonify(payload), 200
 
 
+@app.post("/solve_sudoku/batch")
+def sudoku_solve_batch():
+    """Solve many puzzles in parallel; streams NDJSON lines {index, status, solution, ...stats}.
+
+    item_timeout_ms and max_nodes limit each puzzle (frontier_mb and degrade
+    too, for BFS); timeout_ms (default SOLVER_TIMEOUT_SEC) stops the whole batch.
+    """
+    options, puzzles = _batch_request("puzzles")
+    algorithm = (options.get("algorithm") or "bfs").lower()
+    if algorithm not in SUDOKU_ALGORITHMS:
+        return jsonify({
+            "status": "error",
+            "message": f"Unsupported algorithm: choose one of {sorted(SUDOKU_ALGORITHMS)}."
+        }), 400
+    item_timeout_ms = float(options.get("item_timeout_ms") or 30000)
+    max_nodes = int(options.get("max_nodes") or 2_000_000)
+    try:
+        bfs_options = _bfs_options(options)
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+    items = ((puzzle, algorithm, item_timeout_ms / 1000.0, max_nodes, bfs_options) for puzzle in puzzles)
+    return _stream_batch(solve_sudoku_item, items, _batch_timeout(options), "solve_sudoku/batch", algorithm)
+
+
+@app.post("/solve_sudoku/bulk")
+def sudoku_solve_bulk():
+    """Solve a whole array of puzzles in one worker: vectorized singles, then search per board.
+
+    Unlike /solve_sudoku/batch nothing is streamed; the answer lists solutions
+    and statuses in input order, plus boards/s in `stats`.
+    """
+    data = request.get_json(force=True) or {}
+    puzzles = data.get("puzzles")
+    if not isinstance(puzzles, list):
+        return jsonify({"status": "error", "message": "'puzzles' must be a list."}), 400
+    item_timeout_ms = float(data.get("item_timeout_ms") or 30000)
+    start = time.perf_counter()
+    try:
+        solutions, statuses, stats = executor.run(solve_batch, puzzles, item_timeout_ms / 1000.0,
+                                                  timeout=_timeout_from(data, SOLVER_TIMEOUT_SEC))
+    except JobTimeout:
+        return jsonify({"status": "error", "message": "Bulk solve timed out", "timed_out": True})
+    metrics.observe("solve_sudoku/bulk", "vectorized" if HAVE_NUMPY else "propagation",
+                    time.perf_counter() - start)
+    return jsonify({"status": "ok", "solutions": solutions, "statuses": statuses, "stats": stats})
+
+
+@app.post("/verify_sudoku/batch")
+def sudoku_verify_batch():
+    """Check many submitted solutions at once; `puzzles`, if given, must have their givens kept."""
+    data = request.get_json(force=True) or {}
+    solutions, puzzles = data.get("solutions"), data.get("puzzles")
+    if not isinstance(solutions, list) or (puzzles is not None and not isinstance(puzzles, list)):
+        return jsonify({"status": "error", "message": "'solutions' (and 'puzzles') must be lists."}), 400
+    start = time.perf_counter()
+    try:
+        valid = validate_batch(solutions, puzzles)
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+    elapsed = time.perf_counter() - start
+    metrics.observe("verify_sudoku/batch", "vectorized" if HAVE_NUMPY else "python", elapsed)
+    return jsonify({
+        "status": "ok",
+        "valid": valid,
+        "count": len(valid),
+        "valid_count": sum(valid),
+        "vectorized": HAVE_NUMPY,
+        "duration_ms": round(elapsed * 1000.0, 3),
+    })
+
+
 # ----------------------------------------------------------------------
 # ENTRY POINT
 # ----------------------------------------------------------------------
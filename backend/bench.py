@@ -0,0 +1,339 @@
+"""Benchmark harness over fixed instance corpora for all three solvers.
+
+The corpora are versioned files under benchmarks/v<N>/, written once by
+`build-corpus` and committed, so later generator changes cannot shift the
+instances. Every run reports per-algorithm median/p95 wall time, nodes per
+second (where the solver counts nodes) and peak memory growth, and can write
+JSON for comparing commits.
+
+    python bench.py build-corpus
+    python bench.py run --repeat 3 -o before.json
+    python bench.py compare before.json after.json
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Unix only
+    resource = None
+
+from executor import SolverExecutor, JobTimeout, JobFailed
+from instrument import SearchStats
+from latin_square import latin_square_solver, board_from_line, board_to_line
+from socialgolfer import find_max_weeks, get_search_stats, LOCAL_SEARCH
+from sudoku import SudokuGenerator, SudokuSolver, grid_from_line, grid_to_line
+
+CORPUS_VERSION = 2
+CORPUS_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks")
+
+DFS = "Depth-First Search (DFS)"
+SUDOKU_ALGORITHMS = {
+    "propagation": "solve_propagation",
+    "dlx": "solve_dlx",
+    "bfs": "solve_bfs_backtracking",
+}
+LATIN_ALGORITHMS = ("Backtracking", "IDDFS", "DLX")
+
+# Well-known hard puzzles, all with a unique solution.
+KNOWN_HARD_SUDOKU = {
+    "inkala-2012": "800000000003600000070090200050007000000045700000100030001000068008500010090000400",
+    "ai-escargot": "1....7.9..3..2...8..96..5....53..9...1..8...26....4...3......1..4......7..7...3..",
+    "easter-monster": "1.......2.9.4...5...6...7...5.9.3.......7.......85..4.7.....6...3...9.8...2.....1",
+}
+SUDOKU_PER_LEVEL = 10
+LATIN_SIZES = (5, 10, 15, 20, 25, 30)
+LATIN_DENSITIES = (0.3, 0.5, 0.7)
+LATIN_PER_FAMILY = 2
+GOLFER_INSTANCES = [
+    {"name": "8-4", "num_players": 8, "group_size": 4, "algorithm": DFS},
+    {"name": "9-3", "num_players": 9, "group_size": 3, "algorithm": DFS, "use_constructions": False},
+    {"name": "12-3-sb", "num_players": 12, "group_size": 3, "algorithm": DFS, "symmetry_breaking": True},
+    # 12-4 has no second week; without symmetry breaking DFS has to exhaust the first level to prove it.
+    {"name": "12-4-proof", "num_players": 12, "group_size": 4, "algorithm": DFS},
+    # Every DFS ordering finds the 5 weeks of 16-4 at once; this one times the AG(2,4) construction.
+    {"name": "16-4-construction", "num_players": 16, "group_size": 4, "algorithm": DFS},
+    {"name": "15-3-tabu", "num_players": 15, "group_size": 3, "algorithm": LOCAL_SEARCH,
+     "seed": 1, "time_limit": 5.0},
+    {"name": "16-4-tabu", "num_players": 16, "group_size": 4, "algorithm": LOCAL_SEARCH,
+     "seed": 1, "time_limit": 5.0, "use_constructions": False},
+    {"name": "32-4-tabu", "num_players": 32, "group_size": 4, "algorithm": LOCAL_SEARCH,
+     "seed": 1, "time_limit": 5.0},
+]
+
+
+def corpus_dir(version: int) -> str:
+    return os.path.join(CORPUS_ROOT, f"v{version}")
+
+
+# ==========================================================
+# Corpus
+# ==========================================================
+
+def _random_latin_square(n: int, rng: random.Random) -> List[List[int]]:
+    """A cyclic square with rows, columns and symbols shuffled."""
+    rows, cols, symbols = list(range(n)), list(range(n)), list(range(1, n + 1))
+    rng.shuffle(rows)
+    rng.shuffle(cols)
+    rng.shuffle(symbols)
+    return [[symbols[(rows[r] + cols[c]) % n] for c in range(n)] for r in range(n)]
+
+
+def build_corpus(version: int = CORPUS_VERSION):
+    """Write sudoku.txt, latin.txt and golfer.jsonl for `version`; never overwrites."""
+    out = corpus_dir(version)
+    if os.path.exists(out):
+        raise SystemExit(f"{out} already exists; bump CORPUS_VERSION for a new corpus")
+    os.makedirs(out)
+
+    random.seed(f"sudoku-v{version}")  # SudokuGenerator draws from the module RNG
+    gen = SudokuGenerator()
+    with open(os.path.join(out, "sudoku.txt"), "w") as f:
+        for level in ("easy", "medium", "hard"):
+            for _ in range(SUDOKU_PER_LEVEL):
+                f.write(f"{level}\t{grid_to_line(gen.generate_sudoku(level, ensure_unique=True))}\n")
+        for name, line in KNOWN_HARD_SUDOKU.items():
+            f.write(f"known-hard\t{line.replace('.', '0')}\t{name}\n")
+
+    rng = random.Random(f"latin-v{version}")
+    with open(os.path.join(out, "latin.txt"), "w") as f:
+        for n in LATIN_SIZES:
+            for density in LATIN_DENSITIES:
+                for _ in range(LATIN_PER_FAMILY):
+                    square = _random_latin_square(n, rng)
+                    board = [[v if rng.random() < density else 0 for v in row] for row in square]
+                    f.write(f"n{n}-d{density}\t{board_to_line(board)}\n")
+
+    with open(os.path.join(out, "golfer.jsonl"), "w") as f:
+        for inst in GOLFER_INSTANCES:
+            f.write(json.dumps(inst) + "\n")
+    print(f"wrote {out}", file=sys.stderr)
+
+
+def load_corpus(version: int) -> Dict[str, List[Dict[str, Any]]]:
+    base = corpus_dir(version)
+    if not os.path.isdir(base):
+        raise SystemExit(f"no corpus at {base}; run `python bench.py build-corpus` first")
+    corpus: Dict[str, List[Dict[str, Any]]] = {"sudoku": [], "latin": [], "golfer": []}
+    with open(os.path.join(base, "sudoku.txt")) as f:
+        for line in f:
+            family, puzzle, *_ = line.rstrip("\n").split("\t")
+            corpus["sudoku"].append({"family": family, "input": puzzle})
+    with open(os.path.join(base, "latin.txt")) as f:
+        for line in f:
+            family, board = line.rstrip("\n").split("\t")
+            corpus["latin"].append({"family": family, "input": board})
+    with open(os.path.join(base, "golfer.jsonl")) as f:
+        for line in f:
+            inst = json.loads(line)
+            corpus["golfer"].append({"family": inst.pop("name"), "input": inst})
+    return corpus
+
+
+# ==========================================================
+# Measured runs (executed in a worker process)
+# ==========================================================
+
+def _max_rss_kb() -> Optional[int]:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource else None
+
+
+def _measure(kind: str, payload: Any, algorithm: str, timeout: float) -> Dict[str, Any]:
+    base_rss = _max_rss_kb()
+    start = time.perf_counter()
+    if kind == "sudoku":
+        solver = SudokuSolver(grid_from_line(payload))
+        ok, _, stats = getattr(solver, SUDOKU_ALGORITHMS[algorithm])(max_time_sec=timeout, max_nodes=None)
+        solved, nodes, extra = ok, stats["node_count"], {}
+    elif kind == "latin":
+        search = SearchStats()
+        solved = latin_square_solver(board_from_line(payload), algorithm, stats=search) is not None
+        nodes, extra = search.nodes, {}
+    else:
+        params = dict(payload)
+        _, weeks = find_max_weeks(params.pop("num_players"), params.pop("group_size"),
+                                  params.pop("algorithm"), params.pop("depth_limit", None), **params)
+        stats = get_search_stats()
+        nodes = stats.get("nodes") or None
+        solved, extra = weeks > 0, {"weeks": weeks}
+    elapsed = time.perf_counter() - start
+    peak = _max_rss_kb()
+    return {"ms": elapsed * 1000.0, "solved": bool(solved), "nodes": nodes,
+            "peak_kb": (peak - base_rss) if peak is not None else None, **extra}
+
+
+def _percentile(values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def _summarise(problem: str, family: str, algorithm: str, runs: List[Dict[str, Any]], timeouts: int,
+               failures: int) -> Dict[str, Any]:
+    times = [r["ms"] for r in runs]
+    counted = [r for r in runs if r["nodes"] is not None]
+    seconds = sum(r["ms"] for r in counted) / 1000.0
+    peaks = [r["peak_kb"] for r in runs if r["peak_kb"] is not None]
+    row = {
+        "problem": problem,
+        "family": family,
+        "algorithm": algorithm,
+        "runs": len(runs) + timeouts + failures,
+        "solved": sum(1 for r in runs if r["solved"]),
+        "timeouts": timeouts,
+        "failures": failures,
+        "median_ms": round(_percentile(times, 50), 3) if times else None,
+        "p95_ms": round(_percentile(times, 95), 3) if times else None,
+        "nodes_per_sec": round(sum(r["nodes"] for r in counted) / seconds, 1) if counted and seconds > 0 else None,
+        "peak_kb": max(peaks) if peaks else None,
+    }
+    if problem == "golfer":
+        row["weeks"] = max((r.get("weeks", 0) for r in runs), default=0)
+    return row
+
+
+def run_benchmarks(version: int, problems: List[str], algorithms: Dict[str, List[str]],
+                   repeat: int, timeout: float, families: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    corpus = load_corpus(version)
+    executor = SolverExecutor(max_workers=1)  # one at a time, so runs do not compete for cores
+    results = []
+    for problem in problems:
+        groups: Dict[tuple, list] = {}
+        for inst in corpus[problem]:
+            if families and inst["family"] not in families:
+                continue
+            # Golfer instances carry their own algorithm and options.
+            names = [inst["input"]["algorithm"]] if problem == "golfer" else algorithms[problem]
+            for algorithm in names:
+                groups.setdefault((inst["family"], algorithm), []).append(inst["input"])
+        for (family, algorithm), inputs in groups.items():
+            runs, timeouts, failures = [], 0, 0
+            for payload in inputs:
+                for _ in range(repeat):
+                    try:
+                        runs.append(executor.run(_measure, problem, payload, algorithm, timeout,
+                                                 timeout=timeout + 5.0))
+                    except JobTimeout:
+                        timeouts += 1
+                    except JobFailed as e:
+                        failures += 1
+                        print(f"  {problem}/{family}/{algorithm}: {e}", file=sys.stderr)
+            row = _summarise(problem, family, algorithm, runs, timeouts, failures)
+            results.append(row)
+            print(_format_row(row), file=sys.stderr)
+    return results
+
+
+def _format_row(row: Dict[str, Any]) -> str:
+    def fmt(v):
+        return "-" if v is None else (f"{v:.1f}" if isinstance(v, float) else str(v))
+    return (f"{row['problem']:<7} {row['family']:<16} {row['algorithm'][:24]:<24} "
+            f"solved {row['solved']}/{row['runs']:<4} median {fmt(row['median_ms']):>9} ms  "
+            f"p95 {fmt(row['p95_ms']):>9} ms  nodes/s {fmt(row['nodes_per_sec']):>10}  "
+            f"peak {fmt(row['peak_kb'])} KB" + (f"  weeks {row['weeks']}" if "weeks" in row else ""))
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# ==========================================================
+# Comparison
+# ==========================================================
+
+def compare(old: Dict[str, Any], new: Dict[str, Any], threshold: float) -> int:
+    """Print median-time ratios per group; returns how many slowed down beyond `threshold`."""
+    if old.get("corpus_version") != new.get("corpus_version"):
+        raise SystemExit(f"results are from corpus v{old.get('corpus_version')} and v{new.get('corpus_version')}; "
+                         "run both on the same corpus")
+    before = {(r["problem"], r["family"], r["algorithm"]): r for r in old["results"]}
+    regressions = 0
+    print(f"{old.get('commit')} -> {new.get('commit')}")
+    for row in new["results"]:
+        key = (row["problem"], row["family"], row["algorithm"])
+        prev = before.get(key)
+        if prev is None or not prev["median_ms"] or row["median_ms"] is None:
+            continue
+        ratio = row["median_ms"] / prev["median_ms"]
+        flag = ""
+        if ratio > threshold or row["timeouts"] > prev["timeouts"]:
+            flag = "  REGRESSION"
+            regressions += 1
+        elif ratio < 1.0 / threshold:
+            flag = "  faster"
+        print(f"{'/'.join(key):<50} {prev['median_ms']:>10.1f} -> {row['median_ms']:>10.1f} ms  x{ratio:.2f}{flag}")
+    return regressions
+
+
+# ==========================================================
+# Entry point
+# ==========================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("build-corpus", help="write the instance files for a corpus version")
+    p.add_argument("--version", type=int, default=CORPUS_VERSION)
+
+    p = sub.add_parser("run", help="run the benchmarks")
+    p.add_argument("--version", type=int, default=CORPUS_VERSION)
+    p.add_argument("--problems", default="sudoku,latin,golfer")
+    p.add_argument("--sudoku-algorithms", default="propagation,dlx,bfs")
+    p.add_argument("--latin-algorithms", default=",".join(LATIN_ALGORITHMS))
+    p.add_argument("--families", default=None, help="comma-separated families, e.g. hard,known-hard")
+    p.add_argument("--repeat", type=int, default=1)
+    p.add_argument("--timeout", type=float, default=10.0, help="seconds per run")
+    p.add_argument("-o", "--output", default=None, help="write JSON results here")
+
+    p = sub.add_parser("compare", help="compare two result files")
+    p.add_argument("old")
+    p.add_argument("new")
+    p.add_argument("--threshold", type=float, default=1.2, help="median ratio that counts as a regression")
+
+    args = parser.parse_args(argv)
+    if args.command == "build-corpus":
+        build_corpus(args.version)
+    elif args.command == "run":
+        algorithms = {
+            "sudoku": args.sudoku_algorithms.split(","),
+            "latin": args.latin_algorithms.split(","),
+        }
+        results = run_benchmarks(args.version, args.problems.split(","), algorithms, args.repeat,
+                                 args.timeout, args.families.split(",") if args.families else None)
+        report = {
+            "corpus_version": args.version,
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "repeat": args.repeat,
+            "timeout_sec": args.timeout,
+            "results": results,
+        }
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(report, f, indent=2)
+    else:
+        with open(args.old) as f_old, open(args.new) as f_new:
+            regressions = compare(json.load(f_old), json.load(f_new), args.threshold)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+from typing import Iterable, List, Optional
+
+
+# ==========================================================
+# Compact square board
+# ==========================================================
+
+class Board:
+    """n x n grid of small integers (0 = empty) stored row-major in a flat bytearray.
+
+    A copy is a single buffer copy (81 bytes for Sudoku instead of ten list
+    objects), and `key()` gives an immutable bytes value for hashing. Solvers
+    use it internally; the JSON edge still speaks nested lists via
+    `from_rows` / `to_rows`.
+    """
+
+    __slots__ = ("n", "cells")
+
+    def __init__(self, n: int, cells: Optional[Iterable[int]] = None):
+        self.n = n
+        self.cells = bytearray(cells) if cells is not None else bytearray(n * n)
+        if len(self.cells) != n * n:
+            raise ValueError(f"expected {n * n} cells, got {len(self.cells)}")
+
+    @classmethod
+    def from_rows(cls, rows: List[List[int]]) -> "Board":
+        n = len(rows)
+        if any(len(row) != n for row in rows):
+            raise ValueError("board must be square")
+        return cls(n, [v for row in rows for v in row])
+
+    def to_rows(self) -> List[List[int]]:
+        n, cells = self.n, self.cells
+        return [list(cells[r * n:(r + 1) * n]) for r in range(n)]
+
+    def copy(self) -> "Board":
+        return Board(self.n, self.cells)
+
+    def key(self) -> bytes:
+        return bytes(self.cells)
+
+    def first_empty(self) -> int:
+        """Flat index of the first empty cell, or -1 when the board is full."""
+        return self.cells.find(0)
+
+    def transpose(self) -> "Board":
+        n, cells = self.n, self.cells
+        return Board(n, [cells[r * n + c] for c in range(n) for r in range(n)])
+
+    def rotate(self, quarter_turns: int = 1) -> "Board":
+        """Copy turned clockwise by `quarter_turns` * 90 degrees."""
+        n, out = self.n, self.copy()
+        for _ in range(quarter_turns % 4):
+            cells = out.cells
+            out = Board(n, [cells[(n - 1 - c) * n + r] for r in range(n) for c in range(n)])
+        return out
+
+    def count_filled(self) -> int:
+        return len(self.cells) - self.cells.count(0)
+
+    def __getitem__(self, i: int) -> int:
+        return self.cells[i]
+
+    def __setitem__(self, i: int, v: int):
+        self.cells[i] = v
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Board) and self.n == other.n and self.cells == other.cells
+
+    __hash__ = None  # mutable; hash key() instead
+
+    def __repr__(self) -> str:
+        return f"Board({self.n}, {self.key()!r})"
@@ -0,0 +1,233 @@
+"""Command-line access to the generators and solvers, without the Flask server.
+
+Puzzles are read and written one per line, so files of any size are streamed:
+Sudoku as 81-character strings ('0' or '.' for blanks) and Latin squares as
+n*n space-separated numbers. A solver that fails writes '-' for that line.
+
+    python cli.py generate --level hard --unique --count 1000 --jobs 4 > hard.txt
+    python cli.py generate --level hard --from-bank --count 100000 > hard.txt
+    python cli.py solve-sudoku --algorithm propagation --jobs 4 < hard.txt
+    python cli.py solve-sudoku --algorithm vectorized < hard.txt
+    python cli.py verify-sudoku solutions.txt
+    python cli.py solve-latin --algorithm DLX latin.txt
+    python cli.py golfers 16 4
+"""
+import argparse
+import sys
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List
+
+from executor import SolverExecutor
+from seed_bank import SeedBank, DEFAULT_BANK_PATH, DEFAULT_PER_LEVEL
+from latin_square import latin_square_solver, board_from_line, board_to_line
+from socialgolfer import find_max_weeks, LOCAL_SEARCH
+from sudoku import SudokuGenerator, SudokuSolver, grid_from_line, grid_to_line
+from sudoku_batch import solve_batch, validate_batch, SOLVED
+
+SUDOKU_METHODS = {
+    "bfs": "solve_bfs_backtracking",
+    "propagation": "solve_propagation",
+    "dlx": "solve_dlx",
+}
+FAILED = "-"
+VECTORIZED = "vectorized"
+
+
+# ==========================================================
+# Per-line work (module level so worker processes can run it)
+# ==========================================================
+
+def generate_line(level: str, unique: bool) -> str:
+    return grid_to_line(SudokuGenerator().generate_sudoku(level, ensure_unique=unique))
+
+
+def solve_sudoku_line(line: str, algorithm: str, max_time_sec: float, max_nodes: int) -> str:
+    solver = SudokuSolver(grid_from_line(line))
+    ok, solution, _ = getattr(solver, SUDOKU_METHODS[algorithm])(max_time_sec=max_time_sec, max_nodes=max_nodes)
+    return grid_to_line(solution) if ok and solution else FAILED
+
+
+def solve_sudoku_chunk(lines: List[str], max_time_sec: float) -> str:
+    solutions, statuses, _ = solve_batch(lines, max_time_sec)
+    return "\n".join(grid_to_line(sol) if status == SOLVED else FAILED
+                     for sol, status in zip(solutions, statuses))
+
+
+def verify_sudoku_chunk(lines: List[str]) -> str:
+    """Each line is a solution, or a puzzle and its solution separated by whitespace."""
+    pairs = [line.split() for line in lines]
+    solutions = [p[-1] for p in pairs]
+    puzzles = [p[0] if len(p) > 1 else "0" * 81 for p in pairs]
+    return "\n".join("ok" if ok else "invalid" for ok in validate_batch(solutions, puzzles))
+
+
+def solve_latin_line(line: str, algorithm: str, depth_limit) -> str:
+    solution = latin_square_solver(board_from_line(line), algorithm, depth_limit)
+    return board_to_line(solution) if solution else FAILED
+
+
+# ==========================================================
+# Streaming driver
+# ==========================================================
+
+def run_ordered(fn: Callable[..., str], items: Iterable[tuple], jobs: int) -> Iterator[str]:
+    """fn(*args) for each args tuple, in input order, on `jobs` processes.
+
+    Results that finish early wait in a reorder buffer; no item is read more
+    than a window past the oldest unfinished one, so memory stays flat.
+    """
+    if jobs <= 1:
+        for args in items:
+            try:
+                yield fn(*args)
+            except ValueError as e:
+                print(f"error: {e}", file=sys.stderr)
+                yield FAILED
+        return
+
+    for index, status, value in SolverExecutor(jobs).imap(fn, items, workers=jobs):
+        if status != "ok":
+            print(f"error: line {index + 1}: {value}", file=sys.stderr)
+            value = FAILED
+        yield value
+
+
+def _lines(stream) -> Iterator[str]:
+    for line in stream:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            yield line
+
+
+def _chunks(lines: Iterable[str], size: int) -> Iterator[List[str]]:
+    lines = iter(lines)
+    while True:
+        chunk = list(islice(lines, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _write_all(lines: Iterable[str], out):
+    for line in lines:
+        out.write(line + "\n")
+    out.flush()
+
+
+# ==========================================================
+# Commands
+# ==========================================================
+
+def cmd_generate(args):
+    if args.from_bank:
+        bank = SeedBank(args.bank)
+        _write_all((grid_to_line(bank.derive(args.level)) for _ in range(args.count)), args.output)
+        return
+    items = ((args.level, args.unique) for _ in range(args.count))
+    _write_all(run_ordered(generate_line, items, args.jobs), args.output)
+
+
+def cmd_build_bank(args):
+    entries = SeedBank(args.bank).build(args.per_level)
+    print(", ".join(f"{level}: {len(v)}" for level, v in entries.items()) + f" -> {args.bank}", file=sys.stderr)
+
+
+def cmd_solve_sudoku(args):
+    max_time = args.timeout_ms / 1000.0 if args.timeout_ms > 0 else None
+    if args.algorithm == VECTORIZED:
+        # One vectorized pass per chunk of lines; chunks are spread over the jobs.
+        items = ((chunk, max_time) for chunk in _chunks(_lines(args.input), args.chunk_size))
+        _write_all(run_ordered(solve_sudoku_chunk, items, args.jobs), args.output)
+        return
+    items = ((line, args.algorithm, max_time, args.max_nodes) for line in _lines(args.input))
+    _write_all(run_ordered(solve_sudoku_line, items, args.jobs), args.output)
+
+
+def cmd_verify_sudoku(args):
+    items = ((chunk,) for chunk in _chunks(_lines(args.input), args.chunk_size))
+    _write_all(run_ordered(verify_sudoku_chunk, items, args.jobs), args.output)
+
+
+def cmd_solve_latin(args):
+    items = ((line, args.algorithm, args.depth_limit) for line in _lines(args.input))
+    _write_all(run_ordered(solve_latin_line, items, args.jobs), args.output)
+
+
+def cmd_golfers(args):
+    schedule, weeks = find_max_weeks(
+        args.num_players, args.group_size, args.algorithm, args.depth_limit,
+        symmetry_breaking=args.symmetry_breaking, workers=args.jobs,
+        seed=args.seed, time_limit=args.time_limit,
+    )
+    for week in schedule:
+        args.output.write(" | ".join(" ".join(str(p) for p in group) for group in week) + "\n")
+    args.output.flush()
+    print(f"{weeks} weeks", file=sys.stderr)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def io_args(p, reads=True):
+        if reads:
+            p.add_argument("input", nargs="?", type=argparse.FileType("r"), default=sys.stdin,
+                           help="input file, one puzzle per line (default: stdin)")
+        p.add_argument("-o", "--output", type=argparse.FileType("w"), default=sys.stdout)
+        p.add_argument("-j", "--jobs", type=int, default=1, help="worker processes")
+
+    p = sub.add_parser("generate", help="generate Sudoku puzzles")
+    p.add_argument("--level", choices=("easy", "medium", "hard"), default="easy")
+    p.add_argument("--unique", action="store_true", help="only puzzles with a unique solution")
+    p.add_argument("-n", "--count", type=int, default=1)
+    p.add_argument("--from-bank", action="store_true",
+                   help="derive from the seed bank (always unique, no solver runs)")
+    p.add_argument("--bank", default=DEFAULT_BANK_PATH, help="seed bank file")
+    io_args(p, reads=False)
+    p.set_defaults(func=cmd_generate)
+
+    p = sub.add_parser("build-bank", help="(re)build the Sudoku seed bank file")
+    p.add_argument("--per-level", type=int, default=DEFAULT_PER_LEVEL)
+    p.add_argument("--bank", default=DEFAULT_BANK_PATH, help="seed bank file")
+    p.set_defaults(func=cmd_build_bank)
+
+    p = sub.add_parser("solve-sudoku", help="solve 81-character Sudoku lines")
+    p.add_argument("--algorithm", choices=sorted(SUDOKU_METHODS) + [VECTORIZED], default="propagation")
+    p.add_argument("--timeout-ms", type=float, default=30000, help="per puzzle, 0 for none")
+    p.add_argument("--max-nodes", type=int, default=2_000_000)
+    p.add_argument("--chunk-size", type=int, default=4096, help="puzzles per vectorized pass")
+    io_args(p)
+    p.set_defaults(func=cmd_solve_sudoku)
+
+    p = sub.add_parser("verify-sudoku", help="check solution lines ('solution' or 'puzzle solution')")
+    p.add_argument("--chunk-size", type=int, default=4096, help="boards per vectorized pass")
+    io_args(p)
+    p.set_defaults(func=cmd_verify_sudoku)
+
+    p = sub.add_parser("solve-latin", help="solve flat n*n Latin square lines")
+    p.add_argument("--algorithm", choices=("Backtracking", "IDDFS", "DLX"), default="Backtracking")
+    p.add_argument("--depth-limit", type=int, default=None)
+    io_args(p)
+    p.set_defaults(func=cmd_solve_latin)
+
+    p = sub.add_parser("golfers", help="schedule the Social Golfer problem")
+    p.add_argument("num_players", type=int)
+    p.add_argument("group_size", type=int)
+    p.add_argument("--algorithm", default="Depth-First Search (DFS)",
+                   choices=("Depth-First Search (DFS)", "Depth-Limited Search (DLS)", LOCAL_SEARCH))
+    p.add_argument("--depth-limit", type=int, default=None)
+    p.add_argument("--symmetry-breaking", action="store_true")
+    p.add_argument("--seed", type=int, default=None)
+    p.add_argument("--time-limit", type=float, default=None)
+    io_args(p, reads=False)
+    p.set_defaults(func=cmd_golfers)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
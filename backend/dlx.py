@@ -0,0 +1,194 @@
+import time
+from typing import Any, Hashable, Iterable, Iterator, List, Optional
+
+
+# ==========================================================
+# Dancing Links (Algorithm X) exact-cover engine
+# ==========================================================
+
+class ExactCover:
+    """Knuth's Algorithm X over a dancing-links matrix.
+
+    Columns are the integers 0..num_columns-1; every row is added with a
+    label and the columns it covers. Links are kept in flat lists indexed by
+    node id (0 is the root, 1..num_columns are the column headers) and the
+    search is iterative, so deep boards do not hit Python's recursion limit.
+    """
+
+    def __init__(self, num_columns: int):
+        self.num_columns = num_columns
+        n = num_columns + 1
+        self.L = [i - 1 for i in range(n)]
+        self.R = [i + 1 for i in range(n)]
+        self.L[0] = num_columns
+        self.R[num_columns] = 0
+        self.U = list(range(n))
+        self.D = list(range(n))
+        self.C = list(range(n))
+        self.S = [0] * n
+        self.row_of = [-1] * n
+        self.labels: List[Any] = []
+        self.nodes = 0
+        self.backtracks = 0
+        self.max_depth = 0
+        self.dead_ends = 0
+        self.aborted = False
+
+    def add_row(self, label: Hashable, columns: Iterable[int]) -> int:
+        """Append a row covering `columns` and return its index."""
+        row = len(self.labels)
+        self.labels.append(label)
+        first = -1
+        for col in columns:
+            c = col + 1
+            x = len(self.C)
+            self.C.append(c)
+            self.row_of.append(row)
+            self.U.append(self.U[c])
+            self.D.append(c)
+            self.D[self.U[c]] = x
+            self.U[c] = x
+            self.S[c] += 1
+            if first < 0:
+                first = x
+                self.L.append(x)
+                self.R.append(x)
+            else:
+                self.L.append(self.L[first])
+                self.R.append(first)
+                self.R[self.L[first]] = x
+                self.L[first] = x
+        return row
+
+    def _cover(self, c: int):
+        L, R, U, D, C, S = self.L, self.R, self.U, self.D, self.C, self.S
+        R[L[c]] = R[c]
+        L[R[c]] = L[c]
+        i = D[c]
+        while i != c:
+            j = R[i]
+            while j != i:
+                D[U[j]] = D[j]
+                U[D[j]] = U[j]
+                S[C[j]] -= 1
+                j = R[j]
+            i = D[i]
+
+    def _uncover(self, c: int):
+        L, R, U, D, C, S = self.L, self.R, self.U, self.D, self.C, self.S
+        i = U[c]
+        while i != c:
+            j = L[i]
+            while j != i:
+                S[C[j]] += 1
+                D[U[j]] = j
+                U[D[j]] = j
+                j = L[j]
+            i = U[i]
+        R[L[c]] = c
+        L[R[c]] = c
+
+    def _choose_column(self) -> int:
+        R, S = self.R, self.S
+        best, best_size = 0, None
+        c = R[0]
+        while c != 0:
+            if best_size is None or S[c] < best_size:
+                best, best_size = c, S[c]
+                if best_size <= 1:
+                    break
+            c = R[c]
+        return best
+
+    def _select(self, r: int):
+        j = self.R[r]
+        while j != r:
+            self._cover(self.C[j])
+            j = self.R[j]
+
+    def _deselect(self, r: int):
+        j = self.L[r]
+        while j != r:
+            self._uncover(self.C[j])
+            j = self.L[j]
+
+    def solve(self,
+              limit: Optional[int] = None,
+              max_nodes: Optional[int] = None,
+              deadline: Optional[float] = None) -> Iterator[List[Any]]:
+        """Yield solutions as lists of row labels.
+
+        Stops after `limit` solutions; `max_nodes` and `deadline` (a
+        time.perf_counter() value) abort the search and set `self.aborted`.
+        The matrix is fully restored once the generator finishes.
+        """
+        D, C = self.D, self.C
+        self.nodes = 0
+        self.backtracks = 0
+        self.max_depth = 0
+        self.dead_ends = 0
+        self.aborted = False
+        found = 0
+        picked: List[int] = []
+        descend = True
+
+        try:
+            while True:
+                if descend:
+                    if max_nodes is not None and self.nodes >= max_nodes:
+                        self.aborted = True
+                    elif deadline is not None and time.perf_counter() >= deadline:
+                        self.aborted = True
+                    if self.aborted:
+                        break
+                    self.nodes += 1
+
+                    if self.R[0] == 0:
+                        yield [self.labels[self.row_of[r]] for r in picked]
+                        found += 1
+                        if limit is not None and found >= limit:
+                            break
+                        descend = False
+                        continue
+
+                    c = self._choose_column()
+                    if self.S[c] == 0:
+                        self.dead_ends += 1
+                        descend = False
+                        continue
+                    self._cover(c)
+                    r = D[c]
+                    picked.append(r)
+                    if len(picked) > self.max_depth:
+                        self.max_depth = len(picked)
+                    self._select(r)
+                    continue
+
+                # Backtrack: advance the deepest choice to its next row.
+                if not picked:
+                    break
+                r = picked.pop()
+                self.backtracks += 1
+                self._deselect(r)
+                c = C[r]
+                r = D[r]
+                if r != c:
+                    picked.append(r)
+                    self._select(r)
+                    descend = True
+                else:
+                    self._uncover(c)
+        finally:
+            while picked:
+                r = picked.pop()
+                self._deselect(r)
+                self._uncover(C[r])
+
+    def first_solution(self, **kwargs) -> Optional[List[Any]]:
+        for solution in self.solve(limit=1, **kwargs):
+            return solution
+        return None
+
+    def count_solutions(self, limit: Optional[int] = None, **kwargs) -> int:
+        """Number of exact covers, stopping early once `limit` is reached."""
+        return sum(1 for _ in self.solve(limit=limit, **kwargs))
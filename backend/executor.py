@@ -0,0 +1,306 @@
+import multiprocessing as mp
+import os
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+# fork keeps job startup cheap on Linux; elsewhere fall back to the default.
+_CTX = mp.get_context("fork") if "fork" in mp.get_all_start_methods() else mp.get_context()
+
+
+class JobTimeout(Exception):
+    pass
+
+
+class JobCancelled(Exception):
+    pass
+
+
+class JobFailed(Exception):
+    pass
+
+
+# ==========================================================
+# Child side
+# ==========================================================
+
+def _child_main(conn, fn, args, kwargs, progress_fn, progress_interval):
+    send_lock = threading.Lock()
+
+    if progress_fn is not None:
+        def report():
+            last = None
+            while True:
+                time.sleep(progress_interval)
+                try:
+                    value = progress_fn()
+                    if value is last:
+                        continue
+                    last = value
+                    with send_lock:
+                        conn.send(("progress", value))
+                except Exception:
+                    return
+
+        threading.Thread(target=report, daemon=True).start()
+
+    try:
+        result = fn(*args, **kwargs)
+        message = ("ok", result)
+    except Exception as e:
+        message = ("error", f"{type(e).__name__}: {e}")
+    with send_lock:
+        conn.send(message)
+        conn.close()
+
+
+def _call_item(fn, index, args):
+    try:
+        return index, "ok", fn(*args)
+    except Exception as e:
+        return index, "error", f"{type(e).__name__}: {e}"
+
+
+# ==========================================================
+# Bounded solver executor
+# ==========================================================
+
+class SolverExecutor:
+    """Runs CPU-bound solver calls in separate processes, at most `max_workers` at once.
+
+    Every job gets its own process so that a timeout or cancellation can
+    terminate it outright instead of waiting for the search to notice a flag.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._slots = threading.BoundedSemaphore(self.max_workers)
+        self._lock = threading.Lock()
+        self._active: Dict[int, Any] = {}
+        self._tags: Dict[int, Optional[str]] = {}
+        self._queued: Dict[str, int] = {}  # tag -> jobs with that tag waiting for a slot
+        self._cancelled: set = set()
+        self._cancelled_tags: set = set()
+        self._counters = {"completed": 0, "failed": 0, "timed_out": 0, "cancelled": 0}
+
+    def run(self,
+            fn: Callable,
+            *args,
+            timeout: Optional[float] = None,
+            tag: Optional[str] = None,
+            progress_fn: Optional[Callable[[], Any]] = None,
+            on_progress: Optional[Callable[[Any], None]] = None,
+            progress_interval: float = 0.5,
+            slots: int = 1,
+            slots_arg: Optional[str] = None,
+            **kwargs) -> Any:
+        """Run fn(*args, **kwargs) in a worker process and return its result.
+
+        `timeout` covers queueing and execution. If `progress_fn` is given it
+        is called inside the child every `progress_interval` seconds and each
+        new value (a different object from the last one) is handed to
+        `on_progress` in the caller.
+
+        A job that forks processes of its own asks for `slots`: it waits for
+        one and takes up to `slots` - 1 more if they are free. The number held
+        is passed to fn as the keyword `slots_arg`, if given.
+        """
+        deadline = (time.monotonic() + timeout) if timeout is not None else None
+        self._enqueue(tag)
+        if not self._slots.acquire(timeout=timeout):
+            with self._lock:
+                self._dequeue(tag)
+            self._count("timed_out")
+            raise JobTimeout("No free solver worker before the timeout")
+        held = 1
+        while held < slots and self._slots.acquire(blocking=False):
+            held += 1
+        if slots_arg is not None:
+            kwargs[slots_arg] = held
+
+        parent_conn, child_conn = _CTX.Pipe(duplex=False)
+        proc = _CTX.Process(
+            target=_child_main,
+            args=(child_conn, fn, args, kwargs, progress_fn, progress_interval),
+        )
+        try:
+            # Checked and registered under one lock, so a cancel either finds the
+            # tag still queued or finds the running process.
+            with self._lock:
+                cancelled = self._dequeue(tag)
+                if cancelled:
+                    self._counters["cancelled"] += 1
+                    raise JobCancelled("Solver was cancelled before it started")
+                proc.start()
+                self._active[proc.pid] = proc
+                self._tags[proc.pid] = tag
+            child_conn.close()
+
+            while True:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    self._count("timed_out")
+                    raise JobTimeout(f"Solver exceeded {timeout}s")
+                if not parent_conn.poll(remaining):
+                    continue
+                try:
+                    kind, value = parent_conn.recv()
+                except EOFError:
+                    if proc.pid in self._cancelled:
+                        self._count("cancelled")
+                        raise JobCancelled("Solver was cancelled")
+                    self._count("failed")
+                    raise JobFailed(f"Solver process exited with code {proc.exitcode}")
+                if kind == "progress":
+                    if on_progress is not None:
+                        on_progress(value)
+                elif kind == "ok":
+                    self._count("completed")
+                    return value
+                else:
+                    self._count("failed")
+                    raise JobFailed(value)
+        finally:
+            if proc.pid is not None:
+                if proc.is_alive():
+                    proc.terminate()
+                proc.join()
+            else:
+                child_conn.close()
+            parent_conn.close()
+            with self._lock:
+                self._active.pop(proc.pid, None)
+                self._tags.pop(proc.pid, None)
+                self._cancelled.discard(proc.pid)
+            for _ in range(held):
+                self._slots.release()
+
+    def imap_unordered(self,
+                       fn: Callable,
+                       items: Iterable[tuple],
+                       workers: Optional[int] = None,
+                       window: Optional[int] = None,
+                       timeout: Optional[float] = None) -> Iterator[Tuple[int, str, Any]]:
+        """Run fn(*args) for every args tuple in `items` on a pool of worker processes.
+
+        Yields (index, "ok" | "error", result or message) in completion order.
+        At most `window` items are read ahead of the results, so `items` may
+        be an unbounded stream. The pool takes one executor slot per process
+        (at least one, more only if free), and it is terminated when `timeout`
+        expires, which raises JobTimeout, or when the caller stops iterating.
+        """
+        return self._imap(fn, items, workers, window, timeout, ordered=False)
+
+    def imap(self,
+             fn: Callable,
+             items: Iterable[tuple],
+             workers: Optional[int] = None,
+             window: Optional[int] = None,
+             timeout: Optional[float] = None) -> Iterator[Tuple[int, str, Any]]:
+        """Like imap_unordered, but yields in input order.
+
+        No item is read more than `window` places past the oldest result not
+        yet yielded, so a slow item holds back at most `window` finished ones.
+        """
+        return self._imap(fn, items, workers, window, timeout, ordered=True)
+
+    def _imap(self, fn, items, workers, window, timeout, ordered):
+        deadline = (time.monotonic() + timeout) if timeout is not None else None
+        if not self._slots.acquire(timeout=timeout):
+            self._count("timed_out")
+            raise JobTimeout("No free solver worker before the timeout")
+        held = 1
+        while held < (workers or self.max_workers) and self._slots.acquire(blocking=False):
+            held += 1
+        window = window or 2 * held
+
+        done: "queue.SimpleQueue[Tuple[int, str, Any]]" = queue.SimpleQueue()
+        pool = _CTX.Pool(held)
+        try:
+            source = iter(items)
+            index = 0
+            in_flight = 0
+            exhausted = False
+            pending: Dict[int, Tuple[int, str, Any]] = {}
+            next_index = 0
+            while True:
+                while not exhausted and in_flight < window and (not ordered or index - next_index < window):
+                    try:
+                        args = next(source)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    pool.apply_async(
+                        _call_item, (fn, index, args), callback=done.put,
+                        error_callback=lambda e, i=index: done.put((i, "error", f"{type(e).__name__}: {e}")),
+                    )
+                    index += 1
+                    in_flight += 1
+                if in_flight == 0:
+                    return
+                remaining = None if deadline is None else deadline - time.monotonic()
+                try:
+                    if remaining is not None and remaining <= 0:
+                        raise queue.Empty
+                    result = done.get(timeout=remaining)
+                except queue.Empty:
+                    self._count("timed_out")
+                    raise JobTimeout(f"Batch exceeded {timeout}s")
+                in_flight -= 1
+                self._count("completed" if result[1] == "ok" else "failed")
+                if not ordered:
+                    yield result
+                    continue
+                pending[result[0]] = result
+                while next_index in pending:
+                    yield pending.pop(next_index)
+                    next_index += 1
+        finally:
+            pool.terminate()
+            pool.join()
+            for _ in range(held):
+                self._slots.release()
+
+    def cancel(self, tag: Optional[str] = None) -> int:
+        """Terminate running jobs with `tag` (all jobs if None); returns how many.
+
+        A tagged job that is still waiting for a worker is cancelled as soon
+        as it gets one. Unknown or finished tags are ignored.
+        """
+        with self._lock:
+            victims = [p for pid, p in self._active.items()
+                       if tag is None or self._tags.get(pid) == tag]
+            for p in victims:
+                self._cancelled.add(p.pid)
+            if tag is not None and not victims and tag in self._queued:
+                self._cancelled_tags.add(tag)
+        for p in victims:
+            p.terminate()
+        return len(victims)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"max_workers": self.max_workers, "active": len(self._active), **self._counters}
+
+    def _enqueue(self, tag: Optional[str]):
+        if tag is not None:
+            with self._lock:
+                self._queued[tag] = self._queued.get(tag, 0) + 1
+
+    def _dequeue(self, tag: Optional[str]) -> bool:
+        """Drop one queued job with `tag` (lock held); True if it was cancelled meanwhile."""
+        if tag is None:
+            return False
+        left = self._queued.pop(tag) - 1
+        if left:
+            self._queued[tag] = left
+        if tag not in self._cancelled_tags:
+            return False
+        if not left:
+            self._cancelled_tags.discard(tag)
+        return True
+
+    def _count(self, key: str):
+        with self._lock:
+            self._counters[key] += 1
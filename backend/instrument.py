@@ -0,0 +1,189 @@
+import os
+import sys
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+# ==========================================================
+# Per-run search statistics
+# ==========================================================
+
+class SearchStats:
+    """Counters shared by every solver: nodes, backtracks, depth, prunes, frontier and phases.
+
+    Hot loops keep plain local ints and write them here once at the end;
+    `prune()` and `phase()` are for the few places outside inner loops.
+    `as_dict()` is the JSON shape every solve response carries.
+    """
+
+    __slots__ = ("nodes", "backtracks", "max_depth", "frontier_peak", "frontier_peak_bytes", "prunes", "phases_ms")
+
+    def __init__(self):
+        self.nodes = 0
+        self.backtracks = 0
+        self.max_depth = 0
+        self.frontier_peak = 0
+        self.frontier_peak_bytes = 0
+        self.prunes: Dict[str, int] = {}
+        self.phases_ms: Dict[str, float] = {}
+
+    def prune(self, reason: str, count: int = 1):
+        if count:
+            self.prunes[reason] = self.prunes.get(reason, 0) + count
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000.0
+            self.phases_ms[name] = round(self.phases_ms.get(name, 0.0) + elapsed, 3)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "nodes": self.nodes,
+            "backtracks": self.backtracks,
+            "max_depth": self.max_depth,
+            "frontier_peak": self.frontier_peak,
+            "frontier_peak_bytes": self.frontier_peak_bytes,
+            "prunes": dict(self.prunes),
+            "phases_ms": dict(self.phases_ms),
+        }
+
+
+# ==========================================================
+# Sampling profiler
+# ==========================================================
+
+class SamplingProfiler:
+    """Samples one thread's Python stack every `interval` seconds from a helper thread.
+
+    Much cheaper than cProfile on solver hot loops because nothing is hooked
+    into each call; the result is approximate and only as fine as the interval.
+    """
+
+    def __init__(self, interval: float = 0.005, top: int = 15):
+        self.interval = interval
+        self.top = top
+        self._self: Counter = Counter()
+        self._cumulative: Counter = Counter()
+        self._samples = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._target = 0
+
+    def start(self):
+        self._target = threading.get_ident()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> Dict[str, Any]:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        return {
+            "interval_ms": self.interval * 1000.0,
+            "samples": self._samples,
+            "top_self": self._self.most_common(self.top),
+            "top_cumulative": self._cumulative.most_common(self.top),
+        }
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._target)
+            if frame is None:
+                continue
+            self._samples += 1
+            code = frame.f_code
+            self._self[f"{os.path.basename(code.co_filename)}:{code.co_name}:{frame.f_lineno}"] += 1
+            seen = set()
+            while frame is not None:
+                code = frame.f_code
+                key = f"{os.path.basename(code.co_filename)}:{code.co_name}"
+                if key not in seen:
+                    seen.add(key)
+                    self._cumulative[key] += 1
+                frame = frame.f_back
+
+
+def profiled(fn: Callable, *args, **kwargs) -> Tuple[Any, Dict[str, Any]]:
+    """Run fn(*args, **kwargs) under the sampling profiler; returns (result, profile)."""
+    profiler = SamplingProfiler()
+    profiler.start()
+    try:
+        result = fn(*args, **kwargs)
+    finally:
+        report = profiler.stop()
+    return result, report
+
+
+# ==========================================================
+# Prometheus-style metrics
+# ==========================================================
+
+def _label(value) -> str:
+    """Escape a label value for the text exposition format."""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class Metrics:
+    """Per (endpoint, algorithm) latency histograms and node counters, rendered in
+    the Prometheus text exposition format. Counts are per server process."""
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._hist: Dict[Tuple[str, str], List[float]] = {}  # bucket counts..., sum, count
+        self._nodes: Dict[Tuple[str, str], int] = {}
+
+    def observe(self, endpoint: str, algorithm: Optional[str], seconds: float, nodes: Optional[int] = None):
+        key = (endpoint, algorithm or "")
+        with self._lock:
+            hist = self._hist.get(key)
+            if hist is None:
+                hist = self._hist[key] = [0] * (len(self.buckets) + 2)
+            i = bisect_left(self.buckets, seconds)
+            if i < len(self.buckets):
+                hist[i] += 1
+            hist[-2] += seconds
+            hist[-1] += 1
+            if nodes:
+                self._nodes[key] = self._nodes.get(key, 0) + nodes
+
+    def render(self, extra: Optional[Dict[str, List[Tuple[Dict[str, str], float]]]] = None) -> str:
+        """Exposition text; `extra` maps gauge names to (labels, value) samples."""
+        lines = [
+            "# HELP solver_request_duration_seconds Solver request latency.",
+            "# TYPE solver_request_duration_seconds histogram",
+        ]
+        with self._lock:
+            hists = {k: list(v) for k, v in self._hist.items()}
+            nodes = dict(self._nodes)
+        for (endpoint, algorithm), hist in sorted(hists.items()):
+            labels = f'endpoint="{_label(endpoint)}",algorithm="{_label(algorithm)}"'
+            running = 0
+            for bound, count in zip(self.buckets, hist):
+                running += count
+                lines.append(f'solver_request_duration_seconds_bucket{{{labels},le="{bound}"}} {running}')
+            lines.append(f'solver_request_duration_seconds_bucket{{{labels},le="+Inf"}} {int(hist[-1])}')
+            lines.append(f"solver_request_duration_seconds_sum{{{labels}}} {hist[-2]:.6f}")
+            lines.append(f"solver_request_duration_seconds_count{{{labels}}} {int(hist[-1])}")
+
+        lines += ["# HELP solver_nodes_total Search nodes expanded.", "# TYPE solver_nodes_total counter"]
+        for (endpoint, algorithm), total in sorted(nodes.items()):
+            lines.append(f'solver_nodes_total{{endpoint="{_label(endpoint)}",algorithm="{_label(algorithm)}"}} {total}')
+
+        for name, samples in (extra or {}).items():
+            lines.append(f"# TYPE {name} gauge")
+            for labels, value in samples:
+                rendered = ",".join(f'{k}="{_label(v)}"' for k, v in labels.items())
+                lines.append(f"{name}{{{rendered}}} {value}" if rendered else f"{name} {value}")
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,108 @@
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Optional
+
+RUNNING = "running"
+DONE = "done"
+STOPPED = "stopped"
+TIMED_OUT = "timed_out"
+FAILED = "failed"
+
+
+# ==========================================================
+# Background solver jobs
+# ==========================================================
+
+class Job:
+    """One background search: its parameters, latest progress and final result."""
+
+    def __init__(self, params: Dict[str, Any]):
+        self.id = uuid.uuid4().hex
+        self.params = params
+        self.status = RUNNING
+        self.progress: List[Any] = []
+        self.result: Optional[List[Any]] = None
+        self.error: Optional[str] = None
+        self.stats: Dict[str, Any] = {}
+        self.stop_requested = False  # set by a stop that arrives before the solver is queued
+        self.started_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.version = 0
+        self._lock = threading.Condition()
+
+    @property
+    def elapsed(self) -> float:
+        end = self.finished_at if self.finished_at is not None else time.time()
+        return round(end - self.started_at, 3)
+
+    def set_progress(self, progress: List[Any], stats: Optional[Dict[str, Any]] = None):
+        with self._lock:
+            self.progress = progress
+            if stats is not None:
+                self.stats = stats
+            self.version += 1
+            self._lock.notify_all()
+
+    def wait_for_update(self, version: int, timeout: Optional[float] = None) -> int:
+        """Block until the job changes past `version` (or timeout); returns the current version."""
+        with self._lock:
+            self._lock.wait_for(lambda: self.version != version, timeout)
+            return self.version
+
+    def finish(self,
+               status: str,
+               result: Optional[List[Any]] = None,
+               error: Optional[str] = None,
+               stats: Optional[Dict[str, Any]] = None):
+        """Close the job; `stats` are laid over the last ones reported with progress."""
+        with self._lock:
+            self.status = status
+            self.result = result if result is not None else self.progress
+            self.error = error
+            self.stats = {**self.stats, **(stats or {})}
+            self.finished_at = time.time()
+            self.version += 1
+            self._lock.notify_all()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            schedule = self.result if self.status != RUNNING else self.progress
+            return {
+                "job_id": self.id,
+                "status": self.status,
+                "elapsed_time": self.elapsed,
+                "weeks": len(schedule or []),
+                "schedule": schedule or [],
+                "error": self.error,
+                "stats": self.stats,
+            }
+
+
+class JobRegistry:
+    """Thread-safe job table; finished jobs are dropped after `ttl_sec`."""
+
+    def __init__(self, ttl_sec: float = 3600.0):
+        self.ttl_sec = ttl_sec
+        self._jobs: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, params: Dict[str, Any], target: Callable[[Job], None]) -> Job:
+        """Create a job and run target(job) on a daemon thread."""
+        job = Job(params)
+        with self._lock:
+            self._expire()
+            self._jobs[job.id] = job
+        threading.Thread(target=target, args=(job,), name=f"job-{job.id}", daemon=True).start()
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _expire(self):
+        now = time.time()
+        stale = [jid for jid, job in self._jobs.items()
+                 if job.finished_at is not None and now - job.finished_at > self.ttl_sec]
+        for jid in stale:
+            del self._jobs[jid]
@@ -1,63 +1,271 @@
-def is_valid(board, row, col, num, n):
-    for i in range(n):
-        if board[row][i] == num or board[i][col] == num:
-            return False
-    return True
+import time
+
+from board import Board
+from dlx import ExactCover
+from instrument import SearchStats
 
-def find_empty_cell(board, n):
+def _used_masks(board, n):
+    """Row and column bitsets of the givens, or None if the givens already clash."""
+    row_used = [0] * n
+    col_used = [0] * n
     for r in range(n):
         for c in range(n):
-            if board[r][c] == 0:
-                return r, c
-    return None, None
-
-def latin_backtrack(board, n):
-    row, col = find_empty_cell(board, n)
-    if row is None:  # board is full
-        return True
-
-    for num in range(1, n + 1):
-        if is_valid(board, row, col, num, n):
-            board[row][col] = num
-            if latin_backtrack(board, n):
-                return True
-            board[row][col] = 0
-    return False
-
-def dfs_limited(board, n, depth, max_depth):
-    row, col = find_empty_cell(board, n)
-    if row is None:
-        return True
-    if depth >= max_depth:
+            num = board[r][c]
+            if num:
+                if not 1 <= num <= n:
+                    return None
+                bit = 1 << (num - 1)
+                if row_used[r] & bit or col_used[c] & bit:
+                    return None
+                row_used[r] |= bit
+                col_used[c] |= bit
+    return row_used, col_used
+
+def _flush(stats, nodes, backtracks, max_depth, **prunes):
+    """Copy a solver's local counters into `stats`, if the caller asked for them."""
+    if stats is None:
+        return
+    stats.nodes += nodes
+    stats.backtracks += backtracks
+    stats.max_depth = max(stats.max_depth, max_depth)
+    for reason, count in prunes.items():
+        stats.prune(reason, count)
+
+# Nodes between clock reads when a deadline is set, for solvers with cheap nodes.
+DEADLINE_CHECK_NODES = 256
+
+def _expired(deadline, nodes, every=DEADLINE_CHECK_NODES):
+    return deadline is not None and nodes % every == 0 and time.perf_counter() >= deadline
+
+def latin_backtrack(board, n, stats=None, deadline=None):
+    """Fill `board` in place using row/column bitsets and MRV.
+
+    Each node rescans the open cells. Any cell with an empty domain, or any
+    value with no place left in its row or column, fails the branch at once
+    (forward checking). A value with exactly one place is forced. Otherwise
+    the search branches on the cell with the fewest candidates. An explicit
+    stack keeps large boards clear of the recursion limit. Past `deadline`
+    (a time.perf_counter() value) the search gives up and returns False.
+    """
+    masks = _used_masks(board, n)
+    if masks is None:
+        if stats is not None:
+            stats.prune("given_conflict")
         return False
-    for num in range(1, n + 1):
-        if is_valid(board, row, col, num, n):
-            board[row][col] = num
-            if dfs_limited(board, n, depth + 1, max_depth):
-                return True
-            board[row][col] = 0
-    return False
-
-def iddfs(board, n, max_depth=200):
-    for limit in range(1, max_depth + 1):
-        test_board = [row[:] for row in board]  # fresh copy for each depth
-        if dfs_limited(test_board, n, 0, limit):
-            return test_board
-    return None
-
-def latin_square_solver(input_board, algorithm="Backtracking", depth_limit=None):
-    n = len(input_board)
+    row_used, col_used = masks
+    full = (1 << n) - 1
+    open_cells = [(r, c) for r in range(n) for c in range(n) if board[r][c] == 0]
+    stack = []  # (r, c, values still to try)
+    nodes = backtracks = max_depth = 0
+    empty_domain = value_no_place = 0
+
+    while True:
+        nodes += 1
+        if _expired(deadline, nodes, every=1):  # every node rescans the board
+            _flush(stats, nodes, backtracks, max_depth, empty_domain=empty_domain,
+                   value_no_place=value_no_place, time_limit=1)
+            return False
+        best = None
+        best_count = n + 1
+        best_free = 0
+        dead = False
+        # Values seen as a candidate at least once / at least twice per row and column.
+        row_once, row_twice = [0] * n, [0] * n
+        col_once, col_twice = [0] * n, [0] * n
+        for i, (r, c) in enumerate(open_cells):
+            free = full & ~(row_used[r] | col_used[c])
+            if not free:
+                dead = True
+                empty_domain += 1
+                break
+            row_twice[r] |= row_once[r] & free
+            row_once[r] |= free
+            col_twice[c] |= col_once[c] & free
+            col_once[c] |= free
+            count = bin(free).count("1")
+            if count < best_count:
+                best, best_count, best_free = i, count, free
+
+        if not dead and best_count > 1:
+            for line in range(n):
+                if (full & ~row_used[line] & ~row_once[line]) or (full & ~col_used[line] & ~col_once[line]):
+                    dead = True
+                    value_no_place += 1
+                    break
+            else:
+                forced = None
+                for line in range(n):
+                    single = row_once[line] & ~row_twice[line]
+                    if single:
+                        forced = (line, None, single & -single)
+                        break
+                    single = col_once[line] & ~col_twice[line]
+                    if single:
+                        forced = (None, line, single & -single)
+                        break
+                if forced is not None:
+                    fr, fc, bit = forced
+                    for i, (r, c) in enumerate(open_cells):
+                        if (fr == r or fc == c) and not (row_used[r] | col_used[c]) & bit:
+                            best, best_count, best_free = i, 1, bit
+                            break
+
+        if best is None and not dead:
+            _flush(stats, nodes, backtracks, max_depth, empty_domain=empty_domain, value_no_place=value_no_place)
+            return True
+        if not dead:
+            open_cells[best], open_cells[-1] = open_cells[-1], open_cells[best]
+            r, c = open_cells.pop()
+            remaining = best_free
+        else:
+            # Undo assignments until one still has values to try.
+            while True:
+                if not stack:
+                    _flush(stats, nodes, backtracks, max_depth,
+                           empty_domain=empty_domain, value_no_place=value_no_place)
+                    return False
+                r, c, remaining = stack.pop()
+                backtracks += 1
+                bit = 1 << (board[r][c] - 1)
+                row_used[r] &= ~bit
+                col_used[c] &= ~bit
+                board[r][c] = 0
+                if remaining:
+                    break
+                open_cells.append((r, c))
 
-    # Use a fresh copy
-    board_for_solver = [row[:] for row in input_board]
+        bit = remaining & -remaining
+        board[r][c] = bit.bit_length()
+        row_used[r] |= bit
+        col_used[c] |= bit
+        stack.append((r, c, remaining & ~bit))
+        if len(stack) > max_depth:
+            max_depth = len(stack)
+
+def iddfs(board, n, max_depth=None, stats=None, deadline=None):
+    """Depth-limited search with an explicit stack; returns a filled copy or None.
+
+    Every solution is exactly one level per empty cell deep, so all shallower
+    limits are skipped: the single iteration runs at the empty-cell count and
+    the stack of tried values doubles as the frontier, nothing is recomputed.
+    A `max_depth` below the empty-cell count cannot succeed, and neither
+    can a search still running at `deadline`.
+    """
+    empties = [(r, c) for r in range(n) for c in range(n) if board[r][c] == 0]
+    if max_depth is not None and max_depth < len(empties):
+        if stats is not None:
+            stats.prune("depth_limit")
+        return None
+
+    masks = _used_masks(board, n)
+    if masks is None:
+        if stats is not None:
+            stats.prune("given_conflict")
+        return None
+    row_used, col_used = masks
+    full = (1 << n) - 1
+    out = Board.from_rows(board)
+    tried = [0] * (len(empties) + 1)  # last value placed at each depth, 0 = none yet
+    depth = 0
+    nodes = backtracks = deepest = 0
+    while depth < len(empties):
+        nodes += 1
+        if _expired(deadline, nodes):
+            _flush(stats, nodes, backtracks, deepest, time_limit=1)
+            return None
+        r, c = empties[depth]
+        last = tried[depth]
+        if last:
+            bit = 1 << (last - 1)
+            row_used[r] &= ~bit
+            col_used[c] &= ~bit
+        free = full & ~(row_used[r] | col_used[c]) & ~((1 << last) - 1)
+        if not free:
+            out[r * n + c] = 0
+            tried[depth] = 0
+            depth -= 1
+            backtracks += 1
+            if depth < 0:
+                _flush(stats, nodes, backtracks, deepest)
+                return None
+            continue
+        bit = free & -free
+        num = bit.bit_length()
+        row_used[r] |= bit
+        col_used[c] |= bit
+        out[r * n + c] = num
+        tried[depth] = num
+        depth += 1
+        tried[depth] = 0
+        if depth > deepest:
+            deepest = depth
+    _flush(stats, nodes, backtracks, deepest)
+    return out.to_rows()
+
+def latin_exact_cover(board, n):
+    # Columns: cell (r, c), row-value (r, v) and column-value (c, v), n*n each.
+    row_used = [set(v for v in board[r] if v) for r in range(n)]
+    col_used = [set(board[r][c] for r in range(n) if board[r][c]) for c in range(n)]
+    nn = n * n
+    ec = ExactCover(3 * nn)
+    for r in range(n):
+        for c in range(n):
+            given = board[r][c]
+            for num in ([given] if given else range(1, n + 1)):
+                if not given and (num in row_used[r] or num in col_used[c]):
+                    continue
+                ec.add_row((r, c, num), (r * n + c, nn + r * n + num - 1, 2 * nn + c * n + num - 1))
+    return ec
+
+def latin_dlx(board, n, stats=None, deadline=None):
+    # Out-of-range givens have no matrix column; clashing ones have no cover.
+    if _used_masks(board, n) is None:
+        if stats is not None:
+            stats.prune("given_conflict")
+        return None
+    ec = latin_exact_cover(board, n)
+    cover = ec.first_solution(deadline=deadline)
+    _flush(stats, ec.nodes, ec.backtracks, ec.max_depth, empty_column=ec.dead_ends, time_limit=int(ec.aborted))
+    if cover is None:
+        return None
+    solution_board = [[0] * n for _ in range(n)]
+    for r, c, num in cover:
+        solution_board[r][c] = num
+    return solution_board
+
+def board_from_line(line):
+    """Parse a flat n*n board of space or comma separated numbers (0 = empty)."""
+    values = [int(tok) for tok in line.replace(",", " ").split()]
+    n = int(round(len(values) ** 0.5))
+    if n == 0 or n * n != len(values):
+        raise ValueError(f"expected n*n numbers, got {len(values)}")
+    return [values[r * n:(r + 1) * n] for r in range(n)]
+
+def board_to_line(board):
+    return " ".join(str(v) for row in board for v in row)
+
+def latin_square_solver(input_board, algorithm="Backtracking", depth_limit=None, stats=None, max_time_sec=None):
+    """Solve with the named algorithm; pass a SearchStats as `stats` to have it filled in.
+
+    A search still running after `max_time_sec` returns None and counts a
+    `time_limit` prune.
+    """
+    n = len(input_board)
+    if stats is None:
+        stats = SearchStats()
+    deadline = (time.perf_counter() + max_time_sec) if max_time_sec is not None else None
 
     if algorithm == "Backtracking":
-        solution_board = [row[:] for row in board_for_solver]
-        success = latin_backtrack(solution_board, n)
+        # Fills its board in place, so it gets the only copy; the others never mutate.
+        solution_board = [row[:] for row in input_board]
+        with stats.phase("search"):
+            success = latin_backtrack(solution_board, n, stats, deadline)
         return solution_board if success else None
     elif algorithm == "IDDFS":
-        max_depth = depth_limit or (n * n)
-        solution_board = iddfs([row[:] for row in board_for_solver], n, max_depth)
-        return solution_board
+        with stats.phase("search"):
+            return iddfs(input_board, n, depth_limit or None, stats, deadline)
+    elif algorithm == "DLX":
+        with stats.phase("search"):
+            return latin_dlx(input_board, n, stats, deadline)
     else:
-        raise ValueError("Unsupported algorithm: choose 'Backtracking' or 'IDDFS'")
+        raise ValueError("Unsupported algorithm: choose 'Backtracking', 'IDDFS' or 'DLX'")
@@ -0,0 +1,141 @@
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+from sudoku import SudokuGenerator
+
+LEVELS = ("easy", "medium", "hard")
+RATE_WINDOW_SEC = 60.0
+
+PoolKey = Tuple[str, bool]
+
+
+# ==========================================================
+# Pre-generated Sudoku pool with background refill
+# ==========================================================
+
+class PuzzlePool:
+    """Per (level, unique) queues of ready puzzles kept topped up by daemon threads.
+
+    Workers are started lazily on the first `get()` so that forking servers
+    (gunicorn) start them inside each worker process rather than the master.
+    """
+
+    def __init__(self, size: int = 20, workers: int = 1):
+        self.size = max(0, size)
+        self.workers = max(0, workers)
+        self._queues: Dict[PoolKey, Deque[List[List[int]]]] = {
+            (level, unique): deque() for level in LEVELS for unique in (False, True)
+        }
+        self._cond = threading.Condition()
+        self._threads: List[threading.Thread] = []
+        self._started = False
+        self._stopped = False
+        self._generated_at: Deque[float] = deque()
+        self._total_generated = 0
+        self._hits = 0
+        self._misses = 0
+
+    # ------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------
+
+    def start(self):
+        with self._cond:
+            if self._started or self.size == 0:
+                return
+            self._started = True
+            self._stopped = False
+            for n in range(self.workers):
+                t = threading.Thread(target=self._refill_loop, name=f"sudoku-pool-{n}", daemon=True)
+                t.start()
+                self._threads.append(t)
+
+    def stop(self):
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        for t in self._threads:
+            t.join()
+        self._threads = []
+        self._started = False
+
+    # ------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------
+
+    def get(self,
+            level: str,
+            unique: bool,
+            timeout_sec: Optional[float] = None) -> Tuple[List[List[int]], bool]:
+        """Pop a ready puzzle, or generate one inline when the queue is empty.
+
+        Returns (puzzle, from_pool).
+        """
+        if not self._started:
+            self.start()
+        key = (level, unique)
+        with self._cond:
+            queue = self._queues.get(key)
+            if queue:
+                puzzle = queue.popleft()
+                self._hits += 1
+                self._cond.notify()
+                return puzzle, True
+            self._misses += 1
+            self._cond.notify()
+
+        puzzle = SudokuGenerator().generate_sudoku(level, ensure_unique=unique, timeout_sec=timeout_sec)
+        return puzzle, False
+
+    def stats(self) -> dict:
+        with self._cond:
+            self._trim_rate_window(time.monotonic())
+            return {
+                "size": self.size,
+                "workers": self.workers,
+                "depth": {f"{level}/{'unique' if unique else 'any'}": len(q)
+                          for (level, unique), q in self._queues.items()},
+                "refill_rate_per_sec": round(len(self._generated_at) / RATE_WINDOW_SEC, 3),
+                "total_generated": self._total_generated,
+                "hits": self._hits,
+                "misses": self._misses,
+            }
+
+    # ------------------------------------------------------
+    # Background refill
+    # ------------------------------------------------------
+
+    def _most_depleted(self) -> Optional[PoolKey]:
+        key, depth = None, self.size
+        for k, q in self._queues.items():
+            if len(q) < depth:
+                key, depth = k, len(q)
+        return key
+
+    def _trim_rate_window(self, now: float):
+        while self._generated_at and now - self._generated_at[0] > RATE_WINDOW_SEC:
+            self._generated_at.popleft()
+
+    def _refill_loop(self):
+        gen = SudokuGenerator()
+        while True:
+            with self._cond:
+                key = self._most_depleted()
+                while key is None and not self._stopped:
+                    self._cond.wait()
+                    key = self._most_depleted()
+                if self._stopped:
+                    return
+
+            level, unique = key
+            puzzle = gen.generate_sudoku(level, ensure_unique=unique)
+
+            with self._cond:
+                if len(self._queues[key]) < self.size:
+                    self._queues[key].append(puzzle)
+                now = time.monotonic()
+                self._generated_at.append(now)
+                self._total_generated += 1
+                self._trim_rate_window(now)
@@ -0,0 +1,130 @@
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+MISS = object()
+
+
+# ==========================================================
+# Bounded LRU/TTL result cache with optional SQLite backing
+# ==========================================================
+
+class ResultCache:
+    """In-memory LRU of JSON-serialisable solver results, expiring after `ttl_sec`.
+
+    Entries live under a namespace (one per solver). With `path` set, every
+    entry is also written to a SQLite file and memory misses fall back to it,
+    so results survive restarts; that file keeps at most `max_disk_entries`.
+    """
+
+    def __init__(self,
+                 max_entries: int = 1024,
+                 ttl_sec: Optional[float] = 24 * 3600.0,
+                 path: Optional[str] = None,
+                 max_disk_entries: int = 100_000):
+        self.max_entries = max(0, max_entries)
+        self.ttl_sec = ttl_sec
+        self.path = path
+        self.max_disk_entries = max_disk_entries
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[str, int]] = {}
+        self._db: Optional[sqlite3.Connection] = None
+        if path:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                " namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL,"
+                " stored_at REAL NOT NULL, PRIMARY KEY (namespace, key))"
+            )
+            self._db.commit()
+
+    # ------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------
+
+    def get(self, namespace: str, key: str) -> Any:
+        """Cached value, or MISS."""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get((namespace, key))
+            if entry is not None and self._fresh(entry[0], now):
+                self._entries.move_to_end((namespace, key))
+                self._count(namespace, "hits")
+                return entry[1]
+            if entry is not None:
+                del self._entries[(namespace, key)]
+
+            stored = self._load(namespace, key, now)
+            if stored is None:
+                self._count(namespace, "misses")
+                return MISS
+            self._remember(namespace, key, stored[1], stored[0])
+            self._count(namespace, "hits")
+            return stored[1]
+
+    def put(self, namespace: str, key: str, value: Any):
+        now = time.time()
+        with self._lock:
+            self._remember(namespace, key, value, now)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)",
+                    (namespace, key, json.dumps(value), now),
+                )
+                self._db.execute(
+                    "DELETE FROM results WHERE rowid IN ("
+                    " SELECT rowid FROM results ORDER BY stored_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_disk_entries,),
+                )
+                self._db.commit()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM results")
+                self._db.commit()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_sec": self.ttl_sec,
+                "persistent": self._db is not None,
+                "namespaces": {ns: dict(c) for ns, c in self._counters.items()},
+            }
+
+    # ------------------------------------------------------
+    # Internals (caller holds the lock)
+    # ------------------------------------------------------
+
+    def _fresh(self, stored_at: float, now: float) -> bool:
+        return self.ttl_sec is None or now - stored_at <= self.ttl_sec
+
+    def _remember(self, namespace: str, key: str, value: Any, stored_at: float):
+        if self.max_entries == 0:
+            return
+        self._entries[(namespace, key)] = (stored_at, value)
+        self._entries.move_to_end((namespace, key))
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _load(self, namespace: str, key: str, now: float) -> Optional[Tuple[float, Any]]:
+        if self._db is None:
+            return None
+        row = self._db.execute(
+            "SELECT value, stored_at FROM results WHERE namespace = ? AND key = ?",
+            (namespace, key),
+        ).fetchone()
+        if row is None or not self._fresh(row[1], now):
+            return None
+        return row[1], json.loads(row[0])
+
+    def _count(self, namespace: str, kind: str):
+        counters = self._counters.setdefault(namespace, {"hits": 0, "misses": 0})
+        counters[kind] += 1
@@ -0,0 +1,125 @@
+import os
+import random
+import threading
+from typing import Dict, List, Optional
+
+from board import Board
+from sudoku import SudokuGenerator, shuffle_board
+
+LEVELS = ("easy", "medium", "hard")
+BANK_MAGIC = b"SDKBANK1"
+RECORD_BYTES = 1 + 41  # level index, then 81 cells at 4 bits each
+DEFAULT_PER_LEVEL = 256
+DEFAULT_BANK_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "sudoku_bank.bin")
+
+
+def pack_cells(cells: bytes) -> bytes:
+    """81 cells (0-9) to 41 bytes, two cells per byte."""
+    padded = bytes(cells) + b"\0"
+    return bytes((padded[i] << 4) | padded[i + 1] for i in range(0, 82, 2))
+
+
+def unpack_cells(data: bytes) -> bytes:
+    return bytes(v for b in data for v in (b >> 4, b & 0xF))[:81]
+
+
+# ==========================================================
+# Bank of verified-unique puzzles
+# ==========================================================
+
+class SeedBank:
+    """Verified-unique "mask" puzzles per level, turned into new puzzles by symmetry.
+
+    `derive()` applies the transforms of `shuffle_board`
+    (digit relabeling, rows within bands, bands, columns within stacks,
+    stacks) plus transpose and rotation to a random entry. Every one of these
+    maps solutions to solutions, so the result is unique by construction and
+    keeps its clue count; no solver runs at generation time. Derived puzzles
+    are isomorphic to their bank entry, so variety comes from the bank size.
+
+    The file is read on first use; when it is missing, the bank is generated
+    once and written there. Requests that arrive meanwhile wait for that
+    build instead of starting their own.
+    """
+
+    def __init__(self, path: Optional[str] = DEFAULT_BANK_PATH, per_level: int = DEFAULT_PER_LEVEL):
+        self.path = path
+        self.per_level = per_level
+        self._entries: Optional[Dict[str, List[bytes]]] = None
+        self._lock = threading.Lock()
+        self._gen = SudokuGenerator()
+
+    # ------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------
+
+    def derive(self, level: str) -> List[List[int]]:
+        entries = self._loaded()[level if level in LEVELS else "easy"]
+        board = shuffle_board(Board(9, random.choice(entries)))
+        if random.random() < 0.5:
+            board = board.transpose()
+        return board.rotate(random.randrange(4)).to_rows()
+
+    def stats(self) -> Dict[str, object]:
+        loaded = self._entries is not None
+        return {
+            "path": self.path,
+            "loaded": loaded,
+            "entries": {level: len(v) for level, v in self._entries.items()} if loaded else None,
+        }
+
+    def build(self, per_level: Optional[int] = None) -> Dict[str, List[bytes]]:
+        """Generate a fresh bank with the unique-removal generator and save it."""
+        with self._lock:
+            return self._build_locked(per_level)
+
+    def save(self, entries: Dict[str, List[bytes]]):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(BANK_MAGIC)
+            for k, level in enumerate(LEVELS):
+                for cells in entries[level]:
+                    f.write(bytes((k,)) + pack_cells(cells))
+        os.replace(tmp, self.path)
+
+    # ------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------
+
+    def _loaded(self) -> Dict[str, List[bytes]]:
+        entries = self._entries
+        if entries is not None and all(entries.values()):
+            return entries
+        with self._lock:
+            if self._entries is None:
+                self._entries = self._read()
+            if self._entries is None or not all(self._entries.values()):
+                return self._build_locked()
+            return self._entries
+
+    def _build_locked(self, per_level: Optional[int] = None) -> Dict[str, List[bytes]]:
+        per_level = per_level or self.per_level
+        entries = {
+            level: [bytes(Board.from_rows(self._gen.generate_sudoku(level, ensure_unique=True)).cells)
+                    for _ in range(per_level)]
+            for level in LEVELS
+        }
+        if self.path:
+            self.save(entries)
+        self._entries = entries
+        return entries
+
+    def _read(self) -> Optional[Dict[str, List[bytes]]]:
+        if not self.path or not os.path.exists(self.path):
+            return None
+        with open(self.path, "rb") as f:
+            data = f.read()
+        if not data.startswith(BANK_MAGIC) or (len(data) - len(BANK_MAGIC)) % RECORD_BYTES:
+            raise ValueError(f"{self.path} is not a Sudoku seed bank")
+        entries: Dict[str, List[bytes]] = {level: [] for level in LEVELS}
+        for off in range(len(BANK_MAGIC), len(data), RECORD_BYTES):
+            if data[off] >= len(LEVELS):
+                raise ValueError(f"{self.path}: unknown level {data[off]} at byte {off}")
+            entries[LEVELS[data[off]]].append(unpack_cells(data[off + 1:off + RECORD_BYTES]))
+        return entries
@@ -1,23 +1,86 @@
 import itertools
-from typing import List, Tuple, Set, Optional, Dict, Iterable
+import multiprocessing as mp
+import multiprocessing.connection as mp_connection
+import os
+import random
+import threading
+import time
+from array import array
+from typing import Any, List, Tuple, Set, Optional, Dict, Iterable
+
+from instrument import SearchStats
+
+MASK64 = (1 << 64) - 1
+DEFAULT_MEMO_BUDGET_MB = 16
+PORTFOLIO_REPORT_SEC = 0.25
+LOCAL_SEARCH = "Local Search (Tabu)"
+LOCAL_SEARCH_TIME_SEC = 10.0
+LOCAL_SEARCH_TABU_TENURE = 8
+LOCAL_SEARCH_STALL_ITERS = 2000
 
-# Global state (imported by Flask)
-stop_flag = False
-current_progress: List[List[List[int]]] = []
+# ==========================================================
+# Per-search state
+# ==========================================================
+
+class SearchState:
+    """Stop flag and latest partial schedule of one search.
+
+    The search only publishes a reference to its live schedule and bumps
+    `version` on every change; the JSON-ready copy is built when
+    `current_progress` is read, at most once per version.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.stop_flag = False
+        self.stats: Dict[str, Any] = {}
+        self.search = SearchStats()  # live counters; readable while the search runs
+        self._reported: Tuple[int, Any] = (-1, None)
+        self.version = 0
+        self.live: Optional[List[List[Tuple[int, ...]]]] = None
+        self.deepest: List[List[Tuple[int, ...]]] = []
+        self.final: Optional[List[List[List[int]]]] = None
+        self._snapshot: Tuple[int, List[List[List[int]]]] = (-1, [])
+
+    def freeze(self, schedule: List[List[Tuple[int, ...]]]):
+        """Fix the reported schedule; later changes to the live one are ignored."""
+        self.final = [[list(g) for g in w] for w in schedule]
+        self.version += 1
+
+    @property
+    def current_progress(self) -> List[List[List[int]]]:
+        if self.final is not None:
+            return self.final
+        if self.live is None:
+            return []
+        version = self.version
+        if self._snapshot[0] != version:
+            self._snapshot = (version, [[list(g) for g in w] for w in list(self.live)])
+        return self._snapshot[1]
+
+
+# State used when a caller does not pass its own (one search per process).
+_default_state = SearchState()
 
 
 # ==========================================================
 # Control functions (called from Flask)
 # ==========================================================
 
-def set_stop_flag(value: bool):
-    global stop_flag
-    stop_flag = value
+def get_search_stats(state: Optional[SearchState] = None) -> Dict[str, Any]:
+    state = state or _default_state
+    return {**state.search.as_dict(), **state.stats}
 
 
-def get_progress():
-    global current_progress
-    return current_progress
+def get_progress_and_stats(state: Optional[SearchState] = None):
+    """(progress, stats) for the progress reporter; the same object until the schedule changes."""
+    state = state or _default_state
+    version = state.version
+    if state._reported[0] != version:
+        state._reported = (version, (state.current_progress, get_search_stats(state)))
+    return state._reported[1]
 
 
 # ==========================================================
@@ -42,47 +105,300 @@ def canonical_week(week: List[Tuple[int, ...]]) -> List[Tuple[int, ...]]:
 
 
 # ==========================================================
-# Lazy Week Construction (Backtracking)
+# Bounded transposition table
 # ==========================================================
 
-def _iter_one_week(players: List[int],
-                   group_size: int,
-                   used_pairs_global: Set[Tuple[int, int]]) -> Iterable[List[Tuple[int, ...]]]:
-    """Generate valid 'weeks' lazily."""
-    players = sorted(players)
-    groups_needed = len(players) // group_size
-
-    def rec(week_so_far: List[Tuple[int, ...]],
-            week_pairs: Set[Tuple[int, int]],
-            last_anchor: int):
-        if len(week_so_far) == groups_needed:
-            yield canonical_week(week_so_far.copy())
-            return
+def _zobrist_keys(num_players: int) -> List[List[int]]:
+    """Deterministic 64-bit key per unordered pair (a < b), indexed keys[a][b]."""
+    rng = random.Random(0x5EED)
+    keys = [[0] * (num_players + 1) for _ in range(num_players + 1)]
+    for a in range(1, num_players + 1):
+        for b in range(a + 1, num_players + 1):
+            keys[a][b] = keys[b][a] = rng.getrandbits(64)
+    return keys
+
+
+class TranspositionTable:
+    """Fixed-size memo of visited search states keyed by 64-bit hashes.
+
+    Each bucket holds two entries: a depth-preferred slot that keeps the
+    shallowest state (largest subtree) and an always-replace slot. Keys
+    live in an array('Q') and depths in a bytearray, so memory is fixed at
+    about ENTRY_BYTES per entry regardless of how long the search runs.
+    """
+
+    ENTRY_BYTES = 9
+
+    def __init__(self, budget_bytes: int):
+        buckets = 1
+        while buckets * 4 * self.ENTRY_BYTES <= budget_bytes:
+            buckets *= 2
+        self.mask = buckets - 1
+        self.keys = array("Q", bytes(16 * buckets))
+        self.depths = bytearray(2 * buckets)  # stored depth + 1; 0 means empty
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def capacity(self) -> int:
+        return len(self.depths)
+
+    def seen(self, key: int, depth: int) -> bool:
+        """True if `key` was stored at `depth` or shallower; otherwise store it."""
+        key = key or 1
+        i = (key & self.mask) << 1
+        keys, depths = self.keys, self.depths
+        d = min(depth, 254) + 1
+        for slot in (i, i + 1):
+            if depths[slot] and keys[slot] == key:
+                if depths[slot] <= d:
+                    self.hits += 1
+                    return True
+                depths[slot] = d
+                self.misses += 1
+                return False
 
-        used_players = {p for g in week_so_far for p in g}
-        remaining = [x for x in players if x not in used_players]
+        self.misses += 1
+        if not depths[i] or d <= depths[i]:
+            if depths[i + 1]:
+                self.evictions += 1
+            keys[i + 1], depths[i + 1] = keys[i], depths[i]
+            keys[i], depths[i] = key, d
+        else:
+            if depths[i + 1]:
+                self.evictions += 1
+            keys[i + 1], depths[i + 1] = key, d
+        return False
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "memo_hits": self.hits,
+            "memo_misses": self.misses,
+            "memo_evictions": self.evictions,
+            "memo_capacity": self.capacity,
+            "memo_bytes": len(self.keys) * self.keys.itemsize + len(self.depths),
+        }
+
+
+# ==========================================================
+# Closed-form Constructions
+# ==========================================================
+
+def _prime_power(q: int) -> Optional[Tuple[int, int]]:
+    """(p, m) with q == p ** m for a prime p, or None."""
+    if q < 2:
+        return None
+    p = next(d for d in range(2, q + 1) if q % d == 0)
+    m = 0
+    while q % p == 0:
+        q //= p
+        m += 1
+    return (p, m) if q == 1 else None
+
+
+def _gf_tables(p: int, m: int) -> Tuple[List[List[int]], List[List[int]]]:
+    """Addition and multiplication tables of GF(p^m).
+
+    Elements are integers whose base-p digits are polynomial coefficients;
+    multiplication is modulo the first irreducible monic polynomial of degree m.
+    """
+    q = p ** m
+
+    def digits(x: int, n: int) -> List[int]:
+        return [(x // p ** i) % p for i in range(n)]
+
+    def poly_mod(a: List[int], mod: List[int]) -> List[int]:
+        a = a[:]
+        for i in range(len(a) - 1, len(mod) - 2, -1):
+            c = a[i]
+            if c:
+                for j, mc in enumerate(mod):
+                    a[i - len(mod) + 1 + j] = (a[i - len(mod) + 1 + j] - c * mc) % p
+        return a[:len(mod) - 1]
+
+    def poly_mul(a: List[int], b: List[int]) -> List[int]:
+        out = [0] * (len(a) + len(b) - 1)
+        for i, x in enumerate(a):
+            if x:
+                for j, y in enumerate(b):
+                    out[i + j] = (out[i + j] + x * y) % p
+        return out
+
+    def irreducible(poly: List[int]) -> bool:
+        for d in range(1, m // 2 + 1):
+            for low in range(p ** d):
+                if not any(poly_mod(poly, digits(low, d) + [1])):
+                    return False
+        return True
 
-        for i, anchor in enumerate(remaining):
-            if anchor <= last_anchor:
+    modulus = next(digits(low, m) + [1] for low in range(p ** m) if irreducible(digits(low, m) + [1]))
+
+    def encode(coeffs: List[int]) -> int:
+        return sum(c * p ** i for i, c in enumerate(coeffs))
+
+    add = [[encode([(x + y) % p for x, y in zip(digits(a, m), digits(b, m))]) for b in range(q)]
+           for a in range(q)]
+    mul = [[encode(poly_mod(poly_mul(digits(a, m), digits(b, m)) + [0] * m, modulus)) for b in range(q)]
+           for a in range(q)]
+    return add, mul
+
+
+def _round_robin(num_players: int) -> List[List[Tuple[int, ...]]]:
+    """Circle method: num_players - 1 weeks of pairs, every pair exactly once."""
+    n = num_players
+    weeks = []
+    for r in range(n - 1):
+        ring = [n] + [(r + i) % (n - 1) + 1 for i in range(n - 1)]
+        weeks.append(canonical_week([(ring[i], ring[n - 1 - i]) for i in range(n // 2)]))
+    return weeks
+
+
+def _affine_geometry(q: int, k: int) -> List[List[Tuple[int, ...]]]:
+    """Parallel classes of lines in AG(k, q): (q^k - 1) / (q - 1) weeks of groups of q.
+
+    Points are vectors over GF(q) numbered 1..q^k; every direction (a vector
+    whose first non-zero coordinate is 1) gives one week whose groups are the
+    lines {x + t*d}. Two points lie on exactly one line, so no pair repeats.
+    """
+    p, m = _prime_power(q)
+    add, mul = _gf_tables(p, m)
+    n = q ** k
+
+    def vec(x: int) -> List[int]:
+        return [(x // q ** i) % q for i in range(k)]
+
+    def num(v: List[int]) -> int:
+        return sum(c * q ** i for i, c in enumerate(v))
+
+    points = [vec(x) for x in range(n)]
+    weeks = []
+    for d in points[1:]:
+        lead = next(c for c in reversed(d) if c)
+        if lead != 1:
+            continue
+        seen = [False] * n
+        week = []
+        for x in range(n):
+            if seen[x]:
                 continue
-            pool = remaining[i + 1:]
-            for mates in itertools.combinations(pool, group_size - 1):
-                group = tuple(sorted((anchor, *mates)))
-                ps = pairs_of(group)
-                if ps & used_pairs_global or ps & week_pairs:
-                    continue
+            line = []
+            for t in range(q):
+                y = num([add[a][mul[t][b]] for a, b in zip(points[x], d)])
+                seen[y] = True
+                line.append(y + 1)
+            week.append(tuple(sorted(line)))
+        weeks.append(canonical_week(week))
+    return weeks
+
+
+def _construct_schedule(num_players: int, group_size: int) -> Optional[Tuple[str, List[List[Tuple[int, ...]]]]]:
+    """Optimal schedule for a known family, as (family name, weeks), or None."""
+    if group_size < 2 or num_players % group_size != 0:
+        return None
+    if group_size == 2:
+        return "round-robin", _round_robin(num_players)
+    if _prime_power(group_size):
+        k, n = 1, group_size
+        while n < num_players:
+            n *= group_size
+            k += 1
+        if n == num_players and k >= 2:
+            return f"affine geometry AG({k},{group_size})", _affine_geometry(group_size, k)
+    return None
+
+
+def _valid_schedule(schedule: List[List[Tuple[int, ...]]], num_players: int) -> bool:
+    everyone = list(range(1, num_players + 1))
+    used: Set[Tuple[int, int]] = set()
+    for week in schedule:
+        if sorted(p for g in week for p in g) != everyone:
+            return False
+        for g in week:
+            ps = pairs_of(g)
+            if ps & used:
+                return False
+            used |= ps
+    return True
 
-                week_so_far.append(group)
-                for pp in ps:
-                    week_pairs.add(pp)
 
-                yield from rec(week_so_far, week_pairs, anchor)
+# ==========================================================
+# Lazy Week Construction (Backtracking)
+# ==========================================================
 
-                week_so_far.pop()
-                for pp in ps:
-                    week_pairs.discard(pp)
+def _iter_one_week(num_players: int,
+                   group_size: int,
+                   met: List[int],
+                   after: Optional[Tuple[int, ...]] = None,
+                   first_group: Optional[Tuple[int, ...]] = None,
+                   rng: Optional[random.Random] = None
+                   ) -> Iterable[Tuple[List[Tuple[int, ...]], List[int]]]:
+    """Generate valid 'weeks' lazily, in canonical (lexicographic) order.
+
+    `met[p]` is the bitmask of players p has already played with (bit i is
+    player i). Yields (groups, group_masks) pairs; the groups are sorted and
+    each is anchored on the lowest player not yet placed this week. With
+    `after` (a flattened week) only strictly greater weeks are produced, and
+    `first_group` pins the group of player 1. An `rng` shuffles the order in
+    which mates are tried (groups stay sorted, weeks stay valid).
+    """
+    week: List[Tuple[int, ...]] = []
+    masks: List[int] = []
+    first_mask = sum(1 << p for p in first_group) if first_group else 0
+
+    def pick(group: Tuple[int, ...], free: int, gmask: int, allowed: int, need: int, tight: bool):
+        if need == 0:
+            week.append(group)
+            masks.append(gmask)
+            yield from rec(free & ~gmask, tight)
+            week.pop()
+            masks.pop()
+            return
+        if tight:
+            bound = after[len(week) * group_size + len(group)]
+            allowed &= ~((1 << bound) - 1)
+        if rng is not None:
+            bits = []
+            rest = allowed
+            while rest:
+                bit = rest & -rest
+                rest ^= bit
+                bits.append(bit)
+            rng.shuffle(bits)
+            for bit in bits:
+                above = allowed & ~((bit << 1) - 1)
+                if above.bit_count() < need - 1:
+                    continue
+                b = bit.bit_length() - 1
+                yield from pick(group + (b,), free, gmask | bit, above & ~met[b], need - 1,
+                                tight and b == bound)
+            return
+        while allowed and allowed.bit_count() >= need:
+            bit = allowed & -allowed
+            allowed ^= bit
+            b = bit.bit_length() - 1
+            yield from pick(group + (b,), free, gmask | bit, allowed & ~met[b], need - 1,
+                            tight and b == bound)
+
+    def rec(free: int, tight: bool):
+        if not free:
+            if not tight:
+                yield list(week), list(masks)
+            return
+        bit = free & -free
+        a = bit.bit_length() - 1
+        if tight:
+            bound = after[len(week) * group_size]
+            if a < bound:
+                return
+            tight = a == bound
+        allowed = free & ~bit & ~met[a]
+        if first_mask and not week:
+            allowed &= first_mask
+        yield from pick((a,), free, bit, allowed, group_size - 1, tight)
 
-    yield from rec([], set(), -1)
+    all_players = ((1 << num_players) - 1) << 1
+    yield from rec(all_players, after is not None)
 
 
 # ==========================================================
@@ -91,10 +407,21 @@ def _iter_one_week(players: List[int],
 
 def _search_weeks(num_players: int,
                   group_size: int,
-                  target_weeks: int) -> List[List[List[int]]]:
-    """Backtracking search with stop & progress tracking."""
-
-    global stop_flag, current_progress
+                  target_weeks: int,
+                  state: SearchState,
+                  symmetry_breaking: bool = False,
+                  memo_budget_mb: float = DEFAULT_MEMO_BUDGET_MB,
+                  seed: Optional[int] = None) -> List[List[List[int]]]:
+    """Backtracking search with stop & progress tracking.
+
+    A `seed` randomizes the order in which groups are tried.
+
+    With `symmetry_breaking`, week 1 is fixed to the canonical partition,
+    later weeks must be in strictly increasing lexicographic order, and (when
+    there are at least `group_size` groups) player 1's week-2 group is pinned
+    to the first member of week-1 groups 1..group_size. Player 1 is always in
+    the first group of every week through the canonical week order.
+    """
 
     all_players = list(range(1, num_players + 1))
     groups_per_week = num_players // group_size
@@ -102,89 +429,440 @@ def _search_weeks(num_players: int,
     pairs_per_week = groups_per_week * pairs_per_group
     total_pairs = (num_players * (num_players - 1)) // 2
 
-    best_so_far: List[List[Tuple[int, ...]]] = []
-    seen_depth: Dict[frozenset, int] = {}
-    dead_state: Set[frozenset] = set()
+    # met[p]: bitmask of players p has already been grouped with.
+    met = [0] * (num_players + 1)
 
-    def admissible_can_reach(depth_now: int, used_pairs_count: int) -> bool:
-        remaining_pairs = total_pairs - used_pairs_count
+    first_week = [tuple(range(g * group_size + 1, (g + 1) * group_size + 1))
+                  for g in range(groups_per_week)]
+    second_first_group = None
+    if groups_per_week >= group_size:
+        second_first_group = tuple(g * group_size + 1 for g in range(group_size))
+
+    best_so_far: List[List[Tuple[int, ...]]] = []
+    deepest: List[List[Tuple[int, ...]]] = []
+    state.deepest = deepest
+    rng = random.Random(seed) if seed is not None else None
+    zkeys = _zobrist_keys(num_players)
+    zhash = [0]
+    memo = TranspositionTable(int(memo_budget_mb * 1024 * 1024))
+    search = state.search
+
+    def admissible_can_reach(depth_now: int) -> bool:
+        remaining_pairs = total_pairs - depth_now * pairs_per_week
         max_additional_weeks = remaining_pairs // pairs_per_week
         return (depth_now + max_additional_weeks) >= target_weeks
 
-    def forward_check(used_pairs_map: Set[Tuple[int, int]], depth_now: int) -> bool:
-        adj: Dict[int, Set[int]] = {i: set() for i in all_players}
-        for a, b in used_pairs_map:
-            adj[a].add(b)
-            adj[b].add(a)
-
+    def forward_check(depth_now: int) -> bool:
         remaining_weeks = target_weeks - (depth_now + 1)
         if remaining_weeks <= 0:
             return True
         need = remaining_weeks * (group_size - 1)
+        max_seen = (num_players - 1) - need
         for pl in all_players:
-            unseen = (num_players - 1) - len(adj[pl])
-            if unseen < need:
+            if met[pl].bit_count() > max_seen:
                 return False
         return True
 
-    def dfs_build(schedule: List[List[Tuple[int, ...]]],
-                  used_pairs: Set[Tuple[int, int]]):
-        global stop_flag, current_progress
-
-        if stop_flag:
-            current_progress = [[list(g) for g in w] for w in schedule]
+    def week_hash(week: List[Tuple[int, ...]]) -> int:
+        h = 0
+        for g in week:
+            for a, b in itertools.combinations(g, 2):
+                h ^= zkeys[a][b]
+        return h
+
+    def apply_week(masks: List[int]):
+        for gm in masks:
+            rest = gm
+            while rest:
+                bit = rest & -rest
+                rest ^= bit
+                met[bit.bit_length() - 1] |= gm ^ bit
+
+    def undo_week(masks: List[int]):
+        for gm in masks:
+            rest = gm
+            while rest:
+                bit = rest & -rest
+                rest ^= bit
+                met[bit.bit_length() - 1] &= ~(gm ^ bit)
+
+    def dfs_build(schedule: List[List[Tuple[int, ...]]]):
+        if state.stop_flag:
+            state.freeze(schedule)
             return
 
         depth_now = len(schedule)
+        search.nodes += 1
+        if depth_now > search.max_depth:
+            search.max_depth = depth_now
 
         if depth_now >= target_weeks:
             best_so_far[:] = [wk.copy() for wk in schedule]
-            current_progress = [[list(g) for g in w] for w in schedule]
+            state.freeze(schedule)
             return
 
-        if not admissible_can_reach(depth_now, len(used_pairs)):
+        if not admissible_can_reach(depth_now):
+            search.prune("admissible_can_reach")
             return
-        if not forward_check(used_pairs, depth_now):
+        if not forward_check(depth_now):
+            search.prune("forward_check")
             return
 
-        key = frozenset(used_pairs)
-        prev_depth = seen_depth.get(key, -1)
-        if prev_depth >= depth_now:
+        # The lexicographic bound depends on the last week, so it is part of the state.
+        after = None
+        first_group = None
+        key = zhash[0]
+        if symmetry_breaking:
+            last = tuple(p for g in schedule[-1] for p in g)
+            key ^= (hash(last) * 0x9E3779B97F4A7C15) & MASK64
+            if depth_now >= 2:
+                after = last
+            else:
+                first_group = second_first_group
+        if memo.seen(key, depth_now):
+            search.prune("memo")
             return
-        seen_depth[key] = depth_now
 
-        if key in dead_state:
-            return
-
-        for next_week in _iter_one_week(all_players, group_size, used_pairs):
-            if stop_flag:
-                current_progress = [[list(g) for g in w] for w in schedule]
+        for next_week, masks in _iter_one_week(num_players, group_size, met, after, first_group, rng):
+            if state.stop_flag:
+                state.freeze(schedule)
                 return
 
-            new_pairs_this_week = set().union(*(pairs_of(g) for g in next_week))
             schedule.append(next_week)
-            used_before = used_pairs
-            used_pairs = used_pairs | new_pairs_this_week
+            apply_week(masks)
+            delta = week_hash(next_week)
+            zhash[0] ^= delta
 
-            current_progress = [[list(g) for g in w] for w in schedule]
+            state.version += 1
+            if len(schedule) > len(deepest):
+                deepest[:] = schedule
 
-            dfs_build(schedule, used_pairs)
+            dfs_build(schedule)
 
             schedule.pop()
-            used_pairs = used_before
+            state.version += 1
+            undo_week(masks)
+            zhash[0] ^= delta
 
-            if len(best_so_far) >= target_weeks or stop_flag:
+            if len(best_so_far) >= target_weeks or state.stop_flag:
                 return
+            search.backtracks += 1
+
+    if target_weeks <= 0:
+        return []
+    if (num_players <= 0) or (group_size < 2) or (num_players % group_size != 0):
+        return []
+
+    if symmetry_breaking:
+        apply_week([sum(1 << p for p in g) for g in first_week])
+        zhash[0] ^= week_hash(first_week)
+        schedule = [first_week]
+        deepest[:] = schedule
+        if target_weeks <= 1:
+            state.freeze(schedule)
+            return state.final
+    else:
+        schedule = []
+    state.live = schedule
+    with search.phase("search"):
+        dfs_build(schedule)
+    if state.final is None:
+        # Search space exhausted: report the deepest partial schedule reached.
+        state.freeze(deepest)
+    state.stats.update(memo.stats())
+    return state.final
 
-        dead_state.add(key)
 
+# ==========================================================
+# Local Search (Tabu) for large instances
+# ==========================================================
+
+def _local_search_weeks(num_players: int,
+                        group_size: int,
+                        target_weeks: int,
+                        state: SearchState,
+                        time_limit: float = LOCAL_SEARCH_TIME_SEC,
+                        seed: Optional[int] = None) -> List[List[List[int]]]:
+    """Tabu search over whole schedules, growing one week at a time.
+
+    The cost is the number of repeated meetings (sum of count - 1 over pairs
+    that met more than once). A move swaps a conflicting player with a player
+    from another group of the same week; its delta is computed from the pair
+    count matrix in O(group_size). Whenever the cost reaches zero the schedule
+    is recorded and a random week is appended, until `target_weeks` is reached,
+    the time budget runs out or the search is stopped. Returns the longest
+    conflict-free schedule found.
+    """
     if target_weeks <= 0:
         return []
     if (num_players <= 0) or (group_size < 2) or (num_players % group_size != 0):
         return []
 
-    dfs_build(schedule=[], used_pairs=set())
-    return [[list(group) for group in week] for week in current_progress]
+    rng = random.Random(seed)
+    n = num_players
+    groups_per_week = n // group_size
+    deadline = time.perf_counter() + time_limit
+
+    count = [[0] * (n + 1) for _ in range(n + 1)]
+    weeks: List[List[List[int]]] = []
+    where: List[List[int]] = []
+    tabu: List[List[int]] = []
+    cost = 0
+    best_valid: List[List[Tuple[int, ...]]] = []
+    state.live = best_valid
+    search = state.search
+    iterations = 0
+    tabu_skips = 0
+
+    def add_week():
+        # Greedy start: each player joins the open group it has met least.
+        nonlocal cost
+        players = list(range(1, n + 1))
+        rng.shuffle(players)
+        week: List[List[int]] = [[] for _ in range(groups_per_week)]
+        for p in players:
+            open_groups = [grp for grp in week if len(grp) < group_size]
+            rng.shuffle(open_groups)
+            min(open_groups, key=lambda grp: sum(count[p][q] for q in grp)).append(p)
+        pos = [0] * (n + 1)
+        for gi, grp in enumerate(week):
+            for p in grp:
+                pos[p] = gi
+            for a, b in itertools.combinations(grp, 2):
+                if count[a][b] >= 1:
+                    cost += 1
+                count[a][b] += 1
+                count[b][a] += 1
+        weeks.append(week)
+        where.append(pos)
+        tabu.append([0] * (n + 1))
+
+    def swap_delta(w: int, x: int, y: int) -> int:
+        d = 0
+        for z in weeks[w][where[w][x]]:
+            if z != x:
+                d += (count[y][z] >= 1) - (count[x][z] >= 2)
+        for z in weeks[w][where[w][y]]:
+            if z != y:
+                d += (count[x][z] >= 1) - (count[y][z] >= 2)
+        return d
+
+    def do_swap(w: int, x: int, y: int):
+        gx, gy = where[w][x], where[w][y]
+        grp_x, grp_y = weeks[w][gx], weeks[w][gy]
+        for z in grp_x:
+            if z != x:
+                count[x][z] -= 1
+                count[z][x] -= 1
+                count[y][z] += 1
+                count[z][y] += 1
+        for z in grp_y:
+            if z != y:
+                count[y][z] -= 1
+                count[z][y] -= 1
+                count[x][z] += 1
+                count[z][x] += 1
+        grp_x[grp_x.index(x)] = y
+        grp_y[grp_y.index(y)] = x
+        where[w][x], where[w][y] = gy, gx
+
+    def conflicted_weeks() -> List[int]:
+        return [w for w, week in enumerate(weeks)
+                if any(count[a][b] >= 2 for grp in week for a, b in itertools.combinations(grp, 2))]
+
+    def conflicted_players(w: int) -> List[int]:
+        found = set()
+        for grp in weeks[w]:
+            for a, b in itertools.combinations(grp, 2):
+                if count[a][b] >= 2:
+                    found.add(a)
+                    found.add(b)
+        return list(found)
+
+    add_week()
+    best_cost = cost
+    stall = 0
+    while True:
+        if cost == 0:
+            best_valid[:] = [canonical_week([tuple(g) for g in wk]) for wk in weeks]
+            search.max_depth = len(best_valid)
+            state.version += 1
+            if len(weeks) >= target_weeks:
+                break
+            add_week()
+            best_cost = cost
+            stall = 0
+            continue
+
+        if state.stop_flag or time.perf_counter() >= deadline:
+            break
+        iterations += 1
+        search.nodes = iterations
+
+        # Best non-tabu swap of any conflicting player within its week
+        # (tabu moves are allowed when they beat the best cost so far).
+        best_move, best_delta, ties = None, None, 0
+        for w, x in [(w, x) for w in conflicted_weeks() for x in conflicted_players(w)]:
+            for y in range(1, n + 1):
+                if where[w][y] == where[w][x]:
+                    continue
+                d = swap_delta(w, x, y)
+                is_tabu = tabu[w][x] > iterations or tabu[w][y] > iterations
+                if is_tabu and cost + d >= best_cost:
+                    tabu_skips += 1
+                    continue
+                if best_delta is None or d < best_delta:
+                    best_move, best_delta, ties = (w, x, y), d, 1
+                elif d == best_delta:
+                    ties += 1
+                    if rng.randrange(ties) == 0:
+                        best_move = (w, x, y)
+        if best_move is None:
+            continue
+
+        w, x, y = best_move
+        do_swap(w, x, y)
+        cost += best_delta
+        tenure = LOCAL_SEARCH_TABU_TENURE + rng.randrange(LOCAL_SEARCH_TABU_TENURE)
+        tabu[w][x] = tabu[w][y] = iterations + tenure
+
+        if cost < best_cost:
+            best_cost, stall = cost, 0
+        else:
+            stall += 1
+            if stall >= LOCAL_SEARCH_STALL_ITERS:
+                search.prune("perturbation")
+                # Perturb: a few random swaps in random weeks.
+                for _ in range(groups_per_week):
+                    pw = rng.randrange(len(weeks))
+                    a, b = rng.sample(range(1, n + 1), 2)
+                    if where[pw][a] != where[pw][b]:
+                        cost += swap_delta(pw, a, b)
+                        do_swap(pw, a, b)
+                best_cost, stall = cost, 0
+
+    search.prune("tabu", tabu_skips)
+    state.stats.update({"local_search_iterations": iterations, "local_search_conflicts": cost})
+    state.freeze(best_valid)
+    return state.final
+
+
+# ==========================================================
+# Parallel Portfolio
+# ==========================================================
+
+def _portfolio_worker(conn, stop_event, num_players, group_size, target,
+                      symmetry_breaking, memo_budget_mb, seed):
+    """Run one search variant; stream its deepest partial schedule, then the result."""
+    state = SearchState()
+    send_lock = threading.Lock()
+    parent = os.getppid()
+    finished = threading.Event()
+
+    def watch():
+        reported = 0
+        while not finished.wait(PORTFOLIO_REPORT_SEC):
+            # Stop when another worker won or the coordinating process died.
+            if stop_event.is_set() or os.getppid() != parent:
+                state.stop_flag = True
+                return
+            deepest = list(state.deepest)
+            if len(deepest) > reported:
+                reported = len(deepest)
+                with send_lock:
+                    if finished.is_set():
+                        return
+                    conn.send(("progress", [[list(g) for g in w] for w in deepest],
+                               get_search_stats(state)))
+
+    threading.Thread(target=watch, daemon=True).start()
+    schedule = _search_weeks(num_players, group_size, target, state,
+                             symmetry_breaking, memo_budget_mb, seed)
+    finished.set()
+    with send_lock:
+        conn.send(("done", schedule, get_search_stats(state)))
+        conn.close()
+
+
+def _portfolio_variants(workers: int, symmetry_breaking: bool, seed: int) -> List[Tuple[bool, Optional[int]]]:
+    """(symmetry_breaking, seed) per worker: the requested search, its symmetry
+    toggle, then randomized orderings alternating both settings."""
+    variants: List[Tuple[bool, Optional[int]]] = [(symmetry_breaking, None), (not symmetry_breaking, None)]
+    k = 0
+    while len(variants) < workers:
+        variants.append((symmetry_breaking if k % 2 == 0 else not symmetry_breaking, seed + k))
+        k += 1
+    return variants[:workers]
+
+
+def _portfolio_search(num_players: int,
+                      group_size: int,
+                      target: int,
+                      state: SearchState,
+                      workers: int,
+                      symmetry_breaking: bool,
+                      memo_budget_mb: float,
+                      seed: Optional[int]) -> List[List[List[int]]]:
+    """Race `workers` search variants; the first one to finish wins.
+
+    The deepest partial schedule seen from any worker is published on
+    `state`, so a caller that times out still gets the best partial result.
+    """
+    if seed is None:
+        seed = random.randrange(1 << 30)
+    variants = _portfolio_variants(workers, symmetry_breaking, seed)
+    state.stats.update({"portfolio_workers": workers, "portfolio_seed": seed})
+
+    ctx = mp.get_context("fork") if "fork" in mp.get_all_start_methods() else mp.get_context()
+    stop_event = ctx.Event()
+    conns = {}
+    procs = []
+    for k, (sym, worker_seed) in enumerate(variants):
+        parent_conn, child_conn = ctx.Pipe(duplex=False)
+        proc = ctx.Process(
+            target=_portfolio_worker,
+            args=(child_conn, stop_event, num_players, group_size, target,
+                  sym, memo_budget_mb / workers, worker_seed),
+            daemon=True,
+        )
+        proc.start()
+        child_conn.close()
+        conns[parent_conn] = k
+        procs.append(proc)
+
+    best: List[List[List[int]]] = []
+    winner = None
+    try:
+        while conns and winner is None and not state.stop_flag:
+            for conn in mp_connection.wait(list(conns), timeout=PORTFOLIO_REPORT_SEC):
+                try:
+                    kind, schedule, worker_stats = conn.recv()
+                except EOFError:
+                    del conns[conn]
+                    continue
+                if len(schedule) > len(best):
+                    best = schedule
+                    # The stats follow the worker that reported the deepest schedule.
+                    state.stats.update(worker_stats)
+                    state.freeze(best)
+                if kind == "done":
+                    # Every variant is exhaustive, so the first finisher is decisive
+                    # whether it found a full schedule or proved there is none.
+                    winner = conns[conn]
+                    state.stats.update(worker_stats)
+                    break
+    finally:
+        stop_event.set()
+        for proc in procs:
+            if proc.is_alive():
+                proc.terminate()
+            proc.join()
+        for conn in conns:
+            conn.close()
+
+    state.stats["portfolio_winner"] = winner if winner is not None else -1
+    state.freeze(best)
+    return state.final
 
 
 # ==========================================================
@@ -194,18 +872,52 @@ def _search_weeks(num_players: int,
 def find_max_weeks(num_players: int,
                    group_size: int,
                    algorithm: str = "Depth-First Search (DFS)",
-                   depth_limit: Optional[int] = None) -> Tuple[List[List[List[int]]], int]:
-    """Public API entry used by app.py."""
-    global stop_flag, current_progress
-    stop_flag = False
-    current_progress = []
+                   depth_limit: Optional[int] = None,
+                   state: Optional[SearchState] = None,
+                   symmetry_breaking: bool = False,
+                   memo_budget_mb: float = DEFAULT_MEMO_BUDGET_MB,
+                   workers: int = 1,
+                   seed: Optional[int] = None,
+                   time_limit: Optional[float] = None,
+                   use_constructions: bool = True) -> Tuple[List[List[List[int]]], int]:
+    """Public API entry used by app.py.
+
+    With `workers` > 1 a portfolio of differently ordered searches runs in
+    parallel processes (see _portfolio_search); otherwise a single search
+    runs in this process, randomized when `seed` is given. The local-search
+    algorithm returns its best schedule within `time_limit` seconds.
+
+    Instances from a known family (round-robin pairs, q^k players in groups
+    of a prime power q) are answered by construction without searching.
+    """
+    state = state or _default_state
+    state.reset()
 
     cap = calculate_max_theoretical_weeks(num_players, group_size)
 
-    if algorithm == "Depth-Limited Search (DLS)" and depth_limit is not None:
+    if algorithm in ("Depth-Limited Search (DLS)", LOCAL_SEARCH) and depth_limit is not None:
         target = max(1, min(int(depth_limit), cap))
     else:
         target = cap
 
-    schedule = _search_weeks(num_players, group_size, target)
+    constructed = None
+    if use_constructions:
+        with state.search.phase("construction"):
+            constructed = _construct_schedule(num_players, group_size)
+    if constructed and target > 0 and _valid_schedule(constructed[1], num_players):
+        family, weeks = constructed
+        state.stats["construction"] = family
+        state.search.max_depth = min(len(weeks), target)
+        state.freeze(weeks[:target])
+        schedule = state.final
+    elif algorithm == LOCAL_SEARCH:
+        with state.search.phase("search"):
+            schedule = _local_search_weeks(num_players, group_size, target, state,
+                                           time_limit or LOCAL_SEARCH_TIME_SEC, seed)
+    elif workers > 1 and target > 0 and group_size >= 2 and num_players % group_size == 0:
+        schedule = _portfolio_search(num_players, group_size, target, state, workers,
+                                     symmetry_breaking, memo_budget_mb, seed)
+    else:
+        schedule = _search_weeks(num_players, group_size, target, state,
+                                 symmetry_breaking, memo_budget_mb, seed)
     return schedule, len(schedule)
@@ -1,5 +1,75 @@
 let isRunning = false;
-let controller = null;
+let currentJobId = null;
+let progressSource = null;
+
+function formatSchedule(schedule) {
+    let result = "";
+    schedule.forEach((week, i) => {
+        result += `Week ${i + 1}:\n`;
+        week.forEach((group, j) => {
+            result += `  Group ${j + 1}: ${group.join(", ")}\n`;
+        });
+        result += "\n";
+    });
+    return result;
+}
+
+function stopListening() {
+    if (progressSource) progressSource.close();
+    progressSource = null;
+    isRunning = false; // ✅ reset when done
+}
+
+function showResult(data, algorithm) {
+    const output = document.getElementById("output");
+
+    if (data.status === "failed") {
+        output.innerText = "No valid schedule found." + (data.error ? `\n${data.error}` : "");
+        return;
+    }
+
+    let result = "";
+    if (data.status === "stopped") {
+        result += "Solver stopped by user.\n";
+    } else if (data.status === "timed_out") {
+        result += "Solver timed out.\n";
+    }
+    if (data.status !== "done" && data.schedule.length === 0) {
+        output.innerText = result + "No partial results found.";
+        return;
+    }
+
+    result += `Algorithm Used: ${algorithm}\n`;
+    result += `Elapsed Time: ${data.elapsed_time}s\n`;
+    result += `Weeks Found${data.status === "done" ? "" : " So Far"}: ${data.weeks}\n\n`;
+    result += formatSchedule(data.schedule);
+    output.innerText = result;
+}
+
+// Progress is pushed by the server (Server-Sent Events) instead of polled.
+function listenForProgress(jobId, algorithm) {
+    const output = document.getElementById("output");
+    progressSource = new EventSource(`/progress/${jobId}/stream`);
+
+    progressSource.addEventListener("progress", (e) => {
+        const data = JSON.parse(e.data);
+        output.innerText = `Solving... please wait...\nWeeks Found So Far: ${data.weeks}`;
+    });
+
+    progressSource.addEventListener("done", (e) => {
+        stopListening();
+        showResult(JSON.parse(e.data), algorithm);
+    });
+
+    progressSource.onerror = () => {
+        if (!progressSource) return;
+        stopListening();
+        fetch(`/result/${jobId}`)
+            .then(res => res.json())
+            .then(data => showResult(data, algorithm))
+            .catch(err => { output.innerText = "Error: " + err; });
+    };
+}
 
 document.getElementById("solveBtn").addEventListener("click", async () => {
     if (isRunning) {
@@ -11,106 +81,45 @@ document.getElementById("solveBtn").addEventListener("click", async () => {
     const group_size = parseInt(document.getElementById("group_size").value);
     const algorithm = document.getElementById("algorithm").value;
     const depth_limit = document.getElementById("depth_limit").value;
+    const symmetry_breaking = document.getElementById("symmetry_breaking").checked;
     const output = document.getElementById("output");
 
     output.innerText = "Solving... please wait...";
     isRunning = true;
-    controller = new AbortController();
 
     try {
         const response = await fetch("/solve", {
             method: "POST",
             headers: { "Content-Type": "application/json" },
-            signal: controller.signal,
             body: JSON.stringify({
                 num_players,
                 group_size,
                 algorithm,
-                depth_limit: depth_limit || null
+                depth_limit: depth_limit || null,
+                symmetry_breaking
             })
         });
 
         const data = await response.json();
-        isRunning = false; // ✅ reset when done
-
-        if (!data.success) {
+        if (!data.job_id) {
+            isRunning = false;
             output.innerText = "No valid schedule found.";
             return;
         }
 
-        let result = `Algorithm Used: ${algorithm}\n`;
-        result += `Elapsed Time: ${data.elapsed_time}s\n`;
-        result += `Weeks Found: ${data.weeks}\n\n`;
-
-        data.schedule.forEach((week, i) => {
-            result += `Week ${i + 1}:\n`;
-            week.forEach((group, j) => {
-                result += `  Group ${j + 1}: ${group.join(", ")}\n`;
-            });
-            result += "\n";
-        });
-
-        output.innerText = result;
+        currentJobId = data.job_id;
+        listenForProgress(currentJobId, algorithm);
 
     } catch (err) {
-        // --- Solver was manually stopped by user ---
-        if (err.name === "AbortError") {
-            isRunning = false; // ✅ reset running flag
-            output.innerText = "Solver stopped by user.\nShowing progress so far...";
-
-            // Fetch progress from backend
-            fetch("/progress")
-                .then(res => res.json())
-                .then(data => {
-                    if (data.schedule) {
-                        let result = `Weeks Found So Far: ${data.weeks}\n\n`;
-                        data.schedule.forEach((week, i) => {
-                            result += `Week ${i + 1}:\n`;
-                            week.forEach((group, j) => {
-                                result += `  Group ${j + 1}: ${group.join(", ")}\n`;
-                            });
-                            result += "\n";
-                        });
-                        output.innerText = result;
-                    }
-                })
-                .catch(e => {
-                    output.innerText = "Stopped, but failed to fetch progress.";
-                });
-
-        } else {
-            // --- Any other error ---
-            isRunning = false; // ✅ reset
-            output.innerText = "Error: " + err;
-        }
+        isRunning = false; // ✅ reset
+        output.innerText = "Error: " + err;
     }
 });
 
 // ---------------- STOP BUTTON HANDLER ----------------
 document.getElementById("stopBtn").addEventListener("click", async () => {
-    if (!isRunning) return;
-
-    controller.abort(); // abort fetch call
-    await fetch("/stop", { method: "POST" });
-    isRunning = false; // ✅ reset immediately on stop
-
-    // Optionally, auto-refresh progress one more time after stopping
-    fetch("/progress")
-        .then(res => res.json())
-        .then(data => {
-            const output = document.getElementById("output");
-            if (data.schedule && data.schedule.length > 0) {
-                let result = `Weeks Found So Far: ${data.weeks}\n\n`;
-                data.schedule.forEach((week, i) => {
-                    result += `Week ${i + 1}:\n`;
-                    week.forEach((group, j) => {
-                        result += `  Group ${j + 1}: ${group.join(", ")}\n`;
-                    });
-                    result += "\n";
-                });
-                output.innerText = result;
-            } else {
-                output.innerText = "Solver stopped. No partial results found.";
-            }
-        });
+    if (!isRunning || !currentJobId) return;
+
+    // The progress stream then sends the stopped job's schedule so far.
+    await fetch(`/stop/${currentJobId}`, { method: "POST" });
 });
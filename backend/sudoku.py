@@ -1,118 +1,472 @@
 
+import heapq
 import random
+import sys
 import time
-from copy import deepcopy
 from collections import deque
+from itertools import permutations, product
 from typing import List, Optional, Tuple
 
+from board import Board
+from dlx import ExactCover
+from instrument import SearchStats
+
+
+ALL_DIGITS = 0x1FF
+ROW_OF = [i // 9 for i in range(81)]
+COL_OF = [i % 9 for i in range(81)]
+BOX_OF = [(i // 27) * 3 + (i % 9) // 3 for i in range(81)]
+UNITS = (
+    [[r * 9 + c for c in range(9)] for r in range(9)]
+    + [[r * 9 + c for r in range(9)] for c in range(9)]
+    + [[(br + i) * 9 + bc + j for i in range(3) for j in range(3)]
+       for br in range(0, 9, 3) for bc in range(0, 9, 3)]
+)
+BIT_VALUE = {1 << (v - 1): v for v in range(1, 10)}
+PEERS = [sorted({j for unit in UNITS if i in unit for j in unit} - {i}) for i in range(81)]
+
+
+# Row order, column order and digit relabeling (index 0 keeps blanks blank).
+Transform = Tuple[List[int], List[int], List[int]]
+
+CANONICAL_MAX_CANDIDATES = 5000
+
+# BFS frontier: each board is its 81 digits read as one decimal integer, about
+# 60 bytes in CPython against ~200 for a Board. A child is parent + v * PLACE[i].
+PLACE = [10 ** (80 - i) for i in range(81)]
+DIGIT_CHARS = "0123456789"
+_TO_CHARS = bytes.maketrans(bytes(range(10)), DIGIT_CHARS.encode())
+_FROM_CHARS = bytes.maketrans(DIGIT_CHARS.encode(), bytes(range(10)))
+BFS_FRONTIER_BUDGET_MB = 64
+BFS_DEGRADE_MODES = ("best-first", "beam")
+
+
+def _pack(board: Board) -> int:
+    return int(board.cells.translate(_TO_CHARS))
+
+
+def _unpack(packed: int) -> Board:
+    return Board(9, str(packed).zfill(81).encode().translate(_FROM_CHARS))
+
+
+def _children_packed(packed: int) -> Tuple[bool, List[int]]:
+    """(solved, children): each legal digit placed in the first empty cell."""
+    digits = str(packed).zfill(81)
+    i = digits.find("0")
+    if i < 0:
+        return True, []
+    used = {digits[p] for p in PEERS[i]}
+    place = PLACE[i]
+    return False, [packed + v * place for v in range(1, 10) if DIGIT_CHARS[v] not in used]
+
+
+def _frontier_rank(packed: int) -> Tuple[int, int]:
+    """Sort key for a degraded frontier: fewest candidates in the next cell, then fewest empties.
+
+    Solved boards come first and dead ends last.
+    """
+    digits = str(packed).zfill(81)
+    i = digits.find("0")
+    if i < 0:
+        return 0, 0
+    used = {digits[p] for p in PEERS[i]}
+    used.discard("0")
+    return (9 - len(used)) or 10, digits.count("0")
+
+
+class _SearchLimit(Exception):
+    pass
+
+
+def _result_stats(start: float, search: SearchStats, timed_out: bool) -> dict:
+    """Stats dict returned by every solver: timing, the legacy node_count and the SearchStats fields."""
+    dur_ms = (time.perf_counter() - start) * 1000.0
+    return {"duration_ms": round(dur_ms, 3), "node_count": search.nodes, "timed_out": timed_out,
+            **search.as_dict()}
+
+
+class _MaskState:
+    """Flat 81-cell board with row/column/box digit masks and an undo trail."""
+
+    def __init__(self, board: Board):
+        self.cells = [0] * 81
+        self.rows = [0] * 9
+        self.cols = [0] * 9
+        self.boxes = [0] * 9
+        self.trail: List[int] = []
+        self.ok = True
+        for i, v in enumerate(board.cells):
+            if v:
+                if not (self.candidates(i) >> (v - 1)) & 1:
+                    self.ok = False
+                    return
+                self.assign(i, v)
+        self.trail = []
+
+    def candidates(self, i: int) -> int:
+        return ALL_DIGITS & ~(self.rows[ROW_OF[i]] | self.cols[COL_OF[i]] | self.boxes[BOX_OF[i]])
+
+    def place(self, i: int, v: int):
+        bit = 1 << (v - 1)
+        self.cells[i] = v
+        self.rows[ROW_OF[i]] |= bit
+        self.cols[COL_OF[i]] |= bit
+        self.boxes[BOX_OF[i]] |= bit
+
+    def clear(self, i: int):
+        bit = ~(1 << (self.cells[i] - 1))
+        self.cells[i] = 0
+        self.rows[ROW_OF[i]] &= bit
+        self.cols[COL_OF[i]] &= bit
+        self.boxes[BOX_OF[i]] &= bit
+
+    def assign(self, i: int, v: int):
+        self.place(i, v)
+        self.trail.append(i)
+
+    def undo(self, mark: int):
+        while len(self.trail) > mark:
+            self.clear(self.trail.pop())
+
+    def propagate(self) -> bool:
+        """Apply naked and hidden singles until fixpoint; False on contradiction."""
+        cells = self.cells
+        changed = True
+        while changed:
+            changed = False
+            for i in range(81):
+                if cells[i]:
+                    continue
+                m = self.candidates(i)
+                if not m:
+                    return False
+                if not m & (m - 1):
+                    self.assign(i, BIT_VALUE[m])
+                    changed = True
+            for unit in UNITS:
+                placed = 0
+                once = 0
+                twice = 0
+                for i in unit:
+                    if cells[i]:
+                        placed |= 1 << (cells[i] - 1)
+                    else:
+                        m = self.candidates(i)
+                        twice |= once & m
+                        once |= m
+                if (once | placed) != ALL_DIGITS:
+                    return False
+                single = once & ~twice & ~placed
+                while single:
+                    bit = single & -single
+                    single ^= bit
+                    for i in unit:
+                        if not cells[i] and self.candidates(i) & bit:
+                            self.assign(i, BIT_VALUE[bit])
+                            changed = True
+                            break
+                    else:
+                        return False
+        return True
+
+    def pick_mrv(self) -> Tuple[int, int]:
+        """Empty cell with the fewest candidates, or (-1, 0) when solved."""
+        best, best_mask, best_count = -1, 0, 10
+        for i in range(81):
+            if self.cells[i]:
+                continue
+            m = self.candidates(i)
+            n = bin(m).count("1")
+            if n < best_count:
+                best, best_mask, best_count = i, m, n
+                if n <= 1:
+                    break
+        return best, best_mask
+
+    def count(self, limit: int) -> int:
+        """Depth-first solution count up to `limit`; leaves the state unchanged."""
+        entry = len(self.trail)
+        found = 0
+
+        def dfs():
+            nonlocal found
+            if not self.propagate():
+                return
+            i, mask = self.pick_mrv()
+            if i < 0:
+                found += 1
+                return
+
+            mark = len(self.trail)
+            while mask and found < limit:
+                bit = mask & -mask
+                mask ^= bit
+                self.assign(i, BIT_VALUE[bit])
+                dfs()
+                self.undo(mark)
+
+        dfs()
+        self.undo(entry)
+        return min(found, limit)
+
+    def has_alternative(self, i: int, v: int) -> bool:
+        """True if empty cell `i` can take a value other than `v` in some solution."""
+        mask = self.candidates(i) & ~(1 << (v - 1))
+        mark = len(self.trail)
+        while mask:
+            bit = mask & -mask
+            mask ^= bit
+            self.assign(i, BIT_VALUE[bit])
+            found = self.count(1)
+            self.undo(mark)
+            if found:
+                return True
+        return False
+
+    def to_grid(self) -> List[List[int]]:
+        return [self.cells[r * 9:r * 9 + 9] for r in range(9)]
 
 
 class SudokuSolver:
 
-    def __init__(self, grid: List[List[int]]):
-        self.grid = grid
+    def __init__(self, grid):
+        # Nested lists at the API edge, a flat Board internally.
+        self.board = grid.copy() if isinstance(grid, Board) else Board.from_rows(grid)
 
-    def _is_valid(self, board, r, c, v) -> bool:
+    @property
+    def grid(self) -> List[List[int]]:
+        return self.board.to_rows()
 
-        for j in range(9):
-            if board[r][j] == v:
-                return False
+    def solve_bfs_backtracking(
+        self,
+        max_time_sec: Optional[float] = None,
+        max_nodes: Optional[int] = None,
+        frontier_budget_mb: float = BFS_FRONTIER_BUDGET_MB,
+        degrade: str = "best-first"
+    ):
+        """Breadth-first search with an estimated memory cap on the frontier.
 
-        for i in range(9):
-            if board[i][c] == v:
-                return False
+        While the frontier fits in `frontier_budget_mb` this is plain BFS. Once
+        it overflows the search degrades instead of growing: "best-first" pops
+        the board whose next cell has the fewest candidates, "beam" keeps the
+        FIFO order; both then drop the worse half whenever the budget is hit.
+        A degraded search is incomplete, so its failure proves nothing.
+        """
+        if degrade not in BFS_DEGRADE_MODES:
+            raise ValueError(f"degrade must be one of {BFS_DEGRADE_MODES}")
 
-        br, bc = (r // 3) * 3, (c // 3) * 3
-        for i in range(br, br + 3):
-            for j in range(bc, bc + 3):
-                if board[i][j] == v:
-                    return False
-        return True
+        start = time.perf_counter()
+        search = SearchStats()
+        budget = int(frontier_budget_mb * 1024 * 1024)
+        packed_bytes = sys.getsizeof(PLACE[0] * 9)
+        entry_bytes = packed_bytes + 8  # the integer and its deque slot
+        q = deque([_pack(self.board)])
+        heap: List[Tuple[int, int, int, int]] = []  # (candidates, empties, seq, packed)
+        mode = "bfs"
+        seq = 0
+        visited = 0
+        peak = 1
+        peak_bytes = entry_bytes
+        dead_ends = 0
+        dropped = 0
+        max_depth = 0
+        base_empty = self.board.cells.count(0)
+        solution = None
+        timed_out = False
+
+        with search.phase("search"):
+            while q or heap:
+                if max_time_sec is not None and (time.perf_counter() - start) >= max_time_sec:
+                    timed_out = True
+                    break
+                if max_nodes is not None and visited >= max_nodes:
+                    timed_out = True
+                    break
+
+                if mode == "best-first":
+                    _, empties, _, packed = heapq.heappop(heap)
+                else:
+                    packed = q.popleft()
+                    empties = -1
+                visited += 1
+
+                solved, children = _children_packed(packed)
+                if solved:
+                    solution = _unpack(packed).to_rows()
+                    max_depth = base_empty
+                    break
+                if empties < 0:
+                    empties = str(packed).zfill(81).count("0")
+                if base_empty - empties > max_depth:
+                    max_depth = base_empty - empties
+                if not children:
+                    dead_ends += 1
+                    continue
 
-    def _find_first_empty(self, board) -> Tuple[Optional[int], Optional[int]]:
-        for r in range(9):
-            for c in range(9):
-                if board[r][c] == 0:
-                    return r, c
-        return None, None
+                if mode == "best-first":
+                    for child in children:
+                        seq += 1
+                        heapq.heappush(heap, (*_frontier_rank(child), seq, child))
+                    size = len(heap)
+                else:
+                    q.extend(children)
+                    size = len(q)
+
+                if size > peak:
+                    peak = size
+                if size * entry_bytes > peak_bytes:
+                    peak_bytes = size * entry_bytes
+                if size * entry_bytes <= budget:
+                    continue
 
-    def solve_bfs_backtracking(
+                if mode == "bfs":
+                    mode = degrade
+                    if mode == "best-first":
+                        heap = []
+                        for child in q:
+                            seq += 1
+                            heap.append((*_frontier_rank(child), seq, child))
+                        heapq.heapify(heap)
+                        q = deque()
+                        # The tuple and its sequence number ride along with each board.
+                        entry_bytes = packed_bytes + sys.getsizeof((0, 0, 0, 0)) + sys.getsizeof(1 << 40) + 8
+                        size = len(heap)
+                keep = max(1, min(size, budget // entry_bytes) // 2)
+                dropped += size - keep
+                if mode == "best-first":
+                    heap = heapq.nsmallest(keep, heap)  # sorted, hence already a heap
+                else:
+                    entries = list(q)
+                    ranked = sorted(range(size), key=lambda k: _frontier_rank(entries[k]))
+                    q = deque(entries[k] for k in sorted(ranked[:keep]))
+
+        search.nodes, search.backtracks, search.max_depth = visited, dead_ends, max_depth
+        search.frontier_peak, search.frontier_peak_bytes = peak, peak_bytes
+        search.prune("no_candidates", dead_ends)
+        search.prune("frontier_budget", dropped)
+        stats = _result_stats(start, search, timed_out)
+        stats["frontier_mode"] = mode
+        return solution is not None, solution, stats
+
+
+    def solve_propagation(
         self,
         max_time_sec: Optional[float] = None,
         max_nodes: Optional[int] = None
     ):
 
         start = time.perf_counter()
-        q = deque([deepcopy(self.grid)])
+        search = SearchStats()
+        with search.phase("setup"):
+            state = _MaskState(self.board)
         visited = 0
+        backtracks = 0
+        contradictions = 0
+        max_depth = 0
 
-        while q:
+        def dfs(depth: int) -> bool:
+            nonlocal visited, backtracks, contradictions, max_depth
             if max_time_sec is not None and (time.perf_counter() - start) >= max_time_sec:
-                dur_ms = (time.perf_counter() - start) * 1000.0
-                return False, None, {"duration_ms": round(dur_ms, 3), "node_count": visited, "timed_out": True}
+                raise _SearchLimit
             if max_nodes is not None and visited >= max_nodes:
-                dur_ms = (time.perf_counter() - start) * 1000.0
-                return False, None, {"duration_ms": round(dur_ms, 3), "node_count": visited, "timed_out": True}
-
-            board = q.popleft()
+                raise _SearchLimit
             visited += 1
+            if depth > max_depth:
+                max_depth = depth
 
-            r, c = self._find_first_empty(board)
-            if r is None:
-                dur_ms = (time.perf_counter() - start) * 1000.0
-                return True, board, {"duration_ms": round(dur_ms, 3), "node_count": visited, "timed_out": False}
-
-            for v in range(1, 10):
-                if self._is_valid(board, r, c, v):
-                    nb = deepcopy(board)
-                    nb[r][c] = v
-                    q.append(nb)
-
-        dur_ms = (time.perf_counter() - start) * 1000.0
-        return False, None, {"duration_ms": round(dur_ms, 3), "node_count": visited, "timed_out": False}
-
+            if not state.propagate():
+                contradictions += 1
+                return False
+            i, mask = state.pick_mrv()
+            if i < 0:
+                return True
+
+            mark = len(state.trail)
+            while mask:
+                bit = mask & -mask
+                mask ^= bit
+                state.assign(i, BIT_VALUE[bit])
+                if dfs(depth + 1):
+                    return True
+                state.undo(mark)
+                backtracks += 1
+            return False
+
+        timed_out = False
+        solved = False
+        if state.ok:
+            with search.phase("search"):
+                try:
+                    solved = dfs(0)
+                except _SearchLimit:
+                    timed_out = True
+        else:
+            search.prune("given_conflict")
+
+        search.nodes, search.backtracks, search.max_depth = visited, backtracks, max_depth
+        search.prune("propagation", contradictions)
+        return solved, (state.to_grid() if solved else None), _result_stats(start, search, timed_out)
+
+
+    def _build_exact_cover(self) -> ExactCover:
+        """Cell, row-value, column-value and box-value constraints (4 x 81 columns)."""
+        cells = self.board.cells
+        rows = [0] * 9
+        cols = [0] * 9
+        boxes = [0] * 9
+        for i, v in enumerate(cells):
+            if v:
+                bit = 1 << (v - 1)
+                rows[ROW_OF[i]] |= bit
+                cols[COL_OF[i]] |= bit
+                boxes[BOX_OF[i]] |= bit
+
+        ec = ExactCover(4 * 81)
+        for r in range(9):
+            for c in range(9):
+                b = (r // 3) * 3 + c // 3
+                given = cells[r * 9 + c]
+                for v in ([given] if given else range(1, 10)):
+                    if not given and (rows[r] | cols[c] | boxes[b]) >> (v - 1) & 1:
+                        continue
+                    ec.add_row((r, c, v), (
+                        r * 9 + c,
+                        81 + r * 9 + v - 1,
+                        162 + c * 9 + v - 1,
+                        243 + b * 9 + v - 1,
+                    ))
+        return ec
+
+    def solve_dlx(
+        self,
+        max_time_sec: Optional[float] = None,
+        max_nodes: Optional[int] = None
+    ):
 
-    def count_solutions_bfs(self, limit: int = 2) -> int:
+        start = time.perf_counter()
+        search = SearchStats()
+        with search.phase("build"):
+            ec = self._build_exact_cover()
+        deadline = (start + max_time_sec) if max_time_sec is not None else None
+        with search.phase("search"):
+            cover = ec.first_solution(max_nodes=max_nodes, deadline=deadline)
 
-        q = deque([deepcopy(self.grid)])
-        solutions = 0
-        while q and solutions < limit:
-            board = q.popleft()
-            r, c = self._find_first_empty(board)
-            if r is None:
-                solutions += 1
-                continue
-            for v in range(1, 10):
-                valid = True
-                for j in range(9):
-                    if board[r][j] == v:
-                        valid = False
-                        break
-                if not valid:
-                    continue
-                for i in range(9):
-                    if board[i][c] == v:
-                        valid = False
-                        break
-                if not valid:
-                    continue
-                br, bc = (r // 3) * 3, (c // 3) * 3
-                for i in range(br, br + 3):
-                    for j in range(bc, bc + 3):
-                        if board[i][j] == v:
-                            valid = False
-                            break
-                    if not valid:
-                        break
-                if not valid:
-                    continue
+        solution = None
+        if cover is not None:
+            solution = [[0] * 9 for _ in range(9)]
+            for r, c, v in cover:
+                solution[r][c] = v
 
-                nb = deepcopy(board)
-                nb[r][c] = v
-                q.append(nb)
+        search.nodes, search.backtracks, search.max_depth = ec.nodes, ec.backtracks, ec.max_depth
+        search.prune("empty_column", ec.dead_ends)
+        return solution is not None, solution, _result_stats(start, search, ec.aborted)
 
-        return solutions
+    def count_solutions(self, limit: int = 2) -> int:
 
+        state = _MaskState(self.board)
+        if not state.ok:
+            return 0
+        return state.count(limit)
 
 
 class SudokuGenerator:
@@ -120,55 +474,14 @@ class SudokuGenerator:
     def __init__(self):
         pass
 
-    def _solved_base(self) -> List[List[int]]:
+    def _solved_base(self) -> Board:
         base = 3
         side = base * base  
         def pattern(r, c): return (base * (r % base) + r // base + c) % side
         rows = [r for r in range(side)]
         cols = [c for c in range(side)]
         nums = [n for n in range(1, side + 1)]
-        return [[nums[pattern(r, c)] for c in cols] for r in rows]
-
-    def _shuffle_board(self, board: List[List[int]]) -> List[List[int]]:
-        b = deepcopy(board)
-
-        perm = list(range(1, 10))
-        random.shuffle(perm)
-        mapping = {i + 1: perm[i] for i in range(9)}
-        for r in range(9):
-            for c in range(9):
-                b[r][c] = mapping[b[r][c]]
-
-        for band in range(0, 9, 3):
-            order = [0, 1, 2]
-            random.shuffle(order)
-            rows = b[band:band + 3]
-            b[band:band + 3] = [rows[i] for i in order]
-
-
-        for stack in range(0, 9, 3):
-            order = [0, 1, 2]
-            random.shuffle(order)
-            for r in range(9):
-                slice3 = b[r][stack:stack + 3]
-                b[r][stack:stack + 3] = [slice3[i] for i in order]
-
-
-        band_order = [0, 1, 2]
-        random.shuffle(band_order)
-        new_b = []
-        for bo in band_order:
-            new_b.extend(b[bo * 3: bo * 3 + 3])
-        b = new_b
-
-
-        stack_order = [0, 1, 2]
-        random.shuffle(stack_order)
-        for r in range(9):
-            stacks = [b[r][0:3], b[r][3:6], b[r][6:9]]
-            b[r] = stacks[stack_order[0]] + stacks[stack_order[1]] + stacks[stack_order[2]]
-
-        return b
+        return Board(side, [nums[pattern(r, c)] for r in rows for c in cols])
 
     def _clue_targets(self, level: str) -> int:
         level = (level or "easy").lower()
@@ -180,37 +493,72 @@ class SudokuGenerator:
             return 26
         return 40
 
-    def _count_filled(self, board) -> int:
-        return sum(1 for r in range(9) for c in range(9) if board[r][c] != 0)
+    def _count_filled(self, board: Board) -> int:
+        return board.count_filled()
 
-    def _try_remove_cell(self, board, r, c) -> int:
-        old = board[r][c]
-        board[r][c] = 0
+    def _try_remove_cell(self, board: Board, r, c) -> int:
+        old = board[r * 9 + c]
+        board[r * 9 + c] = 0
         return old
 
-    def _unique_check_bfs(self, puzzle: List[List[int]], limit=2) -> int:
+    def _unique_check(self, puzzle: Board, limit=2) -> int:
         solver = SudokuSolver(puzzle)
-        return solver.count_solutions_bfs(limit=limit)
+        return solver.count_solutions(limit=limit)
+
+    def _remove_incremental(
+        self,
+        solved: Board,
+        coords: List[Tuple[int, int]],
+        target_clues: int,
+        start: float,
+        timeout_sec: Optional[float]
+    ) -> Board:
+        # The puzzle stays unique with `solved` as its only solution, so after
+        # blanking a cell it is still unique unless that cell admits another
+        # value. One mask state is kept for the whole loop and updated in place.
+        puzzle = solved.copy()
+        state = _MaskState(puzzle)
+        filled = 81
+        for (r, c) in coords:
+
+            if timeout_sec is not None and (time.perf_counter() - start) >= timeout_sec:
+                break
+            if filled <= target_clues:
+                break
+
+            i = r * 9 + c
+            old = puzzle[i]
+            state.clear(i)
+            if state.has_alternative(i, old):
+                state.place(i, old)
+            else:
+                puzzle[i] = 0
+                filled -= 1
+        return puzzle
 
     def generate_sudoku(
         self,
         level: str = "easy",
         ensure_unique: bool = False,
-        max_checks: int = 50,
-        timeout_sec: Optional[float] = None
+        max_checks: Optional[int] = None,
+        timeout_sec: Optional[float] = None,
+        incremental: bool = True
     ) -> List[List[int]]:
 
         start = time.perf_counter()
 
         solved = self._solved_base()
-        solved = self._shuffle_board(solved)
+        solved = shuffle_board(solved)
 
         target_clues = self._clue_targets(level)
-        puzzle = deepcopy(solved)
 
         coords = [(r, c) for r in range(9) for c in range(9)]
         random.shuffle(coords)
 
+        if ensure_unique and incremental and max_checks is None:
+            return self._remove_incremental(solved, coords, target_clues, start, timeout_sec).to_rows()
+
+        puzzle = solved.copy()
         checks_done = 0
         for (r, c) in coords:
 
@@ -219,14 +567,156 @@ class SudokuGenerator:
 
             if self._count_filled(puzzle) <= target_clues:
                 break
-            if puzzle[r][c] == 0:
+            if puzzle[r * 9 + c] == 0:
                 continue
 
             old = self._try_remove_cell(puzzle, r, c)
             if ensure_unique:
-                if checks_done < max_checks:
-                    checks_done += 1
-                    cnt = self._unique_check_bfs(puzzle, limit=2)
-                    if cnt != 1:
-                        puzzle[r][c] = old
-        return puzzle
+                if max_checks is not None and checks_done >= max_checks:
+                    puzzle[r * 9 + c] = old
+                    break
+                checks_done += 1
+                cnt = self._unique_check(puzzle, limit=2)
+                if cnt != 1:
+                    puzzle[r * 9 + c] = old
+        return puzzle.to_rows()
+
+
+# ==========================================================
+# Compact line format
+# ==========================================================
+
+def grid_from_line(line: str) -> List[List[int]]:
+    """Parse an 81-character puzzle string; '0' or '.' mark blanks."""
+    line = line.strip()
+    if len(line) != 81 or any(ch not in ".0123456789" for ch in line):
+        raise ValueError("expected 81 characters of digits or '.'")
+    flat = [0 if ch == "." else int(ch) for ch in line]
+    return [flat[r * 9:r * 9 + 9] for r in range(9)]
+
+
+def grid_to_line(grid: List[List[int]]) -> str:
+    return "".join(str(v) for row in grid for v in row)
+
+
+# ==========================================================
+# Random symmetry (solutions map to solutions)
+# ==========================================================
+
+def _random_line_order() -> List[int]:
+    # Lines shuffled within each block of three, then the blocks shuffled.
+    within = []
+    for _ in range(3):
+        order = [0, 1, 2]
+        random.shuffle(order)
+        within.append(order)
+    block_order = [0, 1, 2]
+    random.shuffle(block_order)
+    return [bo * 3 + within[bo][k] for bo in block_order for k in range(3)]
+
+
+def shuffle_board(board: Board) -> Board:
+    """Copy with digits relabeled and rows, columns, bands and stacks permuted at random."""
+    perm = list(range(1, 10))
+    random.shuffle(perm)
+    relabel = [0] + perm
+
+    row_order = _random_line_order()
+    col_order = _random_line_order()
+    cells = board.cells
+    return Board(9, [relabel[cells[r * 9 + c]] for r in row_order for c in col_order])
+
+
+# ==========================================================
+# Canonical form (for caching equivalent puzzles)
+# ==========================================================
+
+def _line_orders(keys: List[tuple]) -> List[List[int]]:
+    """All band/stack-respecting orders of 9 lines that sort them by `keys`.
+
+    Lines are sorted within each block of three and blocks by their sorted
+    keys; lines or blocks with equal keys are tried in every order.
+    """
+    blocks = []
+    for b in range(3):
+        lines = sorted(range(3 * b, 3 * b + 3), key=lambda i: keys[i])
+        sig = [keys[i] for i in lines]
+        variants = [list(p) for p in permutations(lines) if [keys[i] for i in p] == sig]
+        blocks.append((tuple(sig), variants))
+    ranked = sorted(range(3), key=lambda b: blocks[b][0])
+    sig = [blocks[b][0] for b in ranked]
+    block_orders = [p for p in permutations(ranked) if [blocks[b][0] for b in p] == sig]
+    return [[i for v in combo for i in v]
+            for bo in block_orders for combo in product(*(blocks[b][1] for b in bo))]
+
+
+def canonical_form(grid: List[List[int]]) -> Tuple[List[List[int]], Transform]:
+    """Representative of `grid` under digit relabeling and the row, column,
+    band and stack permutations used by shuffle_board.
+
+    Returns (canonical grid, transform) with
+    canonical[i][j] == relabel[grid[rows[i]][cols[j]]]. Equivalent puzzles map to
+    the same grid; very symmetric, nearly empty grids whose candidate set exceeds
+    CANONICAL_MAX_CANDIDATES fall back to the identity transform.
+    """
+    freq = [0] * 10
+    for row in grid:
+        for v in row:
+            freq[v] += 1
+
+    def line_key(cells: List[int]) -> tuple:
+        filled = [v for v in cells if v]
+        per_block = sorted(sum(1 for v in cells[k:k + 3] if v) for k in (0, 3, 6))
+        return (len(filled), tuple(per_block), tuple(sorted(freq[v] for v in filled)))
+
+    row_keys = [line_key(grid[r]) for r in range(9)]
+    col_keys = [line_key([grid[r][c] for r in range(9)]) for c in range(9)]
+
+    best: Optional[Tuple[List[int], Transform]] = None
+    budget = CANONICAL_MAX_CANDIDATES
+    for rows in _line_orders(row_keys):
+        keys = [(col_keys[c], tuple(grid[r][c] != 0 for r in rows)) for c in range(9)]
+        for cols in _line_orders(keys):
+            budget -= 1
+            if budget < 0:
+                identity = list(range(10))
+                return [row[:] for row in grid], (list(range(9)), list(range(9)), identity)
+            relabel = [0] * 10
+            nxt = 1
+            flat = []
+            for r in rows:
+                row = grid[r]
+                for c in cols:
+                    v = row[c]
+                    if v and not relabel[v]:
+                        relabel[v] = nxt
+                        nxt += 1
+                    flat.append(relabel[v])
+            if best is None or flat < best[0]:
+                best = (flat, (rows, cols, relabel))
+
+    flat, (rows, cols, relabel) = best
+    for v in range(1, 10):
+        if not relabel[v]:
+            relabel[v] = nxt
+            nxt += 1
+    return [flat[i * 9:i * 9 + 9] for i in range(9)], (rows, cols, relabel)
+
+
+def apply_transform(grid: List[List[int]], transform: Transform) -> List[List[int]]:
+    """Map a grid (e.g. a solution) into the canonical frame of `transform`."""
+    rows, cols, relabel = transform
+    return [[relabel[grid[r][c]] for c in cols] for r in rows]
+
+
+def invert_transform(grid: List[List[int]], transform: Transform) -> List[List[int]]:
+    """Map a grid from the canonical frame back to the original puzzle's frame."""
+    rows, cols, relabel = transform
+    unlabel = [0] * 10
+    for v, w in enumerate(relabel):
+        unlabel[w] = v
+    out = [[0] * 9 for _ in range(9)]
+    for i, r in enumerate(rows):
+        for j, c in enumerate(cols):
+            out[r][c] = unlabel[grid[i][j]]
+    return out
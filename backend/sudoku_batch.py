@@ -0,0 +1,255 @@
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from board import Board
+from sudoku import UNITS, SudokuSolver, grid_from_line
+
+try:
+    import numpy as np
+except ImportError:  # optional: without it every function below works board by board
+    np = None
+
+HAVE_NUMPY = np is not None
+ALL_DIGITS = 0x1FF
+
+SOLVED = "solved"
+UNSOLVABLE = "unsolvable"
+INVALID = "invalid"
+TIMED_OUT = "timed_out"
+
+if HAVE_NUMPY:
+    UNIT_CELLS = np.array(UNITS, dtype=np.intp)                              # (27, 9)
+    CELL_UNITS = np.array([[u for u in range(27) if i in UNITS[u]] for i in range(81)],
+                          dtype=np.intp)                                     # (81, 3): row, column, box
+    DIGIT_BIT = np.array([0] + [1 << (v - 1) for v in range(1, 10)], dtype=np.uint16)
+    DIGIT_BITS = DIGIT_BIT[1:]
+    POPCOUNT = np.array([bin(m).count("1") for m in range(512)], dtype=np.uint8)
+    SINGLE_DIGIT = np.array([m.bit_length() if POPCOUNT[m] == 1 else 0 for m in range(512)], dtype=np.uint8)
+
+
+# ==========================================================
+# Input
+# ==========================================================
+
+def _grid(puzzle) -> List[List[int]]:
+    if isinstance(puzzle, str):
+        return grid_from_line(puzzle)
+    grid = [list(row) for row in puzzle]
+    if len(grid) != 9 or any(len(row) != 9 for row in grid) \
+            or any(not isinstance(v, int) or not 0 <= v <= 9 for row in grid for v in row):
+        raise ValueError("each board must be a 9x9 grid of digits 0-9")
+    return grid
+
+
+def as_cells(puzzles) -> "np.ndarray":
+    """(N, 81) uint8 array from an (N, 9, 9) array, 9x9 grids or 81-character lines.
+
+    Without NumPy the rows come back as a list of 81-int lists.
+    """
+    if not HAVE_NUMPY:
+        return [[v for row in _grid(p) for v in row] for p in puzzles]
+    if isinstance(puzzles, np.ndarray):
+        cells = puzzles.reshape(len(puzzles), 81) if puzzles.size == len(puzzles) * 81 else None
+        if cells is None or not np.issubdtype(cells.dtype, np.integer) or (cells < 0).any() or (cells > 9).any():
+            raise ValueError("expected an (N, 9, 9) integer array of digits 0-9")
+        return cells.astype(np.uint8)
+    grids = [_grid(p) for p in puzzles]
+    return np.array(grids, dtype=np.uint8).reshape(len(grids), 81)
+
+
+# ==========================================================
+# Vectorized passes (all boards at once)
+# ==========================================================
+
+def _unit_used(cells: "np.ndarray") -> "np.ndarray":
+    """(N, 27) bitmask of the digits placed in each row, column and box."""
+    return np.bitwise_or.reduce(DIGIT_BIT[cells][:, UNIT_CELLS], axis=2)
+
+
+def _conflicts(cells: "np.ndarray", used: "np.ndarray") -> "np.ndarray":
+    """(N,) True where some unit holds a digit twice."""
+    filled = (cells[:, UNIT_CELLS] > 0).sum(axis=2)
+    return (POPCOUNT[used] != filled).any(axis=1)
+
+
+def candidate_masks(cells: "np.ndarray", used: Optional["np.ndarray"] = None) -> "np.ndarray":
+    """(N, 81) uint16 candidate bitmask per cell; 0 for filled cells."""
+    if used is None:
+        used = _unit_used(cells)
+    seen = used[:, CELL_UNITS[:, 0]] | used[:, CELL_UNITS[:, 1]] | used[:, CELL_UNITS[:, 2]]
+    return np.where(cells == 0, ALL_DIGITS & ~seen, 0).astype(np.uint16)
+
+
+def propagate(cells: "np.ndarray") -> "np.ndarray":
+    """Naked and hidden singles on every board until none changes; fills `cells` in place.
+
+    Returns an (N,) int8 status: 1 solved, -1 contradiction, 0 stuck (needs search).
+    Each pass only touches the boards that changed in the previous one.
+    """
+    status = np.zeros(len(cells), dtype=np.int8)
+    active = np.arange(len(cells))
+    while active.size:
+        sub = cells[active]
+        used = _unit_used(sub)
+        masks = candidate_masks(sub, used)
+        empty = sub == 0
+
+        cand = (masks[:, :, None] & DIGIT_BITS) != 0                 # (n, 81, 9)
+        per_unit = cand[:, UNIT_CELLS, :]                            # (n, 27, 9 cells, 9 digits)
+        counts = per_unit.sum(axis=2)                                # (n, 27, 9)
+        placed = (used[:, :, None] & DIGIT_BITS) != 0
+        bad = (_conflicts(sub, used)
+               | (empty & (masks == 0)).any(axis=1)
+               | ((counts == 0) & ~placed).any(axis=(1, 2)))
+        done = ~empty.any(axis=1)
+        status[active[bad]] = -1
+        status[active[done & ~bad]] = 1
+
+        new = sub.copy()
+        new[empty] = SINGLE_DIGIT[masks[empty]]
+        b, u, d = np.nonzero(counts == 1)
+        new[b, UNIT_CELLS[u, per_unit[b, u, :, d].argmax(axis=1)]] = d + 1
+        changed = (new != sub).any(axis=1) & ~bad & ~done
+        cells[active[changed]] = new[changed]
+        active = active[changed]
+    return status
+
+
+def _valid_cells(cells: "np.ndarray", givens: Optional["np.ndarray"]) -> "np.ndarray":
+    ok = (cells > 0).all(axis=1) & (_unit_used(cells) == ALL_DIGITS).all(axis=1)
+    if givens is not None:
+        ok &= ((givens == 0) | (givens == cells)).all(axis=1)
+    return ok
+
+
+# ==========================================================
+# Board-by-board fallback
+# ==========================================================
+
+def _valid_grid(grid: List[List[int]], givens: Optional[List[List[int]]]) -> bool:
+    digits = set(range(1, 10))
+    if any({grid[i // 9][i % 9] for i in unit} != digits for unit in UNITS):
+        return False
+    return givens is None or all(g in (0, v) for grow, row in zip(givens, grid) for g, v in zip(grow, row))
+
+
+def _search(grid: List[List[int]], max_time_sec: Optional[float]) -> Tuple[str, Optional[List[List[int]]]]:
+    ok, solution, stats = SudokuSolver(Board.from_rows(grid)).solve_propagation(max_time_sec=max_time_sec)
+    if ok:
+        return SOLVED, solution
+    return (TIMED_OUT if stats["timed_out"] else UNSOLVABLE), None
+
+
+# ==========================================================
+# Public API
+# ==========================================================
+
+def _parse_all(boards: Sequence) -> Tuple[List[int], List[List[List[int]]]]:
+    """Indices and grids of the well-formed boards; the rest are skipped."""
+    index, grids = [], []
+    for k, board in enumerate(boards):
+        try:
+            grids.append(_grid(board))
+            index.append(k)
+        except (ValueError, TypeError):
+            pass
+    return index, grids
+
+
+def _cells_of(boards: Sequence) -> Tuple[List[int], Any]:
+    """(indices, cells) for the well-formed boards; an array input is taken whole."""
+    if HAVE_NUMPY and isinstance(boards, np.ndarray):
+        return list(range(len(boards))), as_cells(boards)
+    if HAVE_NUMPY and boards and not any(isinstance(b, str) for b in boards):
+        # Nested lists convert in one step when every board is well formed.
+        try:
+            arr = np.array(boards)
+        except ValueError:
+            arr = None
+        if arr is not None and arr.shape[1:] == (9, 9) and np.issubdtype(arr.dtype, np.integer) \
+                and not ((arr < 0) | (arr > 9)).any():
+            return list(range(len(boards))), arr.astype(np.uint8).reshape(len(boards), 81)
+    index, grids = _parse_all(boards)
+    if not HAVE_NUMPY:
+        return index, grids
+    return index, np.array(grids, dtype=np.uint8).reshape(len(grids), 81)
+
+
+def validate_batch(solutions: Sequence, puzzles: Optional[Sequence] = None) -> List[bool]:
+    """True per board that is a complete, valid Sudoku (and keeps the givens of `puzzles`).
+
+    Malformed boards in a list are reported as False; a malformed array raises ValueError.
+    """
+    if puzzles is not None and len(puzzles) != len(solutions):
+        raise ValueError("'puzzles' and 'solutions' must have the same length")
+    out = [False] * len(solutions)
+    index, cells = _cells_of(solutions)
+    givens = None
+    if puzzles is not None:
+        given_index, givens = _cells_of(puzzles)
+        if given_index != index:
+            row_of = {k: j for j, k in enumerate(index)}
+            given_row_of = {k: j for j, k in enumerate(given_index)}
+            index = [k for k in index if k in given_row_of]
+            cells = _take(cells, [row_of[k] for k in index])
+            givens = _take(givens, [given_row_of[k] for k in index])
+    if not index:
+        return out
+    if HAVE_NUMPY:
+        ok = _valid_cells(cells, givens).tolist()
+    else:
+        ok = [_valid_grid(g, givens[j] if givens is not None else None) for j, g in enumerate(cells)]
+    for k, valid in zip(index, ok):
+        out[k] = valid
+    return out
+
+
+def _take(cells, rows: List[int]):
+    return cells[rows] if HAVE_NUMPY else [cells[j] for j in rows]
+
+
+def solve_batch(puzzles: Sequence, max_time_sec: Optional[float] = None
+                ) -> Tuple[List[Optional[List[List[int]]]], List[str], Dict[str, Any]]:
+    """Solve many puzzles: vectorized singles for all, then search for the rest.
+
+    Returns (solutions, statuses, stats); a status is solved, unsolvable,
+    invalid (malformed input) or timed_out (`max_time_sec` is per board).
+    """
+    start = time.perf_counter()
+    n = len(puzzles)
+    solutions: List[Optional[List[List[int]]]] = [None] * n
+    statuses = [INVALID] * n
+    index, cells = _cells_of(puzzles)
+
+    stuck = list(zip(index, cells))
+    by_propagation = 0
+    if HAVE_NUMPY and index:
+        status = propagate(cells)
+        rows = cells.reshape(len(index), 9, 9).tolist()
+        stuck = []
+        for j, k in enumerate(index):
+            if status[j] == 1:
+                solutions[k], statuses[k] = rows[j], SOLVED
+            elif status[j] == -1:
+                statuses[k] = UNSOLVABLE
+            else:
+                stuck.append((k, rows[j]))  # search on from the singles already placed
+        by_propagation = len(index) - len(stuck)
+
+    for k, grid in stuck:
+        statuses[k], solutions[k] = _search(grid, max_time_sec)
+
+    elapsed = time.perf_counter() - start
+    stats = {
+        "boards": n,
+        "vectorized": HAVE_NUMPY,
+        "by_propagation": by_propagation,
+        "by_search": len(stuck),
+        "solved": statuses.count(SOLVED),
+        "unsolvable": statuses.count(UNSOLVABLE),
+        "invalid": statuses.count(INVALID),
+        "timed_out": statuses.count(TIMED_OUT),
+        "duration_ms": round(elapsed * 1000.0, 3),
+        "boards_per_sec": round(n / elapsed, 1) if elapsed > 0 else None,
+    }
+    return solutions, statuses, stats
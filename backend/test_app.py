@@ -0,0 +1,187 @@
+import json
+import time
+
+import pytest
+
+import app as app_module
+
+EASY = "530070000600195000098000060800060003400803001700020006060000280000419005000080079"
+
+
+@pytest.fixture
+def client():
+    app_module.result_cache.clear()
+    return app_module.app.test_client()
+
+
+def _grid(line):
+    return [[int(ch) for ch in line[r * 9:r * 9 + 9]] for r in range(9)]
+
+
+def _ndjson(response):
+    return [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+
+def _wait_for_result(client, job_id, timeout=30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        snap = client.get(f"/result/{job_id}").get_json()
+        if snap["finished"]:
+            return snap
+        time.sleep(0.05)
+    raise AssertionError(f"job {job_id} did not finish")
+
+
+# ----------------------------------------------------------------------
+# Social golfers
+# ----------------------------------------------------------------------
+
+def test_solve_runs_a_golfer_job(client):
+    response = client.post("/solve", json={"num_players": 9, "group_size": 3, "algorithm": "Depth-First Search (DFS)",
+                                           "depth_limit": "3", "symmetry_breaking": True})
+    assert response.status_code == 202
+    snap = _wait_for_result(client, response.get_json()["job_id"])
+    assert snap["status"] == "done" and snap["weeks"] == 4
+    assert snap["stats"]["cache"] == "miss" and snap["stats"]["max_depth"] == 4
+
+
+@pytest.mark.parametrize("field, value", [
+    ("num_players", "abc"),
+    ("num_players", None),
+    ("group_size", True),
+    ("depth_limit", "deep"),
+    ("memo_mb", "lots"),
+    ("memo_mb", "nan"),
+    ("workers", [2]),
+    ("seed", "x"),
+    ("time_limit", "soon"),
+    ("timeout_ms", "later"),
+])
+def test_solve_rejects_non_numeric_fields(client, field, value):
+    data = {"num_players": 9, "group_size": 3, "algorithm": "Depth-First Search (DFS)", field: value}
+    response = client.post("/solve", json=data)
+    assert response.status_code == 400
+    assert field in response.get_json()["message"]
+
+
+def test_stop_ends_a_running_job(client):
+    job_id = client.post("/solve", json={"num_players": 32, "group_size": 4, "algorithm": app_module.LOCAL_SEARCH,
+                                         "time_limit": 60}).get_json()["job_id"]
+    assert client.get(f"/progress/{job_id}").get_json()["status"] == "running"
+    assert client.post(f"/stop/{job_id}").get_json()["stopped"]
+    assert _wait_for_result(client, job_id, timeout=10)["status"] == "stopped"
+
+
+def test_progress_stream_ends_with_done(client):
+    job_id = client.post("/solve", json={"num_players": 8, "group_size": 4}).get_json()["job_id"]
+    _wait_for_result(client, job_id)
+    body = client.get(f"/progress/{job_id}/stream").get_data(as_text=True)
+    assert body.startswith("event: done\n") and json.loads(body.split("data: ", 1)[1])["job_id"] == job_id
+
+
+@pytest.mark.parametrize("path", ["/progress/nope", "/result/nope", "/progress/nope/stream"])
+def test_unknown_job_is_404(client, path):
+    assert client.get(path).status_code == 404
+    assert client.post("/stop/nope").status_code == 404
+
+
+def test_solve_rejects_unknown_algorithm(client):
+    response = client.post("/solve", json={"num_players": 9, "group_size": 3, "algorithm": "Guess"})
+    assert response.status_code == 400
+
+
+# ----------------------------------------------------------------------
+# Result cache
+# ----------------------------------------------------------------------
+
+def test_sudoku_cache_is_per_algorithm(client):
+    first = client.post("/solve_sudoku", json={"puzzle": _grid(EASY), "algorithm": "propagation"}).get_json()
+    other = client.post("/solve_sudoku", json={"puzzle": _grid(EASY), "algorithm": "dlx"}).get_json()
+    again = client.post("/solve_sudoku", json={"puzzle": _grid(EASY), "algorithm": "dlx"}).get_json()
+    assert (first["cache"], other["cache"], again["cache"]) == ("miss", "miss", "hit")
+    assert other["node_count"] > 0
+    assert again["solution"] == other["solution"]
+    assert again["duration_ms"] == round(again["duration_ms"], 3)
+
+
+def test_golfer_cache_skips_unseeded_local_search():
+    params = {"num_players": 16, "group_size": 4, "algorithm": app_module.LOCAL_SEARCH, "depth_limit": 5,
+              "symmetry_breaking": False, "seed": None, "time_limit": 1.0}
+    assert app_module._golfer_cache_key(params) is None
+    assert app_module._golfer_cache_key({**params, "seed": 1}) is not None
+    assert app_module._golfer_cache_key({**params, "algorithm": "Depth-First Search (DFS)"}) is not None
+
+
+def test_latin_result_is_cached(client):
+    body = {"board": [[1, 0, 0], [0, 0, 0], [0, 0, 0]], "algorithm": "DLX"}
+    first = client.post("/solve_latin", json=body).get_json()
+    again = client.post("/solve_latin", json=body).get_json()
+    assert first["success"] and (first["cache"], again["cache"]) == ("miss", "hit")
+    assert again["solution"] == first["solution"]
+
+
+def test_cache_and_metrics_endpoints(client):
+    client.post("/solve_sudoku", json={"puzzle": _grid(EASY), "algorithm": "propagation"})
+    assert client.get("/cache").get_json()["namespaces"]["sudoku"]["misses"] >= 1
+    text = client.get("/metrics").get_data(as_text=True)
+    assert 'solver_request_duration_seconds_count{endpoint="solve_sudoku",algorithm="propagation"}' in text
+    assert "result_cache_entries" in text and "solver_executor_workers" in text
+
+
+# ----------------------------------------------------------------------
+# Batch endpoints
+# ----------------------------------------------------------------------
+
+def test_latin_batch_streams_items_and_a_summary(client):
+    boards = [[[1, 0], [0, 0]], [[1, 1], [0, 0]], [[0] * 40 for _ in range(40)]]
+    response = client.post("/solve_latin/batch", json={"boards": boards, "algorithm": "DLX", "item_timeout_ms": 1})
+    assert response.mimetype == "application/x-ndjson"
+    *items, summary = _ndjson(response)
+    items = {item["index"]: item for item in items}
+    assert items[0]["status"] == "ok" and items[0]["solution"] == [[1, 2], [2, 1]]
+    assert items[1]["status"] == "error" and "depth limit" in items[1]["message"]
+    assert items[2]["status"] == "error" and items[2]["message"] == "Timed out"
+    assert summary["done"] and summary["count"] == 3 and summary["errors"] == 2 and not summary["timed_out"]
+
+
+def test_latin_batch_rejects_unknown_algorithm(client):
+    assert client.post("/solve_latin/batch", json={"boards": [], "algorithm": "Guess"}).status_code == 400
+
+
+def test_sudoku_batch_reads_ndjson(client):
+    body = "\n".join([json.dumps(EASY), json.dumps(_grid(EASY)), "not json", json.dumps([[1]])]) + "\n"
+    response = client.post("/solve_sudoku/batch?algorithm=dlx", data=body, content_type="application/x-ndjson")
+    *items, summary = _ndjson(response)
+    statuses = {item["index"]: item["status"] for item in items}
+    assert statuses == {0: "ok", 1: "ok", 2: "error", 3: "error"}
+    assert summary["count"] == 4 and summary["errors"] == 2
+
+
+def test_sudoku_bulk_and_verify(client):
+    unsolvable = "11" + "0" * 79
+    bulk = client.post("/solve_sudoku/bulk", json={"puzzles": [EASY, unsolvable]}).get_json()
+    assert bulk["statuses"] == ["solved", "unsolvable"] and bulk["solutions"][1] is None
+    assert bulk["stats"]["boards"] == 2 and bulk["stats"]["solved"] == 1
+    solution = "".join(str(v) for row in bulk["solutions"][0] for v in row)
+
+    verify = client.post("/verify_sudoku/batch", json={"solutions": [solution, solution[::-1]],
+                                                       "puzzles": [EASY, EASY]}).get_json()
+    assert verify["valid"] == [True, False] and verify["valid_count"] == 1
+    assert client.post("/verify_sudoku/batch", json={"solutions": "x"}).status_code == 400
+
+
+# ----------------------------------------------------------------------
+# Puzzle generation
+# ----------------------------------------------------------------------
+
+def test_generate_from_the_seed_bank(client):
+    data = client.get("/generate?level=hard&source=bank").get_json()
+    assert data["source"] == "bank" and data["unique"] and not data["from_pool"]
+    ok, solution, _ = app_module.SudokuSolver(data["puzzle"]).solve_propagation()
+    assert ok and app_module.SudokuSolver(data["puzzle"]).count_solutions() == 1
+
+
+def test_generate_without_the_pool(client):
+    data = client.get("/generate?level=medium&unique=1&incremental=0").get_json()
+    assert data["source"] == "generator" and data["level"] == "medium" and data["unique"]
+    assert app_module.SudokuSolver(data["puzzle"]).count_solutions() == 1
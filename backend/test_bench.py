@@ -0,0 +1,59 @@
+import filecmp
+import os
+
+import pytest
+
+import bench
+
+
+@pytest.fixture
+def corpus_root(tmp_path, monkeypatch):
+    monkeypatch.setattr(bench, "CORPUS_ROOT", str(tmp_path))
+    return tmp_path
+
+
+def test_build_corpus_is_reproducible(corpus_root):
+    shipped = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks", f"v{bench.CORPUS_VERSION}")
+    bench.build_corpus()
+    for name in ("sudoku.txt", "latin.txt", "golfer.jsonl"):
+        assert filecmp.cmp(corpus_root / f"v{bench.CORPUS_VERSION}" / name, os.path.join(shipped, name), shallow=False)
+    with pytest.raises(SystemExit):
+        bench.build_corpus()
+
+
+def test_load_corpus_reads_every_problem():
+    corpus = bench.load_corpus(bench.CORPUS_VERSION)
+    assert len(corpus["sudoku"]) == 3 * bench.SUDOKU_PER_LEVEL + len(bench.KNOWN_HARD_SUDOKU)
+    assert [g["family"] for g in corpus["golfer"]] == [g["name"] for g in bench.GOLFER_INSTANCES]
+    assert "name" not in corpus["golfer"][0]["input"]
+
+
+def test_load_corpus_needs_a_built_version(corpus_root):
+    with pytest.raises(SystemExit):
+        bench.load_corpus(99)
+
+
+def test_run_benchmarks_summarises_each_group():
+    rows = bench.run_benchmarks(bench.CORPUS_VERSION, ["golfer"], {}, repeat=1, timeout=10.0, families=["8-4"])
+    assert len(rows) == 1
+    assert rows[0]["family"] == "8-4" and rows[0]["timeouts"] == 0 and rows[0]["median_ms"] is not None
+
+
+def _report(version, medians, timeouts=0):
+    return {"corpus_version": version, "commit": "x", "results": [
+        {"problem": "sudoku", "family": family, "algorithm": "dlx", "median_ms": ms, "timeouts": timeouts}
+        for family, ms in medians.items()]}
+
+
+def test_compare_counts_regressions(capsys):
+    old = _report(2, {"easy": 10.0, "hard": 100.0, "new-only": None})
+    new = _report(2, {"easy": 13.0, "hard": 50.0, "added": 1.0})
+    assert bench.compare(old, new, threshold=1.2) == 1
+    out = capsys.readouterr().out
+    assert "sudoku/easy/dlx" in out and "REGRESSION" in out and "faster" in out
+    assert bench.compare(old, _report(2, {"easy": 10.0}, timeouts=1), threshold=1.2) == 1
+
+
+def test_compare_refuses_different_corpora():
+    with pytest.raises(SystemExit):
+        bench.compare(_report(1, {"easy": 1.0}), _report(2, {"easy": 1.0}), threshold=1.2)
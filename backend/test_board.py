@@ -0,0 +1,33 @@
+import pytest
+
+from board import Board
+
+ROWS = [[1, 2, 0], [0, 3, 1], [3, 0, 2]]
+
+
+def test_rows_round_trip():
+    board = Board.from_rows(ROWS)
+    assert board.to_rows() == ROWS
+    assert board.key() == bytes([1, 2, 0, 0, 3, 1, 3, 0, 2])
+    assert board.first_empty() == 2 and board.count_filled() == 6
+
+
+def test_copy_is_independent():
+    board = Board.from_rows(ROWS)
+    copy = board.copy()
+    copy[2] = 3
+    assert board[2] == 0 and copy != board
+
+
+def test_transpose_and_rotate():
+    board = Board.from_rows(ROWS)
+    assert board.transpose().to_rows() == [list(col) for col in zip(*ROWS)]
+    assert board.rotate().to_rows() == [[3, 0, 1], [0, 3, 2], [2, 1, 0]]
+    assert board.rotate(4) == board
+
+
+def test_rejects_bad_shapes():
+    with pytest.raises(ValueError):
+        Board.from_rows([[1, 2], [3]])
+    with pytest.raises(ValueError):
+        Board(3, [0] * 8)
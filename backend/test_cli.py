@@ -0,0 +1,64 @@
+import pytest
+
+import cli
+from latin_square import board_from_line
+from sudoku import SudokuSolver, grid_from_line
+
+EASY = "530070000600195000098000060800060003400803001700020006060000280000419005000080079"
+CONTRADICTION = "11" + "0" * 79
+
+
+def _square(x, y):
+    return str(x * y)
+
+
+def test_run_ordered_keeps_input_order():
+    items = [(i, i + 1) for i in range(20)]
+    assert list(cli.run_ordered(_square, items, jobs=3)) == [str(i * (i + 1)) for i in range(20)]
+
+
+def test_run_ordered_marks_bad_lines_failed():
+    assert list(cli.run_ordered(cli.solve_latin_line, [("1 2 3", "DLX", None)], jobs=1)) == [cli.FAILED]
+
+
+@pytest.mark.parametrize("algorithm", ["propagation", "dlx", cli.VECTORIZED])
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_solve_sudoku_writes_one_line_per_puzzle(tmp_path, algorithm, jobs):
+    infile, outfile = tmp_path / "in.txt", tmp_path / "out.txt"
+    infile.write_text(f"# puzzles\n{EASY}\n\n{CONTRADICTION}\n{EASY}\n")
+    cli.main(["solve-sudoku", str(infile), "-o", str(outfile), "--algorithm", algorithm, "-j", jobs])
+    solved, failed, again = outfile.read_text().split()
+    assert failed == cli.FAILED and solved == again
+    assert SudokuSolver(grid_from_line(solved)).count_solutions() == 1 and solved.startswith("534")
+
+
+def test_verify_sudoku_accepts_pairs_and_bare_solutions(tmp_path):
+    solution = "534678912672195348198342567859761423426853791713924856961537284287419635345286179"
+    broken = solution[::-1][:80] + "0"
+    infile, outfile = tmp_path / "in.txt", tmp_path / "out.txt"
+    infile.write_text(f"{EASY} {solution}\n{solution}\n{broken}\n")
+    cli.main(["verify-sudoku", str(infile), "-o", str(outfile)])
+    assert outfile.read_text().split() == ["ok", "ok", "invalid"]
+
+
+def test_solve_latin(tmp_path):
+    infile, outfile = tmp_path / "in.txt", tmp_path / "out.txt"
+    infile.write_text("1,0,0,0, 0,0,0,0, 0,0,0,0, 0,0,0,2\n1 1 0 0\n")
+    cli.main(["solve-latin", str(infile), "-o", str(outfile), "--algorithm", "DLX"])
+    first, second = outfile.read_text().splitlines()
+    square = board_from_line(first)
+    assert square[0][0] == 1 and square[3][3] == 2 and second == cli.FAILED
+    assert all(sorted(row) == [1, 2, 3, 4] for row in square + [list(col) for col in zip(*square)])
+
+
+def test_generate_and_golfers(tmp_path, capsys):
+    outfile = tmp_path / "puzzles.txt"
+    cli.main(["generate", "-n", "3", "--level", "medium", "--unique", "-o", str(outfile)])
+    lines = outfile.read_text().split()
+    assert len(lines) == 3 and all(SudokuSolver(grid_from_line(l)).count_solutions() == 1 for l in lines)
+
+    schedule = tmp_path / "golfers.txt"
+    cli.main(["golfers", "9", "3", "--symmetry-breaking", "-o", str(schedule)])
+    weeks = schedule.read_text().splitlines()
+    assert len(weeks) == 4 and all(len(week.split(" | ")) == 3 for week in weeks)
+    assert "4 weeks" in capsys.readouterr().err
@@ -0,0 +1,30 @@
+from dlx import ExactCover
+
+
+def _knuth_example() -> ExactCover:
+    """Knuth's 7-column example; its only cover is rows A, D and E."""
+    ec = ExactCover(7)
+    for label, cols in [("A", (2, 4, 5)), ("B", (0, 3, 6)), ("C", (1, 2, 5)), ("D", (0, 3)),
+                        ("E", (1, 6)), ("F", (3, 4, 6))]:
+        ec.add_row(label, cols)
+    return ec
+
+
+def test_finds_the_only_cover():
+    ec = _knuth_example()
+    assert sorted(ec.first_solution()) == ["A", "D", "E"]
+    assert ec.count_solutions() == 1
+
+
+def test_counts_stop_at_the_limit():
+    ec = ExactCover(2)
+    for label, cols in [("ab", (0, 1)), ("a", (0,)), ("b", (1,))]:
+        ec.add_row(label, cols)
+    assert ec.count_solutions() == 2
+    assert ec.count_solutions(limit=1) == 1
+
+
+def test_aborted_search_restores_the_matrix():
+    ec = _knuth_example()
+    assert ec.first_solution(max_nodes=2) is None and ec.aborted
+    assert sorted(ec.first_solution()) == ["A", "D", "E"] and not ec.aborted
@@ -0,0 +1,99 @@
+import threading
+import time
+
+import pytest
+
+from executor import JobCancelled, SolverExecutor
+
+
+def _hold_only_slot(executor, seconds):
+    """Start a job that keeps the single slot busy; returns its thread."""
+    t = threading.Thread(target=executor.run, args=(time.sleep, seconds))
+    t.start()
+    time.sleep(0.2)  # let it take the slot
+    return t
+
+
+def test_run_without_timeout_waits_for_a_free_slot():
+    executor = SolverExecutor(max_workers=1)
+    busy = _hold_only_slot(executor, 0.5)
+    assert executor.run(pow, 2, 10) == 1024
+    busy.join()
+
+
+def test_imap_unordered_without_timeout_waits_for_a_free_slot():
+    executor = SolverExecutor(max_workers=1)
+    busy = _hold_only_slot(executor, 0.5)
+    results = sorted(executor.imap_unordered(pow, [(2, k) for k in range(4)]))
+    assert results == [(k, "ok", 2 ** k) for k in range(4)]
+    busy.join()
+
+
+def _report_workers(workers=None):
+    return workers
+
+
+def test_run_takes_only_the_free_extra_slots():
+    executor = SolverExecutor(max_workers=3)
+    busy = _hold_only_slot(executor, 0.5)
+    assert executor.run(_report_workers, slots=4, slots_arg="workers") == 2
+    busy.join()
+    assert executor.run(_report_workers, slots=4, slots_arg="workers") == 3
+    assert executor.stats()["active"] == 0
+
+
+def _sleep_then_return(seconds, value):
+    time.sleep(seconds)
+    return value
+
+
+def test_imap_stops_reading_ahead_behind_a_slow_item():
+    executor = SolverExecutor(max_workers=2)
+    read = []
+
+    def items():
+        for k in range(200):
+            read.append(k)
+            yield (1.0 if k == 0 else 0.0, k)
+
+    results = executor.imap(_sleep_then_return, items(), workers=2, window=4)
+    assert next(results) == (0, "ok", 0)
+    assert len(read) <= 5  # the window, plus the item read when the head finished
+    assert [value for _, _, value in results] == list(range(1, 200))
+
+
+def test_cancel_of_an_unknown_tag_is_forgotten():
+    executor = SolverExecutor(max_workers=1)
+    assert executor.cancel("finished-job") == 0
+    assert executor.run(pow, 2, 3, tag="finished-job") == 8
+    assert not executor._cancelled_tags
+
+
+def test_cancel_reaches_a_queued_job():
+    executor = SolverExecutor(max_workers=1)
+    busy = _hold_only_slot(executor, 0.5)
+    outcome = []
+
+    def queued():
+        try:
+            outcome.append(executor.run(pow, 2, 3, tag="queued"))
+        except JobCancelled:
+            outcome.append("cancelled")
+
+    t = threading.Thread(target=queued)
+    t.start()
+    time.sleep(0.1)  # let it queue behind the busy slot
+    assert executor.cancel("queued") == 0
+    t.join()
+    busy.join()
+    assert outcome == ["cancelled"]
+    assert not executor._cancelled_tags and not executor._queued
+
+
+def test_cancel_stops_a_running_job():
+    executor = SolverExecutor(max_workers=1)
+    timer = threading.Timer(0.3, lambda: executor.cancel("slow"))
+    timer.start()
+    with pytest.raises(JobCancelled):
+        executor.run(time.sleep, 10, tag="slow")
+    assert executor.stats()["cancelled"] == 1
@@ -0,0 +1,48 @@
+import time
+
+from instrument import Metrics, SearchStats, profiled
+
+
+def test_search_stats_prunes_and_phases():
+    stats = SearchStats()
+    stats.prune("row_conflict")
+    stats.prune("row_conflict", 2)
+    stats.prune("unused", 0)
+    with stats.phase("search"):
+        pass
+    data = stats.as_dict()
+    assert data["prunes"] == {"row_conflict": 3}
+    assert set(data["phases_ms"]) == {"search"} and data["phases_ms"]["search"] >= 0
+
+
+def test_metrics_histogram_is_cumulative():
+    metrics = Metrics(buckets=(0.1, 1.0))
+    metrics.observe("/solve_sudoku", "dlx", 0.05, nodes=10)
+    metrics.observe("/solve_sudoku", "dlx", 0.5, nodes=5)
+    metrics.observe("/solve_sudoku", "dlx", 5.0)
+    text = metrics.render()
+    labels = 'endpoint="/solve_sudoku",algorithm="dlx"'
+    assert f'solver_request_duration_seconds_bucket{{{labels},le="0.1"}} 1' in text
+    assert f'solver_request_duration_seconds_bucket{{{labels},le="1.0"}} 2' in text
+    assert f'solver_request_duration_seconds_bucket{{{labels},le="+Inf"}} 3' in text
+    assert f"solver_request_duration_seconds_count{{{labels}}} 3" in text
+    assert f"solver_nodes_total{{{labels}}} 15" in text
+
+
+def test_metrics_escape_labels_and_render_gauges():
+    metrics = Metrics()
+    metrics.observe("/solve", 'say "hi"\n', 0.01)
+    text = metrics.render({"solver_slots": [({}, 4)], "pool_size": [({"level": "easy"}, 2)]})
+    assert 'algorithm="say \\"hi\\"\\n"' in text
+    assert "solver_slots 4" in text and 'pool_size{level="easy"} 2' in text
+
+
+def test_profiled_returns_result_and_report():
+    def work():
+        end = time.perf_counter() + 0.05
+        while time.perf_counter() < end:
+            pass
+        return 42
+
+    result, report = profiled(work)
+    assert result == 42 and isinstance(report, dict)
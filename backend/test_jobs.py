@@ -0,0 +1,37 @@
+import threading
+
+from jobs import DONE, RUNNING, STOPPED, Job, JobRegistry
+
+
+def test_finish_lays_stats_over_progress_stats():
+    job = Job({})
+    job.set_progress([[[1, 2]]], {"nodes": 3, "max_depth": 1})
+    job.finish(DONE, stats={"nodes": 7})
+    snap = job.snapshot()
+    assert snap["status"] == DONE and snap["weeks"] == 1
+    assert snap["stats"] == {"nodes": 7, "max_depth": 1}
+
+
+def test_snapshot_of_a_running_job_shows_progress():
+    job = Job({})
+    job.set_progress([[[1]], [[2]]])
+    snap = job.snapshot()
+    assert snap["status"] == RUNNING and snap["weeks"] == 2 and snap["stats"] == {}
+
+
+def test_wait_for_update_wakes_on_progress():
+    job = Job({})
+    version = job.version
+    threading.Timer(0.05, job.set_progress, args=([],)).start()
+    assert job.wait_for_update(version, timeout=5) == version + 1
+    assert job.wait_for_update(job.version, timeout=0.01) == version + 1
+
+
+def test_registry_runs_target_and_expires_finished_jobs():
+    registry = JobRegistry(ttl_sec=0)
+    job = registry.submit({"n": 1}, lambda j: j.finish(STOPPED))
+    assert registry.get(job.id) is job
+    assert job.wait_for_update(0, timeout=5) == 1 and job.status == STOPPED
+    job.finished_at -= 1
+    other = registry.submit({}, lambda j: None)
+    assert registry.get(job.id) is None and registry.get(other.id) is other
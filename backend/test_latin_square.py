@@ -0,0 +1,46 @@
+import pytest
+
+from instrument import SearchStats
+from latin_square import latin_square_solver
+
+ALGORITHMS = ("Backtracking", "IDDFS", "DLX")
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_time_limit_stops_the_search(algorithm):
+    stats = SearchStats()
+    board = [[0] * 40 for _ in range(40)]
+    assert latin_square_solver(board, algorithm, None, stats, max_time_sec=0.0) is None
+    assert stats.prunes["time_limit"] == 1
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_time_limit_leaves_easy_boards_alone(algorithm):
+    stats = SearchStats()
+    assert latin_square_solver([[1, 0], [0, 0]], algorithm, None, stats, max_time_sec=5.0) == [[1, 2], [2, 1]]
+    assert "time_limit" not in stats.prunes
+
+
+def _is_latin(square, board):
+    n = len(board)
+    full = set(range(1, n + 1))
+    return (all(set(row) == full for row in square) and all(set(col) == full for col in zip(*square))
+            and all(g in (0, v) for grow, row in zip(board, square) for g, v in zip(grow, row)))
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_solves_a_partial_square(algorithm):
+    board = [[1, 0, 0, 4], [0, 0, 4, 0], [0, 4, 0, 0], [4, 0, 0, 1]]
+    solution = latin_square_solver(board, algorithm)
+    assert solution is not None and _is_latin(solution, board)
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+@pytest.mark.parametrize("board", [
+    [[1, 1], [0, 0]],  # clashing givens
+    [[0, 0], [0, 3]],  # value outside 1..n
+])
+def test_bad_givens_have_no_solution(algorithm, board):
+    stats = SearchStats()
+    assert latin_square_solver(board, algorithm, None, stats) is None
+    assert stats.prunes == {"given_conflict": 1}
@@ -0,0 +1,28 @@
+import time
+
+from puzzle_pool import PuzzlePool
+from sudoku import SudokuSolver
+
+
+def test_empty_pool_generates_inline():
+    pool = PuzzlePool(size=0)
+    puzzle, from_pool = pool.get("medium", unique=True)
+    assert not from_pool and len(puzzle) == 9 and all(len(row) == 9 for row in puzzle)
+    assert SudokuSolver(puzzle).count_solutions() == 1
+    stats = pool.stats()
+    assert (stats["hits"], stats["misses"], stats["total_generated"]) == (0, 1, 0)
+
+
+def test_workers_refill_and_serve_from_the_pool():
+    pool = PuzzlePool(size=1, workers=1)
+    pool.start()
+    try:
+        deadline = time.monotonic() + 30
+        while pool.stats()["depth"]["easy/any"] == 0:
+            assert time.monotonic() < deadline, "pool never refilled"
+            time.sleep(0.01)
+        _, from_pool = pool.get("easy", unique=False)
+        assert from_pool
+        assert pool.stats()["hits"] == 1 and pool.stats()["total_generated"] >= 1
+    finally:
+        pool.stop()
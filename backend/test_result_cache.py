@@ -0,0 +1,56 @@
+import result_cache
+from result_cache import MISS, ResultCache
+
+
+def test_lru_evicts_the_least_recently_used():
+    cache = ResultCache(max_entries=2)
+    cache.put("sudoku", "a", 1)
+    cache.put("sudoku", "b", 2)
+    assert cache.get("sudoku", "a") == 1
+    cache.put("sudoku", "c", 3)
+    assert cache.get("sudoku", "b") is MISS
+    assert (cache.get("sudoku", "a"), cache.get("sudoku", "c")) == (1, 3)
+    assert cache.stats()["namespaces"]["sudoku"] == {"hits": 3, "misses": 1}
+
+
+def test_namespaces_do_not_share_keys():
+    cache = ResultCache()
+    cache.put("sudoku", "k", "s")
+    assert cache.get("latin", "k") is MISS
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(result_cache.time, "time", lambda: now[0])
+    cache = ResultCache(ttl_sec=10)
+    cache.put("latin", "k", [1])
+    now[0] += 10
+    assert cache.get("latin", "k") == [1]
+    now[0] += 1
+    assert cache.get("latin", "k") is MISS
+    assert cache.stats()["entries"] == 0
+
+
+def test_sqlite_backing_survives_a_restart(tmp_path):
+    path = str(tmp_path / "cache.db")
+    ResultCache(path=path).put("golfers", "k", {"weeks": 5})
+    reopened = ResultCache(path=path)
+    assert reopened.stats()["entries"] == 0
+    assert reopened.get("golfers", "k") == {"weeks": 5}
+    assert reopened.stats()["entries"] == 1
+
+
+def test_sqlite_keeps_at_most_max_disk_entries(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = ResultCache(max_entries=0, path=path, max_disk_entries=2)
+    for key in "abc":
+        cache.put("sudoku", key, key)
+    assert cache.get("sudoku", "a") is MISS
+    assert cache.get("sudoku", "c") == "c"
+
+
+def test_clear_drops_memory_and_disk(tmp_path):
+    cache = ResultCache(path=str(tmp_path / "cache.db"))
+    cache.put("sudoku", "k", 1)
+    cache.clear()
+    assert cache.get("sudoku", "k") is MISS
@@ -0,0 +1,38 @@
+import threading
+
+import pytest
+
+from board import Board
+from seed_bank import BANK_MAGIC, LEVELS, SeedBank
+from sudoku import SudokuSolver
+
+
+def test_concurrent_first_use_builds_once(tmp_path):
+    bank = SeedBank(str(tmp_path / "bank.bin"), per_level=1)
+    builds = []
+    build = bank._build_locked
+    bank._build_locked = lambda *a: builds.append(1) or build(*a)
+
+    threads = [threading.Thread(target=bank.derive, args=("easy",)) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(builds) == 1
+    assert SeedBank(str(tmp_path / "bank.bin"))._read().keys() == set(LEVELS)
+
+
+def test_derived_puzzle_is_unique_and_keeps_its_clues(tmp_path):
+    bank = SeedBank(str(tmp_path / "bank.bin"), per_level=1)
+    bank.build()
+    [entry] = bank._loaded()["medium"]
+    puzzle = bank.derive("medium")
+    assert Board.from_rows(puzzle).count_filled() == Board(9, entry).count_filled()
+    assert SudokuSolver(puzzle).count_solutions(limit=2) == 1
+
+
+def test_unknown_level_byte_is_rejected(tmp_path):
+    path = tmp_path / "bank.bin"
+    path.write_bytes(BANK_MAGIC + bytes((len(LEVELS),)) + bytes(41))
+    with pytest.raises(ValueError, match="unknown level"):
+        SeedBank(str(path)).derive("easy")
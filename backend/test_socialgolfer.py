@@ -0,0 +1,59 @@
+import itertools
+
+import pytest
+
+from socialgolfer import LOCAL_SEARCH, SearchState, find_max_weeks, get_search_stats
+
+DFS = "Depth-First Search (DFS)"
+
+
+def _assert_valid(schedule, num_players, group_size):
+    met = set()
+    for week in schedule:
+        assert sorted(p for g in week for p in g) == list(range(1, num_players + 1))
+        assert all(len(g) == group_size for g in week)
+        for g in week:
+            for pair in itertools.combinations(sorted(g), 2):
+                assert pair not in met
+                met.add(pair)
+
+
+@pytest.mark.parametrize("num_players, group_size, weeks, symmetry_breaking", [
+    (9, 3, 4, False),
+    (12, 3, 4, True),
+    (12, 4, 1, False),
+    (12, 4, 1, True),
+])
+def test_dfs_finds_the_maximum(num_players, group_size, weeks, symmetry_breaking):
+    state = SearchState()
+    schedule, found = find_max_weeks(num_players, group_size, DFS, None, state=state,
+                                     symmetry_breaking=symmetry_breaking, use_constructions=False)
+    assert found == weeks
+    _assert_valid(schedule, num_players, group_size)
+    assert get_search_stats(state)["max_depth"] == weeks
+
+
+def test_construction_answers_without_search():
+    state = SearchState()
+    schedule, found = find_max_weeks(16, 4, DFS, None, state=state)
+    assert found == 5
+    _assert_valid(schedule, 16, 4)
+    stats = get_search_stats(state)
+    assert stats["construction"] and stats["nodes"] == 0 and "construction" in stats["phases_ms"]
+
+
+def test_local_search_reports_common_stats():
+    state = SearchState()
+    schedule, found = find_max_weeks(16, 4, LOCAL_SEARCH, 5, state=state, seed=1, time_limit=5.0,
+                                     use_constructions=False)
+    _assert_valid(schedule, 16, 4)
+    stats = get_search_stats(state)
+    assert stats["max_depth"] == found and stats["nodes"] == stats["local_search_iterations"]
+    assert "search" in stats["phases_ms"]
+
+
+def test_portfolio_matches_the_single_search():
+    schedule, found = find_max_weeks(12, 3, DFS, None, state=SearchState(), symmetry_breaking=True,
+                                     workers=2, use_constructions=False)
+    assert found == 4
+    _assert_valid(schedule, 12, 3)
@@ -0,0 +1,94 @@
+import random
+
+import pytest
+
+from board import Board
+from sudoku import (SudokuGenerator, SudokuSolver, apply_transform, canonical_form, grid_from_line,
+                    invert_transform, shuffle_board)
+
+EASY = "530070000600195000098000060800060003400803001700020006060000280000419005000080079"
+HARD = "800000000003600000070090200050007000000045700000100030001000068008500010090000400"
+
+
+def _is_solution(grid, puzzle):
+    rows = [set(row) for row in grid]
+    cols = [set(col) for col in zip(*grid)]
+    boxes = [{grid[r][c] for r in range(b // 3 * 3, b // 3 * 3 + 3) for c in range(b % 3 * 3, b % 3 * 3 + 3)}
+             for b in range(9)]
+    full = set(range(1, 10))
+    keeps_givens = all(g in (0, v) for grow, row in zip(puzzle, grid) for g, v in zip(grow, row))
+    return keeps_givens and all(unit == full for unit in rows + cols + boxes)
+
+
+def test_bfs_within_budget_stays_plain_bfs():
+    puzzle = grid_from_line(EASY)
+    ok, solution, stats = SudokuSolver(puzzle).solve_bfs_backtracking()
+    assert ok and _is_solution(solution, puzzle)
+    assert stats["frontier_mode"] == "bfs" and stats["prunes"].get("frontier_budget", 0) == 0
+
+
+@pytest.mark.parametrize("degrade", ["best-first", "beam"])
+def test_bfs_degrades_instead_of_outgrowing_its_budget(degrade):
+    puzzle = grid_from_line(HARD)
+    budget_mb = 0.05
+    ok, solution, stats = SudokuSolver(puzzle).solve_bfs_backtracking(
+        max_time_sec=30, frontier_budget_mb=budget_mb, degrade=degrade)
+    assert stats["frontier_mode"] == degrade
+    # The budget is checked after each expansion, so it can be passed by one node's children.
+    entry_bytes = stats["frontier_peak_bytes"] / stats["frontier_peak"]
+    assert stats["frontier_peak_bytes"] <= budget_mb * 1024 * 1024 + 9 * entry_bytes
+    if ok:
+        assert _is_solution(solution, puzzle)
+
+
+def test_bfs_rejects_unknown_degrade_mode():
+    with pytest.raises(ValueError):
+        SudokuSolver(grid_from_line(EASY)).solve_bfs_backtracking(degrade="drop-all")
+
+
+@pytest.mark.parametrize("method", ["solve_dlx", "solve_propagation"])
+def test_exact_solvers_agree_on_a_hard_puzzle(method):
+    puzzle = grid_from_line(HARD)
+    ok, solution, stats = getattr(SudokuSolver(puzzle), method)(max_time_sec=30)
+    assert ok and _is_solution(solution, puzzle)
+    assert stats["node_count"] > 0 and not stats["timed_out"]
+
+
+def test_dlx_reports_a_contradiction():
+    puzzle = grid_from_line("11" + "0" * 79)
+    ok, solution, stats = SudokuSolver(puzzle).solve_dlx()
+    assert not ok and solution is None and not stats["timed_out"]
+
+
+def test_count_solutions_stops_at_the_limit():
+    assert SudokuSolver(grid_from_line(EASY)).count_solutions() == 1
+    assert SudokuSolver(grid_from_line("0" * 81)).count_solutions(limit=3) == 3
+    assert SudokuSolver(grid_from_line("11" + "0" * 79)).count_solutions() == 0
+
+
+@pytest.mark.parametrize("level, target_clues", [("easy", 40), ("medium", 32), ("hard", 26)])
+def test_generated_unique_puzzles_have_one_solution(level, target_clues):
+    random.seed(level)
+    puzzle = SudokuGenerator().generate_sudoku(level, ensure_unique=True)
+    assert SudokuSolver(puzzle).count_solutions() == 1
+    assert sum(v != 0 for row in puzzle for v in row) >= target_clues
+    ok, solution, _ = SudokuSolver(puzzle).solve_propagation()
+    assert ok and _is_solution(solution, puzzle)
+
+
+def test_shuffled_puzzles_share_a_canonical_form():
+    random.seed(7)
+    puzzle = grid_from_line(HARD)
+    shuffled = shuffle_board(Board.from_rows(puzzle)).to_rows()
+    assert shuffled != puzzle
+    assert canonical_form(shuffled)[0] == canonical_form(puzzle)[0]
+
+
+def test_transform_maps_solutions_both_ways():
+    puzzle = grid_from_line(EASY)
+    canonical, transform = canonical_form(puzzle)
+    assert apply_transform(puzzle, transform) == canonical
+    ok, solution, _ = SudokuSolver(canonical).solve_dlx()
+    assert ok
+    original = invert_transform(solution, transform)
+    assert _is_solution(original, puzzle) and apply_transform(original, transform) == solution
@@ -0,0 +1,38 @@
+import pytest
+
+import sudoku_batch
+from sudoku_batch import INVALID, SOLVED, UNSOLVABLE, as_cells, solve_batch, validate_batch
+
+EASY = "530070000600195000098000060800060003400803001700020006060000280000419005000080079"
+HARD = "800000000003600000070090200050007000000045700000100030001000068008500010090000400"
+CLASH = "11" + "0" * 79
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    """Run each test with NumPy (when installed) and with the board-by-board fallback."""
+    if request.param == "numpy" and not sudoku_batch.HAVE_NUMPY:
+        pytest.skip("numpy is not installed")
+    if request.param == "python":
+        monkeypatch.setattr(sudoku_batch, "HAVE_NUMPY", False)
+        monkeypatch.setattr(sudoku_batch, "np", None)
+    return request.param
+
+
+def test_as_cells_flattens_lines_and_grids(backend):
+    grid = [[int(ch) for ch in EASY[r * 9:r * 9 + 9]] for r in range(9)]
+    cells = as_cells([EASY, grid])
+    assert [list(row) for row in cells] == [[int(ch) for ch in EASY]] * 2
+
+
+def test_solve_batch_statuses(backend):
+    solutions, statuses, stats = solve_batch([EASY, HARD, CLASH, "not a sudoku"])
+    assert statuses == [SOLVED, SOLVED, UNSOLVABLE, INVALID]
+    assert validate_batch(solutions[:2], [EASY, HARD]) == [True, True]
+    assert stats["vectorized"] == (backend == "numpy")
+
+
+def test_validate_batch_checks_givens(backend):
+    [solution], _, _ = solve_batch([EASY])
+    assert validate_batch([solution, solution], [EASY, HARD]) == [True, False]
+    assert validate_batch([solution, "x"]) == [True, False]